@@ -1,9 +1,14 @@
 package app
 
 import (
+	"context"
+	"time"
+
 	"github.com/charmbracelet/bubbles/help"
 	"github.com/charmbracelet/bubbles/textinput"
 	tea "github.com/charmbracelet/bubbletea"
+	"github.com/kyleking/gh-repo-dashboard/internal/batch"
+	"github.com/kyleking/gh-repo-dashboard/internal/filters"
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
 )
 
@@ -35,14 +40,22 @@ type Model struct {
 
 	repoPaths []string
 	summaries map[string]models.RepoSummary
+	rows      map[string]repoRow
 
 	filteredPaths []string
+	filterCounts  map[models.FilterMode]int
+	filterIndex   filters.FilterIndex
+	filterGen     int
+	filtering     bool
 	cursor        int
 
 	activeFilters []models.ActiveFilter
 	activeSorts   []models.ActiveSort
 	searchText    string
 	searching     bool
+	searchSeq     int
+	searchDirty   bool
+	appliedSearch string
 	searchInput   textinput.Model
 
 	viewMode       ViewMode
@@ -52,15 +65,31 @@ type Model struct {
 	loading        bool
 	loadingCount   int
 	loadedCount    int
+	refreshPending bool
+	pendingPaths   map[string]struct{}
+	staleRows      map[string]struct{}
 
 	detailTab      DetailTab
 	detailCursor   int
 	branches       []models.BranchInfo
 	stashes        []models.StashDetail
 	worktrees      []models.WorktreeInfo
+	branchRows     []branchRow
+	worktreeRows   []worktreeRow
+	commitRows     []string
+	// fileChanges is the branch detail's file-changes line, built once per
+	// load; empty until a detail arrives.
+	fileChanges string
+	// defaultBranch is found once per branch list load rather than on every
+	// branch detail frame.
+	defaultBranch string
 
 	selectedBranch models.BranchInfo
 	branchDetail   models.BranchDetail
+	// branchDetailRepo and branchDetailAt record where and when branchDetail
+	// was loaded, so reopening the same branch can skip the reload.
+	branchDetailRepo string
+	branchDetailAt   time.Time
 
 	prs        []models.PRInfo
 	prCount    map[string]int
@@ -73,10 +102,19 @@ type Model struct {
 	batchRunning  bool
 	batchTask     string
 	batchResults  []BatchResult
+	batchRows     []string
 	batchProgress int
 	batchTotal    int
+	batchStream   <-chan batch.TaskResult
 
 	statusMessage string
+	breadcrumbs   *breadcrumbCache
+	filterModal   *filterModalCache
+
+	summaryJobs    int
+	summaryResults <-chan RepoSummaryLoadedMsg
+	cancelLoad     context.CancelFunc
+	prSem          semaphore
 
 	keys KeyMap
 	help help.Model
@@ -87,9 +125,9 @@ func New(scanPaths []string, maxDepth int) Model {
 	ti.Placeholder = "Search repos..."
 	ti.CharLimit = 100
 
-	filters := make([]models.ActiveFilter, 0, len(models.AllFilterModes()))
+	activeFilters := make([]models.ActiveFilter, 0, len(models.AllFilterModes()))
 	for _, mode := range models.AllFilterModes() {
-		filters = append(filters, models.NewActiveFilter(mode))
+		activeFilters = append(activeFilters, models.NewActiveFilter(mode))
 	}
 
 	sorts := make([]models.ActiveSort, 0, len(models.AllSortModes()))
@@ -105,19 +143,34 @@ func New(scanPaths []string, maxDepth int) Model {
 		scanPaths:     scanPaths,
 		maxDepth:      maxDepth,
 		summaries:     make(map[string]models.RepoSummary),
+		rows:          make(map[string]repoRow),
+		filterIndex:   make(filters.FilterIndex),
 		prCount:       make(map[string]int),
-		activeFilters: filters,
+		pendingPaths:  make(map[string]struct{}),
+		staleRows:     make(map[string]struct{}),
+		activeFilters: activeFilters,
 		activeSorts:   sorts,
 		searchInput:   ti,
 		viewMode:      ViewModeRepoList,
 		loading:       true,
+		breadcrumbs:   &breadcrumbCache{},
+		filterModal:   &filterModalCache{},
+		summaryJobs:   DefaultSummaryConcurrency,
+		prSem:         newSemaphore(DefaultPRConcurrency),
 		keys:          DefaultKeyMap(),
 		help:          help.New(),
 	}
 }
 
+// WithConcurrency limits how many repo summaries and GitHub requests load at once.
+func (m Model) WithConcurrency(summaries, prs int) Model {
+	m.summaryJobs = max(summaries, 1)
+	m.prSem = newSemaphore(prs)
+	return m
+}
+
 func (m Model) Init() tea.Cmd {
-	return discoverReposCmd(m.scanPaths, m.maxDepth)
+	return tea.Batch(discoverReposCmd(m.scanPaths, m.maxDepth), scheduleCacheSweep())
 }
 
 func (m Model) CurrentFilter() models.FilterMode {
@@ -268,6 +321,13 @@ func (m *Model) ResetSorts() {
 	}
 }
 
+// setSummary stores a summary and re-renders its cached row cells.
+func (m *Model) setSummary(path string, summary models.RepoSummary) {
+	m.summaries[path] = summary
+	m.filterIndex[path] = filters.MaskOf(summary)
+	m.rows[path] = newRepoRow(summary, m.prCount[path])
+}
+
 func (m Model) DirtyCount() int {
 	count := 0
 	for _, s := range m.summaries {
@@ -1,9 +1,15 @@
 package app
 
 import (
+	"fmt"
+	"strings"
 	"testing"
+	"unicode/utf8"
 
+	tea "github.com/charmbracelet/bubbletea"
+	"github.com/kyleking/gh-repo-dashboard/internal/batch"
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
+	"github.com/kyleking/gh-repo-dashboard/internal/ui/styles"
 )
 
 func TestNewModel(t *testing.T) {
@@ -330,3 +336,426 @@ func TestDetailTabConstants(t *testing.T) {
 		}
 	}
 }
+
+func TestWithConcurrency(t *testing.T) {
+	m := New(nil, 1)
+	if m.summaryJobs != DefaultSummaryConcurrency {
+		t.Errorf("expected summary limit %d, got %d", DefaultSummaryConcurrency, m.summaryJobs)
+	}
+	if cap(m.prSem) != DefaultPRConcurrency {
+		t.Errorf("expected PR limit %d, got %d", DefaultPRConcurrency, cap(m.prSem))
+	}
+
+	m = m.WithConcurrency(2, 0)
+	if m.summaryJobs != 2 {
+		t.Errorf("expected summary limit 2, got %d", m.summaryJobs)
+	}
+	if cap(m.prSem) != 1 {
+		t.Errorf("expected PR limit to clamp to 1, got %d", cap(m.prSem))
+	}
+}
+
+func TestRowCellsRefreshWithSummaryAndPRCount(t *testing.T) {
+	m := New(nil, 1)
+	m.setSummary("/repo", models.RepoSummary{Path: "/repo", Branch: "main", Staged: 2})
+
+	row, ok := m.rows["/repo"]
+	if !ok {
+		t.Fatal("expected row cells to be cached")
+	}
+	if !strings.HasPrefix(row.status, "+2") {
+		t.Errorf("expected status cell to start with +2, got %q", row.status)
+	}
+	if strings.TrimSpace(row.prCount) != "—" {
+		t.Errorf("expected empty PR count, got %q", row.prCount)
+	}
+
+	updated, cmd := m.Update(PRCountLoadedMsg{Path: "/repo", Count: 3})
+	m = updated.(Model)
+
+	if cmd == nil {
+		t.Fatal("PR count should schedule a batched row flush")
+	}
+	if strings.TrimSpace(m.rows["/repo"].prCount) != "—" {
+		t.Error("PR count cell should wait for the flush")
+	}
+
+	updated, _ = m.Update(TableRefreshMsg{})
+	m = updated.(Model)
+
+	if strings.TrimSpace(m.rows["/repo"].prCount) != "3" {
+		t.Errorf("expected PR count cell to refresh, got %q", m.rows["/repo"].prCount)
+	}
+}
+
+func TestDetailLoadedCachesRowCells(t *testing.T) {
+	m := New(nil, 1)
+	m.selectedRepo = "/repo"
+
+	updated, _ := m.Update(DetailLoadedMsg{
+		Path:      "/repo",
+		Branches:  []models.BranchInfo{{Name: "main", IsCurrent: true, Ahead: 1}},
+		Worktrees: []models.WorktreeInfo{{Path: "/work/feature", Branch: "feature", IsLocked: true}},
+	})
+	m = updated.(Model)
+
+	if m.defaultBranch != "main" {
+		t.Errorf("expected default branch main, got %q", m.defaultBranch)
+	}
+	if len(m.branchRows) != 1 || !strings.HasPrefix(m.branchRows[0].name, "* main") {
+		t.Errorf("expected cached branch row for main, got %+v", m.branchRows)
+	}
+	if len(m.worktreeRows) != 1 || !strings.HasPrefix(m.worktreeRows[0].path, "feature") || m.worktreeRows[0].status != "locked" {
+		t.Errorf("expected cached worktree row, got %+v", m.worktreeRows)
+	}
+}
+
+func TestBranchDetailLoadedCachesCommitRows(t *testing.T) {
+	m := New(nil, 1)
+	m.selectedRepo = "/repo"
+	m.height = 40
+
+	updated, _ := m.Update(BranchDetailLoadedMsg{
+		Path: "/repo",
+		Detail: models.BranchDetail{
+			Commits:  []models.CommitInfo{{ShortHash: "abc1234", Subject: "Fix parser", Author: "dev"}},
+			Unstaged: 2,
+		},
+	})
+	m = updated.(Model)
+
+	if m.fileChanges != "2 unstaged" {
+		t.Errorf("expected cached file changes, got %q", m.fileChanges)
+	}
+
+	if len(m.commitRows) != 1 || !strings.Contains(m.commitRows[0], "Fix parser") {
+		t.Fatalf("expected cached commit row, got %q", m.commitRows)
+	}
+	if !strings.Contains(m.renderBranchDetail(), m.commitRows[0]) {
+		t.Error("expected branch detail to render the cached commit row")
+	}
+}
+
+func TestPRLoadedDefersCountsToRefresh(t *testing.T) {
+	m := New(nil, 1)
+	m.setSummary("/repo", models.RepoSummary{Path: "/repo", Branch: "main"})
+
+	updated, cmd := m.Update(PRLoadedMsg{Path: "/repo", PRInfo: &models.PRInfo{Number: 7}})
+	m = updated.(Model)
+
+	if cmd == nil {
+		t.Fatal("PR load should schedule a coalesced refresh")
+	}
+	if m.filterCounts[models.FilterModeHasPR] != 0 {
+		t.Error("filter counts should wait for the refresh")
+	}
+
+	updated, _ = m.Update(TableRefreshMsg{})
+	m = updated.(Model)
+	if m.filterCounts[models.FilterModeHasPR] != 1 {
+		t.Errorf("expected one repo with a PR after refresh, got %d", m.filterCounts[models.FilterModeHasPR])
+	}
+}
+
+func TestBatchProgressRendersEachRowOnce(t *testing.T) {
+	m := New(nil, 1)
+	m.viewMode = ViewModeBatchProgress
+	m.batchRunning = true
+	m.batchTotal = 2
+	results := make(chan batch.TaskResult)
+	m.batchStream = results
+
+	updated, _ := m.Update(batch.TaskProgressMsg{
+		Result: batch.TaskResult{Path: "/src/alpha", Success: true, Message: "fetched"},
+		Source: results,
+	})
+	m = updated.(Model)
+
+	if m.batchProgress != 1 || len(m.batchRows) != 1 {
+		t.Fatalf("expected one result and row, got progress %d rows %d", m.batchProgress, len(m.batchRows))
+	}
+	if !strings.Contains(m.batchRows[0], "alpha") || !strings.Contains(m.batchRows[0], "fetched") {
+		t.Errorf("unexpected batch row %q", m.batchRows[0])
+	}
+	if !strings.Contains(m.renderBatchProgress(), m.batchRows[0]) {
+		t.Error("expected progress view to render the cached row")
+	}
+}
+
+func TestBackIgnoredWhileBatchRuns(t *testing.T) {
+	m := New(nil, 1)
+	m.viewMode = ViewModeBatchProgress
+	m.batchRunning = true
+
+	updated, _ := m.Update(tea.KeyMsg{Type: tea.KeyEsc})
+	m = updated.(Model)
+	if m.viewMode != ViewModeBatchProgress || !m.batchRunning {
+		t.Fatal("expected esc to be ignored while the batch runs")
+	}
+
+	m.batchRunning = false
+	updated, _ = m.Update(tea.KeyMsg{Type: tea.KeyEsc})
+	if updated.(Model).viewMode != ViewModeRepoList {
+		t.Error("expected esc to close the finished batch")
+	}
+}
+
+func TestReopeningSameBranchSkipsReload(t *testing.T) {
+	m := New(nil, 1)
+	m.selectedRepo = "/repo"
+	m.viewMode = ViewModeRepoDetail
+	m.detailTab = DetailTabBranches
+	m.branches = []models.BranchInfo{{Name: "main"}, {Name: "feature"}}
+
+	updated, _ := m.Update(BranchDetailLoadedMsg{
+		Path:   "/repo",
+		Detail: models.BranchDetail{Branch: models.BranchInfo{Name: "main"}},
+	})
+	m = updated.(Model)
+
+	updated, cmd := m.Update(tea.KeyMsg{Type: tea.KeyEnter})
+	m = updated.(Model)
+	if cmd != nil {
+		t.Error("expected reopening a freshly loaded branch to skip the reload")
+	}
+	if m.viewMode != ViewModeBranchDetail || m.branchDetail.Branch.Name != "main" {
+		t.Error("expected the loaded branch detail to be shown")
+	}
+
+	m.viewMode = ViewModeRepoDetail
+	m.detailCursor = 1
+	updated, cmd = m.Update(tea.KeyMsg{Type: tea.KeyEnter})
+	m = updated.(Model)
+	if cmd == nil || m.branchDetail.Branch.Name != "" {
+		t.Error("expected a different branch to clear and reload the detail")
+	}
+}
+
+func TestVisibleRange(t *testing.T) {
+	tests := []struct {
+		name          string
+		cursor        int
+		total         int
+		height        int
+		expectedStart int
+		expectedEnd   int
+	}{
+		{"fits entirely", 2, 5, 10, 0, 5},
+		{"unknown height renders all", 3, 50, 0, 0, 50},
+		{"cursor at top", 0, 100, 10, 0, 10},
+		{"cursor centered", 50, 100, 10, 45, 55},
+		{"cursor at bottom", 99, 100, 10, 90, 100},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			start, end := visibleRange(tt.cursor, tt.total, tt.height)
+			if start != tt.expectedStart || end != tt.expectedEnd {
+				t.Errorf("expected [%d, %d), got [%d, %d)", tt.expectedStart, tt.expectedEnd, start, end)
+			}
+		})
+	}
+}
+
+func TestBranchListRendersOnlyVisibleRows(t *testing.T) {
+	m := New(nil, 1)
+	m.height = 20
+	for i := 0; i < 200; i++ {
+		m.branches = append(m.branches, models.BranchInfo{Name: fmt.Sprintf("branch-%03d", i)})
+	}
+	m.detailCursor = 150
+
+	out := m.renderBranchList()
+	if lines := strings.Count(out, "\n"); lines != m.detailListHeight() {
+		t.Errorf("expected %d rows after header, got %d", m.detailListHeight(), lines)
+	}
+	if !strings.Contains(out, "branch-150") {
+		t.Error("expected selected branch to be rendered")
+	}
+	if strings.Contains(out, "branch-000") {
+		t.Error("expected off-screen branches to be skipped")
+	}
+}
+
+func TestBranchDetailCommitsFitTerminal(t *testing.T) {
+	m := New(nil, 1)
+	for i := 0; i < 10; i++ {
+		m.branchDetail.Commits = append(m.branchDetail.Commits, models.CommitInfo{ShortHash: fmt.Sprintf("c%03d", i)})
+	}
+
+	m.height = 40
+	if out := m.renderBranchDetail(); !strings.Contains(out, "c009") {
+		t.Error("expected all commits on a tall terminal")
+	}
+
+	m.height = 20
+	out := m.renderBranchDetail()
+	if !strings.Contains(out, "c000") || strings.Contains(out, "c009") {
+		t.Error("expected commits below the fold to be skipped")
+	}
+	if lines := strings.Count(out, "\n") + 1; lines > m.height {
+		t.Errorf("expected output to fit %d lines, got %d", m.height, lines)
+	}
+}
+
+func TestBreadcrumbsCacheTracksInputs(t *testing.T) {
+	m := New(nil, 1)
+	m.repoPaths = []string{"/a", "/b"}
+	m.filteredPaths = []string{"/a"}
+	m.loadingCount = 2
+
+	first := m.renderBreadcrumbs()
+	if !strings.Contains(first, "1/2 repos") || !strings.Contains(first, "Loading 0/2") {
+		t.Errorf("unexpected breadcrumbs: %q", first)
+	}
+	if got := m.renderBreadcrumbs(); got != first {
+		t.Errorf("expected cached breadcrumbs %q, got %q", first, got)
+	}
+
+	m.loadedCount = 1
+	if got := m.renderBreadcrumbs(); !strings.Contains(got, "Loading 1/2") {
+		t.Errorf("expected breadcrumbs to re-render after progress, got %q", got)
+	}
+}
+
+func TestFilterModalCacheTracksInputs(t *testing.T) {
+	m := New(nil, 1)
+
+	first := m.renderFilterModal()
+	if m.renderFilterModal() != first {
+		t.Error("expected unchanged filter modal to be reused")
+	}
+
+	m.CycleFilterState(models.FilterModeDirty)
+	toggled := m.renderFilterModal()
+	if toggled == first || !strings.Contains(toggled, "✓") {
+		t.Error("expected filter modal to re-render after toggling a filter")
+	}
+
+	m.filterCounts = map[models.FilterMode]int{models.FilterModeDirty: 42}
+	if !strings.Contains(m.renderFilterModal(), "42") {
+		t.Error("expected filter modal to re-render after counts change")
+	}
+}
+
+func TestSearchKeystrokesAreDebounced(t *testing.T) {
+	m := New(nil, 1)
+	m.repoPaths = []string{"/repos/alpha", "/repos/beta"}
+	for _, path := range m.repoPaths {
+		m.summaries[path] = models.RepoSummary{Path: path}
+	}
+	m.updateFilteredPaths()
+	m.searching = true
+	m.searchInput.Focus()
+
+	firstSeq := 0
+	for i, r := range "al" {
+		updated, _ := m.Update(tea.KeyMsg{Type: tea.KeyRunes, Runes: []rune{r}})
+		m = updated.(Model)
+		if i == 0 {
+			firstSeq = m.searchSeq
+		}
+	}
+
+	if len(m.filteredPaths) != 2 {
+		t.Fatalf("expected filtering to wait for the debounce, got %v", m.filteredPaths)
+	}
+
+	updated, _ := m.Update(SearchDebounceMsg{seq: firstSeq})
+	m = updated.(Model)
+	if len(m.filteredPaths) != 2 {
+		t.Fatalf("expected superseded debounce tick to be ignored, got %v", m.filteredPaths)
+	}
+
+	updated, _ = m.Update(SearchDebounceMsg{seq: m.searchSeq})
+	m = updated.(Model)
+	if len(m.filteredPaths) != 1 || m.filteredPaths[0] != "/repos/alpha" {
+		t.Errorf("expected search to apply after debounce, got %v", m.filteredPaths)
+	}
+}
+
+func TestExtendedSearchNarrowsCurrentResults(t *testing.T) {
+	m := New(nil, 1)
+	m.repoPaths = []string{"/repos/api-client", "/repos/web", "/repos/api-service"}
+	for _, path := range m.repoPaths {
+		m.summaries[path] = models.RepoSummary{Path: path}
+	}
+	m.searchText = "api"
+	m.updateFilteredPaths()
+
+	m.searchText = "api-s"
+	if !m.narrowSearch() {
+		t.Fatal("expected extended query to narrow the current results")
+	}
+	if len(m.filteredPaths) != 1 || m.filteredPaths[0] != "/repos/api-service" {
+		t.Errorf("unexpected narrowed results: %v", m.filteredPaths)
+	}
+
+	m.searchText = "ap"
+	if m.narrowSearch() {
+		t.Error("expected a shortened query to require a full recompute")
+	}
+}
+
+func TestBatchJobsReuseKnownVCSType(t *testing.T) {
+	m := New(nil, 1)
+	m.filteredPaths = []string{"/repos/jj", "/repos/pending"}
+	m.summaries["/repos/jj"] = models.RepoSummary{Path: "/repos/jj", VCSType: models.VCSTypeJJ}
+
+	jobs := m.batchJobs()
+	if len(jobs) != 2 {
+		t.Fatalf("expected 2 jobs, got %d", len(jobs))
+	}
+	if jobs[0].Ops == nil || jobs[0].Ops.VCSType() != models.VCSTypeJJ {
+		t.Errorf("expected jj operations from the loaded summary, got %v", jobs[0].Ops)
+	}
+	if jobs[1].Ops != nil {
+		t.Error("expected repos without a summary to detect their type when run")
+	}
+}
+
+func TestSortModalListsEnabledSortsFirst(t *testing.T) {
+	m := New(nil, 1)
+	m.ResetSorts()
+	last := m.activeSorts[len(m.activeSorts)-1].Mode
+	m.CycleSortState(last)
+
+	out := m.renderSortModal()
+	enabled := strings.Index(out, m.activeSorts[len(m.activeSorts)-1].DisplayName())
+	disabled := strings.Index(out, models.SortModeModified.String())
+	if enabled < 0 || disabled < 0 || enabled > disabled {
+		t.Errorf("expected enabled sort %v listed before disabled ones:\n%s", last, out)
+	}
+}
+
+func TestRenderedTextMatchesStyle(t *testing.T) {
+	for _, text := range []string{"Actions", "Upstream:", "Actions"} {
+		if got, want := sectionTitles.Render(text), styles.SectionStyle.Render(text); got != want {
+			t.Errorf("Render(%q) = %q, want %q", text, got, want)
+		}
+	}
+}
+
+func TestTruncateKeepsRunesWhole(t *testing.T) {
+	tests := []struct {
+		in     string
+		maxLen int
+		want   string
+	}{
+		{"short", 10, "short"},
+		{"abcdefghij", 8, "abcde..."},
+		{"héllo wörld", 6, "hé..."},
+		{"日本語です", 8, "日..."},
+		{"日本語", 2, ""},
+	}
+
+	for _, tt := range tests {
+		got := truncate(tt.in, tt.maxLen)
+		if got != tt.want {
+			t.Errorf("truncate(%q, %d) = %q, want %q", tt.in, tt.maxLen, got, tt.want)
+		}
+		if !utf8.ValidString(got) {
+			t.Errorf("truncate(%q, %d) produced invalid UTF-8", tt.in, tt.maxLen)
+		}
+	}
+}
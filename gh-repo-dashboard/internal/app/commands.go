@@ -4,12 +4,31 @@ import (
 	"context"
 
 	tea "github.com/charmbracelet/bubbletea"
-	"github.com/kyleking/gh-repo-dashboard/internal/batch"
-	"github.com/kyleking/gh-repo-dashboard/internal/cache"
 	"github.com/kyleking/gh-repo-dashboard/internal/github"
 	"github.com/kyleking/gh-repo-dashboard/internal/vcs"
 )
 
+const (
+	DefaultSummaryConcurrency = 8
+	DefaultPRConcurrency      = 4
+)
+
+type semaphore chan struct{}
+
+func newSemaphore(n int) semaphore {
+	if n < 1 {
+		n = 1
+	}
+	return make(semaphore, n)
+}
+
+func (s semaphore) acquire() { s <- struct{}{} }
+
+func (s semaphore) release() { <-s }
+
+// loadRepoWithPRCmd loads a summary together with its branch PR and workflow
+// runs. It is not yet wired into Update, where loadPRCmd still reports no PR,
+// so the head-keyed PR cache behind it is unused until then.
 func loadRepoWithPRCmd(path string) tea.Cmd {
 	return func() tea.Msg {
 		ctx := context.Background()
@@ -24,14 +43,19 @@ func loadRepoWithPRCmd(path string) tea.Cmd {
 		}
 
 		if summary.Upstream != "" {
-			pr, _ := github.GetPRForBranch(ctx, path, summary.Branch, summary.Upstream)
-			summary.PRInfo = pr
+			pr, _ := github.GetPRForBranch(ctx, path, summary.Branch, summary.Upstream, summary.HeadSHA)
+			summary = summary.WithPRInfo(pr)
 
 			if pr != nil {
-				commits, _ := ops.GetCommitLog(ctx, path, 1)
-				if len(commits) > 0 {
-					workflow, _ := github.GetWorkflowRunsForCommit(ctx, path, commits[0].Hash)
-					summary.WorkflowInfo = workflow
+				headSHA := summary.HeadSHA
+				if headSHA == "" {
+					if commits, _ := ops.GetCommitLog(ctx, path, 1); len(commits) > 0 {
+						headSHA = commits[0].Hash
+					}
+				}
+				if headSHA != "" {
+					workflow, _ := github.GetWorkflowRunsForCommit(ctx, path, headSHA)
+					summary = summary.WithWorkflowInfo(workflow)
 				}
 			}
 		}
@@ -42,22 +66,3 @@ func loadRepoWithPRCmd(path string) tea.Cmd {
 		}
 	}
 }
-
-func refreshCmd(scanPaths []string, maxDepth int) tea.Cmd {
-	return func() tea.Msg {
-		cache.ClearAll()
-		return nil
-	}
-}
-
-func batchFetchAllCmd(paths []string) tea.Cmd {
-	return batch.RunTask("Fetch All", paths, batch.FetchAll)
-}
-
-func batchPruneRemoteCmd(paths []string) tea.Cmd {
-	return batch.RunTask("Prune Remote", paths, batch.PruneRemote)
-}
-
-func batchCleanupMergedCmd(paths []string) tea.Cmd {
-	return batch.RunTask("Cleanup Merged", paths, batch.CleanupMerged)
-}
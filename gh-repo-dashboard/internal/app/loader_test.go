@@ -0,0 +1,273 @@
+package app
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"strings"
+	"testing"
+	"time"
+
+	tea "github.com/charmbracelet/bubbletea"
+	"github.com/kyleking/gh-repo-dashboard/internal/cache"
+	"github.com/kyleking/gh-repo-dashboard/internal/models"
+	"github.com/kyleking/gh-repo-dashboard/internal/vcs"
+)
+
+func TestLoadRepoSummariesStreamsEveryPath(t *testing.T) {
+	paths := []string{t.TempDir(), t.TempDir(), t.TempDir()}
+
+	results := loadRepoSummaries(context.Background(), paths, 2)
+
+	seen := make(map[string]bool)
+	for msg := range results {
+		if seen[msg.Path] {
+			t.Errorf("path %s delivered twice", msg.Path)
+		}
+		seen[msg.Path] = true
+	}
+
+	if len(seen) != len(paths) {
+		t.Errorf("expected %d results, got %d", len(paths), len(seen))
+	}
+}
+
+func TestLoadRepoSummariesStopsOnCancel(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	results := loadRepoSummaries(ctx, []string{t.TempDir(), t.TempDir()}, 1)
+
+	done := make(chan struct{})
+	go func() {
+		for range results {
+		}
+		close(done)
+	}()
+
+	select {
+	case <-done:
+	case <-time.After(5 * time.Second):
+		t.Fatal("cancelled loader did not close its results channel")
+	}
+}
+
+func TestStaleRepoSummaryIgnored(t *testing.T) {
+	m := New(nil, 1)
+	m.loadingCount = 1
+	m.summaryResults = make(chan RepoSummaryLoadedMsg)
+
+	stale := RepoSummaryLoadedMsg{Path: "/old/repo", source: make(chan RepoSummaryLoadedMsg)}
+	updated, cmd := m.Update(stale)
+	m = updated.(Model)
+
+	if cmd != nil {
+		t.Error("stale summary should not schedule more work")
+	}
+	if m.loadedCount != 0 {
+		t.Errorf("stale summary should not count as loaded, got %d", m.loadedCount)
+	}
+	if _, ok := m.summaries["/old/repo"]; ok {
+		t.Error("stale summary should not be stored")
+	}
+}
+
+func TestSummaryArrivalsCoalesceTableRefresh(t *testing.T) {
+	m := New(nil, 1)
+	m.repoPaths = []string{"/a", "/b", "/c"}
+	m.loadingCount = 3
+	m.updateFilteredPaths()
+
+	updated, _ := m.Update(RepoSummaryLoadedMsg{Path: "/a", Summary: models.RepoSummary{Path: "/a"}})
+	m = updated.(Model)
+	if !m.refreshPending {
+		t.Fatal("first arrival should schedule a table refresh")
+	}
+	if _, ok := m.pendingPaths["/a"]; !ok {
+		t.Error("arrival should be queued until the timer fires")
+	}
+
+	updated, _ = m.Update(RepoSummaryLoadedMsg{Path: "/b", Summary: models.RepoSummary{Path: "/b"}})
+	m = updated.(Model)
+
+	updated, _ = m.Update(TableRefreshMsg{})
+	m = updated.(Model)
+	if m.refreshPending {
+		t.Error("refresh should clear the pending flag")
+	}
+	if len(m.filteredPaths) != 3 {
+		t.Errorf("expected 3 paths after refresh, got %d", len(m.filteredPaths))
+	}
+
+	updated, _ = m.Update(RepoSummaryLoadedMsg{Path: "/c", Summary: models.RepoSummary{Path: "/c"}})
+	m = updated.(Model)
+	if m.refreshPending {
+		t.Error("final arrival should refresh immediately")
+	}
+	if m.loading {
+		t.Error("loading should finish after the last summary")
+	}
+}
+
+func TestTableRefreshPlacesOnlyPendingPaths(t *testing.T) {
+	m := New(nil, 1)
+	m.repoPaths = []string{"/charlie", "/alice", "/bob"}
+	m.loadingCount = 4
+	m.summaries["/alice"] = models.RepoSummary{Path: "/alice"}
+	m.summaries["/charlie"] = models.RepoSummary{Path: "/charlie"}
+	m.filteredPaths = []string{"/alice", "/charlie"}
+
+	updated, _ := m.Update(RepoSummaryLoadedMsg{Path: "/bob", Summary: models.RepoSummary{Path: "/bob"}})
+	m = updated.(Model)
+	updated, _ = m.Update(TableRefreshMsg{})
+	m = updated.(Model)
+
+	expected := []string{"/alice", "/bob", "/charlie"}
+	if len(m.filteredPaths) != len(expected) {
+		t.Fatalf("expected %v, got %v", expected, m.filteredPaths)
+	}
+	for i, p := range expected {
+		if m.filteredPaths[i] != p {
+			t.Errorf("position %d: expected %s, got %s", i, p, m.filteredPaths[i])
+		}
+	}
+	if len(m.pendingPaths) != 0 {
+		t.Error("pending paths should be cleared after refresh")
+	}
+	if m.filterCounts[models.FilterModeAll] != 3 {
+		t.Errorf("expected filter counts to cover 3 repos, got %d", m.filterCounts[models.FilterModeAll])
+	}
+}
+
+func TestInitDefersDiscoveryToCommand(t *testing.T) {
+	m := New([]string{t.TempDir()}, 1)
+
+	batch, ok := m.Init()().(tea.BatchMsg)
+	if !ok || len(batch) == 0 {
+		t.Fatal("expected Init to return a batch starting with discovery")
+	}
+	if !strings.Contains(m.renderTable(), "Discovering repositories...") {
+		t.Error("expected first paint to show the discovery placeholder")
+	}
+
+	msg, ok := batch[0]().(ReposDiscoveredMsg)
+	if !ok {
+		t.Fatalf("expected ReposDiscoveredMsg, got %T", msg)
+	}
+	if len(msg.Paths) != 0 {
+		t.Errorf("expected no repos in empty dir, got %v", msg.Paths)
+	}
+}
+
+func TestLargeRepoSetFiltersOffUpdateLoop(t *testing.T) {
+	m := New(nil, 1)
+	for i := 0; i <= asyncFilterThreshold; i++ {
+		path := fmt.Sprintf("/repos/r%04d", i)
+		m.repoPaths = append(m.repoPaths, path)
+		m.summaries[path] = models.RepoSummary{Path: path, Unstaged: i % 2}
+	}
+	m.updateFilteredPaths()
+
+	cmd := m.requestFilteredPaths()
+	if cmd == nil {
+		t.Fatal("expected large repo set to filter in a command")
+	}
+	if !m.filtering {
+		t.Error("expected model to track the in-flight filter")
+	}
+
+	stale := m.requestFilteredPaths()().(FilteredPathsMsg)
+	result := cmd().(FilteredPathsMsg)
+
+	m.searchText = "r000"
+	m.searchInput.SetValue("r000")
+	fresh := m.requestFilteredPaths()
+
+	updated, _ := m.Update(result)
+	m = updated.(Model)
+	updated, _ = m.Update(stale)
+	m = updated.(Model)
+	if len(m.filteredPaths) != asyncFilterThreshold+1 {
+		t.Fatalf("expected superseded results to be ignored, got %d paths", len(m.filteredPaths))
+	}
+
+	updated, _ = m.Update(fresh())
+	m = updated.(Model)
+	if m.filtering {
+		t.Error("expected filtering to finish")
+	}
+	if len(m.filteredPaths) != 10 {
+		t.Errorf("expected 10 search matches, got %d", len(m.filteredPaths))
+	}
+}
+
+func TestFailedSummaryKeepsLoaderVCSType(t *testing.T) {
+	m := New(nil, 1)
+	m.loadingCount = 2
+
+	// The path does not exist, so re-detecting would wrongly report git.
+	msg := RepoSummaryLoadedMsg{
+		Path:    "/missing/jj-repo",
+		Summary: models.RepoSummary{VCSType: models.VCSTypeJJ},
+		Error:   errors.New("jj: failed"),
+	}
+	updated, _ := m.Update(msg)
+	m = updated.(Model)
+
+	summary := m.summaries["/missing/jj-repo"]
+	if summary.VCSType != models.VCSTypeJJ || summary.Error == nil {
+		t.Errorf("expected failed jj summary, got %+v", summary)
+	}
+}
+
+type commitLogCounter struct {
+	vcs.Operations
+	calls int
+}
+
+func (c *commitLogCounter) GetCommitLog(ctx context.Context, repoPath string, count int) ([]models.CommitInfo, error) {
+	c.calls++
+	return []models.CommitInfo{{Hash: "abc123"}}, nil
+}
+
+func TestRecentCommitsCachedByHead(t *testing.T) {
+	t.Cleanup(cache.ClearAll)
+	ops := &commitLogCounter{}
+
+	recentCommits(context.Background(), ops, "/repo", "sha1")
+	commits := recentCommits(context.Background(), ops, "/repo", "sha1")
+	if ops.calls != 1 || len(commits) != 1 {
+		t.Errorf("same head: got %d git log calls and %d commits", ops.calls, len(commits))
+	}
+
+	recentCommits(context.Background(), ops, "/repo", "sha2")
+	if ops.calls != 2 {
+		t.Errorf("new head should reload the log, got %d calls", ops.calls)
+	}
+
+	recentCommits(context.Background(), ops, "/repo", "")
+	recentCommits(context.Background(), ops, "/repo", "")
+	if ops.calls != 4 {
+		t.Errorf("unknown head should never be cached, got %d calls", ops.calls)
+	}
+}
+
+func TestCurrentUpstreamLooksUpCheckedOutBranch(t *testing.T) {
+	ops := &vcs.MockOperations{
+		GetCurrentBranchFn: func(ctx context.Context, repoPath string) (string, error) { return "feature", nil },
+		GetUpstreamFn: func(ctx context.Context, repoPath string, branch string) (string, error) {
+			if branch != "feature" {
+				t.Errorf("expected upstream lookup for feature, got %q", branch)
+			}
+			return "origin/feature", nil
+		},
+	}
+	if got := currentUpstream(context.Background(), ops, "/repo"); got != "origin/feature" {
+		t.Errorf("expected origin/feature, got %q", got)
+	}
+
+	ops.GetCurrentBranchFn = func(ctx context.Context, repoPath string) (string, error) { return "", errors.New("no HEAD") }
+	if got := currentUpstream(context.Background(), ops, "/repo"); got != "" {
+		t.Errorf("expected no upstream without a branch, got %q", got)
+	}
+}
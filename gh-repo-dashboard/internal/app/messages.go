@@ -10,6 +10,8 @@ type RepoSummaryLoadedMsg struct {
 	Path    string
 	Summary models.RepoSummary
 	Error   error
+
+	source <-chan RepoSummaryLoadedMsg
 }
 
 type PRLoadedMsg struct {
@@ -30,6 +32,22 @@ type ErrorMsg struct {
 
 type TickMsg struct{}
 
+type TableRefreshMsg struct{}
+
+type CacheSweepMsg struct{}
+
+type SearchDebounceMsg struct {
+	seq int
+}
+
+type FilteredPathsMsg struct {
+	Paths  []string
+	Counts map[models.FilterMode]int
+
+	generation int
+	searchText string
+}
+
 type WindowSizeMsg struct {
 	Width  int
 	Height int
@@ -225,7 +225,7 @@ func TestPrefetchCacheHit(t *testing.T) {
 	// This is more of an integration test concept
 	// The actual caching happens in github.GetPRDetail
 	// We're testing that prefetchPRDetailCmd doesn't send a message
-	cmd := prefetchPRDetailCmd("/test/repo", 123)
+	cmd := prefetchPRDetailCmd("/test/repo", 123, newSemaphore(1))
 
 	if cmd == nil {
 		t.Fatal("prefetch command should be created")
@@ -237,3 +237,26 @@ func TestPrefetchCacheHit(t *testing.T) {
 		t.Error("prefetch command should return nil message (silent background load)")
 	}
 }
+
+func TestPRDetailNavigationKeepsListCursorInSync(t *testing.T) {
+	m := New(nil, 1)
+	m.viewMode = ViewModePRDetail
+	m.selectedRepo = "/test/repo"
+	m.prs = []models.PRInfo{
+		{Number: 1, Title: "First PR"},
+		{Number: 2, Title: "Second PR"},
+		{Number: 3, Title: "Third PR"},
+	}
+	m.detailCursor = 1
+	m.selectedPR = m.prs[1]
+
+	updatedModel, _ := m.Update(tea.KeyMsg{Type: tea.KeyDown})
+	m = updatedModel.(Model)
+
+	if m.selectedPR.Number != 3 {
+		t.Errorf("should switch to PR #3, got #%d", m.selectedPR.Number)
+	}
+	if m.detailCursor != 2 {
+		t.Errorf("list cursor should follow the open PR, got %d", m.detailCursor)
+	}
+}
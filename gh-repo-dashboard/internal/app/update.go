@@ -3,8 +3,12 @@ package app
 import (
 	"context"
 	"fmt"
+	"maps"
 	"os/exec"
 	"runtime"
+	"slices"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/charmbracelet/bubbles/key"
@@ -58,57 +62,119 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 
 		m.updateFilteredPaths()
 
-		var cmds []tea.Cmd
-		for _, path := range msg.Paths {
-			cmds = append(cmds, loadRepoSummaryCmd(path))
+		if m.cancelLoad != nil {
+			m.cancelLoad()
 		}
-		return m, tea.Batch(cmds...)
+		ctx, cancel := context.WithCancel(context.Background())
+		m.cancelLoad = cancel
+		m.summaryResults = loadRepoSummaries(ctx, msg.Paths, m.summaryJobs)
+		return m, waitForRepoSummary(m.summaryResults)
 
 	case RepoSummaryLoadedMsg:
+		if msg.source != m.summaryResults {
+			return m, nil
+		}
 		m.loadedCount++
 
 		var cmds []tea.Cmd
+		if m.summaryResults != nil {
+			cmds = append(cmds, waitForRepoSummary(m.summaryResults))
+		}
 		if msg.Error != nil {
+			// The loader already knows the VCS type; detecting it again
+			// here would stat the filesystem on the update loop.
 			summary := models.RepoSummary{
 				Path:    msg.Path,
-				VCSType: vcs.DetectVCSType(msg.Path),
+				VCSType: msg.Summary.VCSType,
 				Error:   msg.Error,
 			}
-			m.summaries[msg.Path] = summary
+			m.setSummary(msg.Path, summary)
 		} else {
-			m.summaries[msg.Path] = msg.Summary
+			m.setSummary(msg.Path, msg.Summary)
 			cmds = append(cmds, loadPRCmd(msg.Path, msg.Summary.Branch, msg.Summary.Upstream))
-			cmds = append(cmds, loadPRCountCmd(msg.Path, msg.Summary.Upstream))
+			cmds = append(cmds, loadPRCountCmd(msg.Path, msg.Summary.Upstream, m.prSem))
 		}
 
+		m.pendingPaths[msg.Path] = struct{}{}
+
 		if m.loadedCount >= m.loadingCount {
 			m.loading = false
+			m.refreshPending = false
 			m.updateFilteredPaths()
+		} else if !m.refreshPending {
+			m.refreshPending = true
+			cmds = append(cmds, scheduleTableRefresh())
 		}
 
 		return m, tea.Batch(cmds...)
 
+	case TableRefreshMsg:
+		m.refreshPending = false
+		m.flushStaleRows()
+		if len(m.pendingPaths) > 0 && !m.filtering {
+			m.refreshPendingPaths()
+		}
+		return m, nil
+
+	case CacheSweepMsg:
+		return m, scheduleCacheSweep()
+
+	case SearchDebounceMsg:
+		if msg.seq != m.searchSeq {
+			return m, nil
+		}
+		return m, m.flushSearch()
+
+	case FilteredPathsMsg:
+		if msg.generation != m.filterGen {
+			return m, nil
+		}
+		m.filtering = false
+		m.filteredPaths = msg.Paths
+		m.filterCounts = msg.Counts
+		m.appliedSearch = msg.searchText
+		if len(m.pendingPaths) > 0 {
+			m.refreshPendingPaths()
+		}
+		m.clampCursor()
+		return m, nil
+
 	case PRLoadedMsg:
 		if summary, ok := m.summaries[msg.Path]; ok {
-			summary.PRInfo = msg.PRInfo
-			m.summaries[msg.Path] = summary
+			m.setSummary(msg.Path, summary.WithPRInfo(msg.PRInfo))
+			// Counts and placement are redone by the coalesced refresh rather
+			// than once per PR.
+			m.pendingPaths[msg.Path] = struct{}{}
+			if !m.refreshPending {
+				m.refreshPending = true
+				return m, scheduleTableRefresh()
+			}
 		}
 		return m, nil
 
 	case WorkflowLoadedMsg:
 		if summary, ok := m.summaries[msg.Path]; ok {
-			summary.WorkflowInfo = msg.Workflow
-			m.summaries[msg.Path] = summary
+			m.setSummary(msg.Path, summary.WithWorkflowInfo(msg.Workflow))
 		}
 		return m, nil
 
 	case DetailLoadedMsg:
 		if msg.Path == m.selectedRepo {
 			m.branches = msg.Branches
+			m.defaultBranch = findDefaultBranch(msg.Branches)
 			m.stashes = msg.Stashes
 			m.worktrees = msg.Worktrees
 			m.prs = msg.PRs
 
+			m.branchRows = make([]branchRow, len(msg.Branches))
+			for i, branch := range msg.Branches {
+				m.branchRows[i] = newBranchRow(branch)
+			}
+			m.worktreeRows = make([]worktreeRow, len(msg.Worktrees))
+			for i, wt := range msg.Worktrees {
+				m.worktreeRows[i] = newWorktreeRow(wt)
+			}
+
 			// Prefetch first few PR details in background
 			var cmds []tea.Cmd
 			prefetchCount := 3 // Prefetch first 3 PRs
@@ -116,7 +182,7 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 				prefetchCount = len(msg.PRs)
 			}
 			for i := 0; i < prefetchCount; i++ {
-				cmds = append(cmds, prefetchPRDetailCmd(msg.Path, msg.PRs[i].Number))
+				cmds = append(cmds, prefetchPRDetailCmd(msg.Path, msg.PRs[i].Number, m.prSem))
 			}
 			if len(cmds) > 0 {
 				return m, tea.Batch(cmds...)
@@ -127,6 +193,13 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 	case BranchDetailLoadedMsg:
 		if msg.Path == m.selectedRepo {
 			m.branchDetail = msg.Detail
+			m.branchDetailRepo = msg.Path
+			m.branchDetailAt = time.Now()
+			m.commitRows = make([]string, len(msg.Detail.Commits))
+			for i, commit := range msg.Detail.Commits {
+				m.commitRows[i] = newCommitRow(commit)
+			}
+			m.fileChanges = msg.Detail.FileChangesSummary()
 		}
 		return m, nil
 
@@ -153,6 +226,11 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 			m.prCount = make(map[string]int)
 		}
 		m.prCount[msg.Path] = msg.Count
+		m.staleRows[msg.Path] = struct{}{}
+		if !m.refreshPending {
+			m.refreshPending = true
+			return m, scheduleTableRefresh()
+		}
 		return m, nil
 
 	case PRCreatedMsg:
@@ -182,24 +260,18 @@ func (m Model) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 		return m, clearStatusAfterDelay()
 
 	case batch.TaskProgressMsg:
-		m.batchResults = append(m.batchResults, BatchResult{
-			Path:    msg.Result.Path,
-			Success: msg.Result.Success,
-			Message: msg.Result.Message,
-		})
-		m.batchProgress = len(m.batchResults)
-		return m, nil
+		if msg.Source != m.batchStream {
+			return m, nil
+		}
+		m.addBatchResult(msg.Result)
+		return m, batch.WaitForResult(m.batchTask, m.batchStream)
 
 	case batch.TaskCompleteMsg:
-		m.batchRunning = false
-		for _, r := range msg.Results {
-			m.batchResults = append(m.batchResults, BatchResult{
-				Path:    r.Path,
-				Success: r.Success,
-				Message: r.Message,
-			})
+		if msg.Source != m.batchStream {
+			return m, nil
 		}
-		m.batchProgress = len(m.batchResults)
+		m.batchRunning = false
+		m.batchStream = nil
 		return m, nil
 
 	case ErrorMsg:
@@ -250,7 +322,7 @@ func (m Model) handleKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 			m.viewMode = ViewModeRepoDetail
 			m.detailTab = DetailTabBranches
 			m.detailCursor = 0
-			return m, loadDetailCmd(m.selectedRepo)
+			return m, loadDetailCmd(m.selectedRepo, m.summaries[m.selectedRepo].Upstream, m.prSem)
 		}
 		return m, nil
 
@@ -288,13 +360,13 @@ func (m Model) handleKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 
 
 	case key.Matches(msg, m.keys.FetchAll):
-		return m.startBatchTask("Fetch All", batchFetchAllCmd)
+		return m.startBatchTask("Fetch All", batch.FetchAll)
 
 	case key.Matches(msg, m.keys.PruneRemote):
-		return m.startBatchTask("Prune Remote", batchPruneRemoteCmd)
+		return m.startBatchTask("Prune Remote", batch.PruneRemote)
 
 	case key.Matches(msg, m.keys.CleanupMerged):
-		return m.startBatchTask("Cleanup Merged", batchCleanupMergedCmd)
+		return m.startBatchTask("Cleanup Merged", batch.CleanupMerged)
 	}
 
 	return m, nil
@@ -318,7 +390,7 @@ func (m Model) handleDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 
 		// Prefetch first PR when switching to PR tab
 		if m.detailTab == DetailTabPRs && len(m.prs) > 0 {
-			return m, prefetchPRDetailCmd(m.selectedRepo, m.prs[0].Number)
+			return m, prefetchPRDetailCmd(m.selectedRepo, m.prs[0].Number, m.prSem)
 		}
 		return m, nil
 
@@ -332,7 +404,7 @@ func (m Model) handleDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 
 		// Prefetch first PR when switching to PR tab
 		if m.detailTab == DetailTabPRs && len(m.prs) > 0 {
-			return m, prefetchPRDetailCmd(m.selectedRepo, m.prs[0].Number)
+			return m, prefetchPRDetailCmd(m.selectedRepo, m.prs[0].Number, m.prSem)
 		}
 		return m, nil
 
@@ -342,7 +414,7 @@ func (m Model) handleDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 			// Prefetch PR detail for newly selected item
 			if m.detailTab == DetailTabPRs && m.detailCursor < len(m.prs) {
 				pr := m.prs[m.detailCursor]
-				return m, prefetchPRDetailCmd(m.selectedRepo, pr.Number)
+				return m, prefetchPRDetailCmd(m.selectedRepo, pr.Number, m.prSem)
 			}
 		}
 		return m, nil
@@ -354,7 +426,7 @@ func (m Model) handleDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 			// Prefetch PR detail for newly selected item
 			if m.detailTab == DetailTabPRs && m.detailCursor < len(m.prs) {
 				pr := m.prs[m.detailCursor]
-				return m, prefetchPRDetailCmd(m.selectedRepo, pr.Number)
+				return m, prefetchPRDetailCmd(m.selectedRepo, pr.Number, m.prSem)
 			}
 		}
 		return m, nil
@@ -373,9 +445,14 @@ func (m Model) handleDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 	case key.Matches(msg, m.keys.Enter):
 		if m.detailTab == DetailTabBranches && m.detailCursor < len(m.branches) {
 			m.selectedBranch = m.branches[m.detailCursor]
-			m.branchDetail = models.BranchDetail{} // Clear previous detail
 			m.viewMode = ViewModeBranchDetail
-			return m, loadBranchDetailCmd(m.selectedRepo, m.selectedBranch.Name)
+			if m.branchDetailIsFresh() {
+				return m, nil
+			}
+			m.branchDetail = models.BranchDetail{} // Clear previous detail
+			m.commitRows = nil
+			m.fileChanges = ""
+			return m, loadBranchDetailCmd(m.selectedRepo, m.selectedBranch)
 		} else if m.detailTab == DetailTabPRs && m.detailCursor < len(m.prs) {
 			m.selectedPR = m.prs[m.detailCursor]
 			// Progressive loading: Show basic info from list immediately
@@ -445,6 +522,9 @@ func (m Model) detailListLen() int {
 func (m Model) handleRefresh() (tea.Model, tea.Cmd) {
 	var cmds []tea.Cmd
 
+	// Cleared before any reload starts so converted repos are re-detected.
+	vcs.InvalidateVCSCache()
+
 	cmds = append(cmds, func() tea.Msg {
 		cache.ClearAll()
 		return RefreshCompleteMsg{ViewMode: m.viewMode}
@@ -455,37 +535,51 @@ func (m Model) handleRefresh() (tea.Model, tea.Cmd) {
 		// Clear all data including downstream views
 		m.loading = true
 		m.summaries = make(map[string]models.RepoSummary)
+		m.filterIndex = make(filters.FilterIndex)
+		m.rows = make(map[string]repoRow)
 		m.prCount = make(map[string]int)
 		m.branches = nil
+		m.defaultBranch = ""
 		m.stashes = nil
 		m.worktrees = nil
+		m.branchRows = nil
+		m.worktreeRows = nil
 		m.prs = nil
 		m.branchDetail = models.BranchDetail{}
+		m.commitRows = nil
+		m.fileChanges = ""
 		m.prDetail = models.PRDetail{}
 		cmds = append(cmds, discoverReposCmd(m.scanPaths, m.maxDepth))
 
 	case ViewModeRepoDetail:
 		// Clear detail views when refreshing repo detail
 		m.branches = nil
+		m.defaultBranch = ""
 		m.stashes = nil
 		m.worktrees = nil
+		m.branchRows = nil
+		m.worktreeRows = nil
 		m.prs = nil
 		m.branchDetail = models.BranchDetail{}
+		m.commitRows = nil
+		m.fileChanges = ""
 		m.prDetail = models.PRDetail{}
 
 		if m.selectedRepo != "" {
-			cmds = append(cmds, loadDetailCmd(m.selectedRepo))
+			cmds = append(cmds, loadDetailCmd(m.selectedRepo, m.summaries[m.selectedRepo].Upstream, m.prSem))
 			if summary, ok := m.summaries[m.selectedRepo]; ok && summary.Upstream != "" {
-				cmds = append(cmds, loadPRCountCmd(m.selectedRepo, summary.Upstream))
+				cmds = append(cmds, loadPRCountCmd(m.selectedRepo, summary.Upstream, m.prSem))
 			}
 		}
 
 	case ViewModeBranchDetail:
 		// Clear branch detail when refreshing
 		m.branchDetail = models.BranchDetail{}
+		m.commitRows = nil
+		m.fileChanges = ""
 
 		if m.selectedRepo != "" && m.selectedBranch.Name != "" {
-			cmds = append(cmds, loadBranchDetailCmd(m.selectedRepo, m.selectedBranch.Name))
+			cmds = append(cmds, reloadBranchDetailCmd(m.selectedRepo, m.selectedBranch.Name))
 		}
 
 	case ViewModePRDetail:
@@ -500,6 +594,20 @@ func (m Model) handleRefresh() (tea.Model, tea.Cmd) {
 	return m, tea.Batch(cmds...)
 }
 
+// selectedPRIndex locates the open PR in m.prs, checking the list cursor
+// before falling back to a scan.
+func (m Model) selectedPRIndex() int {
+	if m.detailCursor >= 0 && m.detailCursor < len(m.prs) && m.prs[m.detailCursor].Number == m.selectedPR.Number {
+		return m.detailCursor
+	}
+	for i, pr := range m.prs {
+		if pr.Number == m.selectedPR.Number {
+			return i
+		}
+	}
+	return -1
+}
+
 func (m Model) handlePRDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 	switch {
 	case key.Matches(msg, m.keys.Quit):
@@ -514,13 +622,7 @@ func (m Model) handlePRDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 
 	case key.Matches(msg, m.keys.Up), key.Matches(msg, m.keys.Down):
 		// Navigate to adjacent PR
-		currentIdx := -1
-		for i, pr := range m.prs {
-			if pr.Number == m.selectedPR.Number {
-				currentIdx = i
-				break
-			}
-		}
+		currentIdx := m.selectedPRIndex()
 
 		if currentIdx != -1 {
 			var newIdx int
@@ -533,6 +635,7 @@ func (m Model) handlePRDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 			}
 
 			// Switch to adjacent PR
+			m.detailCursor = newIdx
 			m.selectedPR = m.prs[newIdx]
 			m.prDetail = models.PRDetail{
 				PRInfo: m.selectedPR,
@@ -543,9 +646,9 @@ func (m Model) handlePRDetailKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 
 			// Prefetch next adjacent PR
 			if key.Matches(msg, m.keys.Down) && newIdx+1 < len(m.prs) {
-				cmds = append(cmds, prefetchPRDetailCmd(m.selectedRepo, m.prs[newIdx+1].Number))
+				cmds = append(cmds, prefetchPRDetailCmd(m.selectedRepo, m.prs[newIdx+1].Number, m.prSem))
 			} else if key.Matches(msg, m.keys.Up) && newIdx-1 >= 0 {
-				cmds = append(cmds, prefetchPRDetailCmd(m.selectedRepo, m.prs[newIdx-1].Number))
+				cmds = append(cmds, prefetchPRDetailCmd(m.selectedRepo, m.prs[newIdx-1].Number, m.prSem))
 			}
 
 			return m, tea.Batch(cmds...)
@@ -608,23 +711,23 @@ func (m Model) handleFilterKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 	case key.Matches(msg, m.keys.Enter):
 		selectedMode := modes[m.filterCursor]
 		m.CycleFilterState(selectedMode)
-		m.updateFilteredPaths()
+		cmd := m.requestFilteredPaths()
 		m.cursor = 0
-		return m, nil
+		return m, cmd
 
 	case msg.String() == "*":
 		m.ResetFilters()
-		m.updateFilteredPaths()
+		cmd := m.requestFilteredPaths()
 		m.cursor = 0
-		return m, nil
+		return m, cmd
 
 	default:
 		for _, mode := range modes {
 			if msg.String() == mode.ShortKey() {
 				m.CycleFilterState(mode)
-				m.updateFilteredPaths()
+				cmd := m.requestFilteredPaths()
 				m.cursor = 0
-				return m, nil
+				return m, cmd
 			}
 		}
 	}
@@ -658,30 +761,25 @@ func (m Model) handleSortKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 	case key.Matches(msg, m.keys.Enter):
 		selectedMode := modes[m.sortCursor]
 		m.CycleSortState(selectedMode)
-		m.updateFilteredPaths()
-		return m, nil
+		return m, m.requestFilteredPaths()
 
 	case msg.String() == "[":
 		m.MoveSortUp()
-		m.updateFilteredPaths()
-		return m, nil
+		return m, m.requestFilteredPaths()
 
 	case msg.String() == "]":
 		m.MoveSortDown()
-		m.updateFilteredPaths()
-		return m, nil
+		return m, m.requestFilteredPaths()
 
 	case msg.String() == "*":
 		m.ResetSorts()
-		m.updateFilteredPaths()
-		return m, nil
+		return m, m.requestFilteredPaths()
 
 	default:
 		for _, mode := range modes {
 			if msg.String() == mode.ShortKey() {
 				m.CycleSortState(mode)
-				m.updateFilteredPaths()
-				return m, nil
+				return m, m.requestFilteredPaths()
 			}
 		}
 	}
@@ -712,15 +810,14 @@ func (m Model) handleSearchKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 	case tea.KeyEsc:
 		m.searching = false
 		m.searchInput.Blur()
-		return m, nil
+		return m, m.flushSearch()
 
 	case tea.KeyEnter:
 		m.searching = false
 		m.searchText = m.searchInput.Value()
 		m.searchInput.Blur()
-		m.updateFilteredPaths()
-		m.cursor = 0
-		return m, nil
+		m.searchDirty = true
+		return m, m.flushSearch()
 
 	case tea.KeyCtrlC:
 		return m, tea.Quit
@@ -728,21 +825,141 @@ func (m Model) handleSearchKey(msg tea.KeyMsg) (tea.Model, tea.Cmd) {
 
 	var cmd tea.Cmd
 	m.searchInput, cmd = m.searchInput.Update(msg)
+	if m.searchInput.Value() == m.searchText {
+		return m, cmd
+	}
 	m.searchText = m.searchInput.Value()
-	m.updateFilteredPaths()
+	m.searchSeq++
+	m.searchDirty = true
+	return m, tea.Batch(cmd, scheduleSearchRefresh(m.searchSeq))
+}
+
+// flushSearch applies a pending search immediately and invalidates any
+// debounce tick still in flight.
+func (m *Model) flushSearch() tea.Cmd {
+	m.searchSeq++
+	if !m.searchDirty {
+		return nil
+	}
+	m.searchDirty = false
 	m.cursor = 0
-	return m, cmd
+	if m.narrowSearch() {
+		return nil
+	}
+	return m.requestFilteredPaths()
+}
+
+// narrowSearch re-filters only the current results when the query was
+// extended, reporting false when a full recompute is needed instead.
+func (m *Model) narrowSearch() bool {
+	if m.searchText == "" || m.filtering || len(m.pendingPaths) > 0 {
+		return false
+	}
+	if !strings.HasPrefix(strings.ToLower(m.searchText), strings.ToLower(m.appliedSearch)) {
+		return false
+	}
+
+	narrowed, ok := filters.NarrowSearch(m.filteredPaths, m.searchText)
+	if !ok {
+		return false
+	}
+
+	m.filterGen++
+	m.filteredPaths = narrowed
+	m.appliedSearch = m.searchText
+	m.clampCursor()
+	return true
 }
 
 func (m *Model) updateFilteredPaths() {
-	m.filteredPaths = filters.FilterAndSortMulti(
+	m.filterGen++
+	m.filtering = false
+	m.filteredPaths = filters.FilterAndSortIndexed(
 		m.repoPaths,
 		m.summaries,
+		m.filterIndex,
 		m.activeFilters,
 		m.activeSorts,
 		m.searchText,
 	)
+	m.appliedSearch = m.searchText
+	clear(m.pendingPaths)
+	m.filterCounts = filters.CountIndexed(m.summaries, m.filterIndex)
+
+	m.clampCursor()
+}
+
+const asyncFilterThreshold = 1000
+
+// requestFilteredPaths recomputes filteredPaths inline for typical repo sets.
+// Past asyncFilterThreshold the filter and sort run on a snapshot in a
+// command so keypresses stay responsive; the result arrives as a
+// FilteredPathsMsg and is dropped if a newer request superseded it.
+func (m *Model) requestFilteredPaths() tea.Cmd {
+	if len(m.summaries) <= asyncFilterThreshold {
+		m.updateFilteredPaths()
+		return nil
+	}
+
+	m.filterGen++
+	m.filtering = true
+	clear(m.pendingPaths)
 
+	generation := m.filterGen
+	paths := m.repoPaths
+	summaries := maps.Clone(m.summaries)
+	index := maps.Clone(m.filterIndex)
+	activeFilters := slices.Clone(m.activeFilters)
+	activeSorts := slices.Clone(m.activeSorts)
+	searchText := m.searchText
+
+	return func() tea.Msg {
+		return FilteredPathsMsg{
+			Paths:      filters.FilterAndSortIndexed(paths, summaries, index, activeFilters, activeSorts, searchText),
+			Counts:     filters.CountIndexed(summaries, index),
+			generation: generation,
+			searchText: searchText,
+		}
+	}
+}
+
+// flushStaleRows rebuilds the cached cells of repos whose PR counts arrived
+// since the last refresh tick.
+func (m *Model) flushStaleRows() {
+	for path := range m.staleRows {
+		if summary, ok := m.summaries[path]; ok {
+			m.rows[path] = newRepoRow(summary, m.prCount[path])
+		}
+	}
+	clear(m.staleRows)
+}
+
+const incrementalRefreshLimit = 16
+
+// refreshPendingPaths re-places only the repos whose summaries changed since
+// the last refresh. Search ranking depends on the whole candidate set, so an
+// active search or a large batch falls back to a full rebuild.
+func (m *Model) refreshPendingPaths() {
+	if m.searchText != "" || len(m.pendingPaths) > incrementalRefreshLimit {
+		m.updateFilteredPaths()
+		return
+	}
+
+	for path := range m.pendingPaths {
+		if i := slices.Index(m.filteredPaths, path); i >= 0 {
+			m.filteredPaths = slices.Delete(m.filteredPaths, i, i+1)
+		}
+		if filters.PassesFilters(m.summaries[path], m.activeFilters) {
+			m.filteredPaths = filters.InsertSorted(m.filteredPaths, path, m.summaries, m.activeSorts)
+		}
+	}
+	clear(m.pendingPaths)
+	m.filterCounts = filters.CountIndexed(m.summaries, m.filterIndex)
+
+	m.clampCursor()
+}
+
+func (m *Model) clampCursor() {
 	if m.cursor >= len(m.filteredPaths) {
 		if len(m.filteredPaths) > 0 {
 			m.cursor = len(m.filteredPaths) - 1
@@ -752,7 +969,22 @@ func (m *Model) updateFilteredPaths() {
 	}
 }
 
-func (m Model) startBatchTask(taskName string, taskCmd func([]string) tea.Cmd) (tea.Model, tea.Cmd) {
+// addBatchResult records a finished repo and renders its row once, so the
+// progress view only joins rows however many results have arrived.
+func (m *Model) addBatchResult(r batch.TaskResult) {
+	result := BatchResult{
+		Path:    r.Path,
+		Success: r.Success,
+		Message: r.Message,
+	}
+	m.batchResults = append(m.batchResults, result)
+	m.batchRows = append(m.batchRows, newBatchRow(result))
+	m.batchProgress = len(m.batchResults)
+}
+
+// startBatchTask streams results into the progress view as each repo
+// finishes rather than waiting for the slowest one.
+func (m Model) startBatchTask(taskName string, taskFn batch.TaskFunc) (tea.Model, tea.Cmd) {
 	if len(m.filteredPaths) == 0 {
 		return m, nil
 	}
@@ -761,10 +993,26 @@ func (m Model) startBatchTask(taskName string, taskCmd func([]string) tea.Cmd) (
 	m.batchRunning = true
 	m.batchTask = taskName
 	m.batchResults = nil
+	m.batchRows = nil
 	m.batchProgress = 0
 	m.batchTotal = len(m.filteredPaths)
 
-	return m, taskCmd(m.filteredPaths)
+	m.batchStream = batch.StreamJobs(context.Background(), m.batchJobs(), taskFn)
+
+	return m, batch.WaitForResult(taskName, m.batchStream)
+}
+
+// batchJobs resolves VCS operations from the already loaded summaries, so
+// batch tasks only detect the repo type for repos still loading.
+func (m Model) batchJobs() []batch.Job {
+	jobs := make([]batch.Job, len(m.filteredPaths))
+	for i, path := range m.filteredPaths {
+		jobs[i] = batch.Job{Path: path}
+		if summary, ok := m.summaries[path]; ok {
+			jobs[i].Ops = vcs.OperationsFor(summary.VCSType)
+		}
+	}
+	return jobs
 }
 
 func discoverReposCmd(scanPaths []string, maxDepth int) tea.Cmd {
@@ -774,15 +1022,56 @@ func discoverReposCmd(scanPaths []string, maxDepth int) tea.Cmd {
 	}
 }
 
-func loadRepoSummaryCmd(path string) tea.Cmd {
+// loadRepoSummaries loads every path on a fixed pool of workers and streams
+// each result back so the table fills in progressively.
+func loadRepoSummaries(ctx context.Context, paths []string, workers int) <-chan RepoSummaryLoadedMsg {
+	results := make(chan RepoSummaryLoadedMsg, workers)
+	jobs := make(chan string)
+
+	var wg sync.WaitGroup
+	for i := 0; i < min(workers, len(paths)); i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for path := range jobs {
+				ops := vcs.GetOperations(path)
+				summary, err := ops.GetRepoSummary(ctx, path)
+				if err != nil {
+					summary.VCSType = ops.VCSType()
+				}
+				select {
+				case results <- RepoSummaryLoadedMsg{Path: path, Summary: summary, Error: err, source: results}:
+				case <-ctx.Done():
+					return
+				}
+			}
+		}()
+	}
+
+	go func() {
+		defer close(results)
+	feed:
+		for _, path := range paths {
+			select {
+			case jobs <- path:
+			case <-ctx.Done():
+				break feed
+			}
+		}
+		close(jobs)
+		wg.Wait()
+	}()
+
+	return results
+}
+
+func waitForRepoSummary(results <-chan RepoSummaryLoadedMsg) tea.Cmd {
 	return func() tea.Msg {
-		ops := vcs.GetOperations(path)
-		summary, err := ops.GetRepoSummary(context.Background(), path)
-		return RepoSummaryLoadedMsg{
-			Path:    path,
-			Summary: summary,
-			Error:   err,
+		msg, ok := <-results
+		if !ok {
+			return nil
 		}
+		return msg
 	}
 }
 
@@ -795,38 +1084,83 @@ func loadPRCmd(path string, branch string, upstream string) tea.Cmd {
 	}
 }
 
-func loadDetailCmd(path string) tea.Cmd {
+// loadDetailCmd reads every repo detail tab at once and delivers them in a
+// single message, so the view fills in one update instead of tab by tab. The
+// upstream comes from the already loaded summary when it has one; otherwise
+// (summary still loading, failed, or without upstream) it is looked up here.
+// The PR list goes through sem like every other gh call.
+func loadDetailCmd(path string, upstream string, sem semaphore) tea.Cmd {
 	return func() tea.Msg {
 		ctx := context.Background()
 		ops := vcs.GetOperations(path)
+		msg := DetailLoadedMsg{Path: path}
+
+		var wg sync.WaitGroup
+		wg.Add(3)
+		go func() {
+			defer wg.Done()
+			msg.Stashes, _ = ops.GetStashList(ctx, path)
+		}()
+		go func() {
+			defer wg.Done()
+			msg.Worktrees, _ = ops.GetWorktreeList(ctx, path)
+		}()
+		go func() {
+			defer wg.Done()
+			upstream := upstream
+			if upstream == "" {
+				upstream = currentUpstream(ctx, ops, path)
+			}
+			if upstream != "" {
+				sem.acquire()
+				defer sem.release()
+				msg.PRs, _ = github.GetPRsForRepo(ctx, path, upstream)
+			}
+		}()
 
-		branches, _ := ops.GetBranchList(ctx, path)
-		stashes, _ := ops.GetStashList(ctx, path)
-		worktrees, _ := ops.GetWorktreeList(ctx, path)
+		msg.Branches, _ = ops.GetBranchList(ctx, path)
+		wg.Wait()
+		return msg
+	}
+}
 
-		summary, _ := ops.GetRepoSummary(ctx, path)
-		var prs []models.PRInfo
-		if summary.Upstream != "" {
-			prs, _ = github.GetPRsForRepo(ctx, path, summary.Upstream)
-		}
+// branchDetailReuse is how long a loaded branch detail is shown again without
+// reloading when the same branch is reopened.
+const branchDetailReuse = 5 * time.Second
 
-		return DetailLoadedMsg{
-			Path:      path,
-			Branches:  branches,
-			Stashes:   stashes,
-			Worktrees: worktrees,
-			PRs:       prs,
+// branchDetailIsFresh reports whether the loaded branch detail is for the
+// selected repo and branch and recent enough to reopen as is.
+func (m Model) branchDetailIsFresh() bool {
+	return m.branchDetailRepo == m.selectedRepo &&
+		m.branchDetail.Branch.Name == m.selectedBranch.Name &&
+		time.Since(m.branchDetailAt) < branchDetailReuse
+}
+
+// branchDetailCommits is how many recent commits the branch detail view
+// shows; git log is asked for no more than that.
+const branchDetailCommits = 10
+
+// loadBranchDetailCmd opens the detail view for a branch already listed in
+// the repo detail view, so the branch list is not read again.
+func loadBranchDetailCmd(repoPath string, branch models.BranchInfo) tea.Cmd {
+	return func() tea.Msg {
+		ctx := context.Background()
+		return BranchDetailLoadedMsg{
+			Path:   repoPath,
+			Detail: branchDetail(ctx, vcs.GetOperations(repoPath), repoPath, branch),
 		}
 	}
 }
 
-func loadBranchDetailCmd(repoPath string, branchName string) tea.Cmd {
+// reloadBranchDetailCmd re-reads the branch itself, for refreshes where its
+// ahead/behind counts may have changed.
+func reloadBranchDetailCmd(repoPath string, branchName string) tea.Cmd {
 	return func() tea.Msg {
 		ctx := context.Background()
 		ops := vcs.GetOperations(repoPath)
 
 		branches, _ := ops.GetBranchList(ctx, repoPath)
-		var selectedBranch models.BranchInfo
+		selectedBranch := models.BranchInfo{Name: branchName}
 		for _, b := range branches {
 			if b.Name == branchName {
 				selectedBranch = b
@@ -834,36 +1168,67 @@ func loadBranchDetailCmd(repoPath string, branchName string) tea.Cmd {
 			}
 		}
 
-		commits, _ := ops.GetCommitLog(ctx, repoPath, 20)
+		return BranchDetailLoadedMsg{
+			Path:   repoPath,
+			Detail: branchDetail(ctx, ops, repoPath, selectedBranch),
+		}
+	}
+}
 
-		summary, _ := ops.GetRepoSummary(ctx, repoPath)
+func branchDetail(ctx context.Context, ops vcs.Operations, repoPath string, branch models.BranchInfo) models.BranchDetail {
+	summary, _ := ops.GetRepoSummary(ctx, repoPath)
+
+	return models.BranchDetail{
+		Branch:       branch,
+		Commits:      recentCommits(ctx, ops, repoPath, summary.HeadSHA),
+		Staged:       summary.Staged,
+		Unstaged:     summary.Unstaged,
+		Untracked:    summary.Untracked,
+		Conflicted:   summary.Conflicted,
+		PRInfo:       summary.PRInfo,
+		WorkflowInfo: summary.WorkflowInfo,
+	}
+}
 
-		detail := models.BranchDetail{
-			Branch:       selectedBranch,
-			Commits:      commits,
-			Staged:       summary.Staged,
-			Unstaged:     summary.Unstaged,
-			Untracked:    summary.Untracked,
-			Conflicted:   summary.Conflicted,
-			PRInfo:       summary.PRInfo,
-			WorkflowInfo: summary.WorkflowInfo,
-		}
+// recentCommits caches the log under the HEAD commit it starts from, which
+// fixes its contents; reopening a branch detail view then skips git log.
+// Refresh clears the cache along with the others.
+func recentCommits(ctx context.Context, ops vcs.Operations, repoPath string, headSHA string) []models.CommitInfo {
+	if headSHA == "" {
+		commits, _ := ops.GetCommitLog(ctx, repoPath, branchDetailCommits)
+		return commits
+	}
 
-		if vcsType := vcs.DetectVCSType(repoPath); vcsType == models.VCSTypeJJ {
-		}
+	key := cache.CommitKey{RepoPath: repoPath, SHA: headSHA}
+	if commits, ok := cache.CommitCache.Get(key); ok {
+		return commits
+	}
+	commits, err := ops.GetCommitLog(ctx, repoPath, branchDetailCommits)
+	if err == nil {
+		cache.CommitCache.Set(key, commits)
+	}
+	return commits
+}
 
-		return BranchDetailLoadedMsg{
-			Path:   repoPath,
-			Detail: detail,
-		}
+// currentUpstream looks up the upstream of the checked-out branch, or "" when
+// there is none.
+func currentUpstream(ctx context.Context, ops vcs.Operations, path string) string {
+	branch, err := ops.GetCurrentBranch(ctx, path)
+	if err != nil || branch == "" {
+		return ""
 	}
+	upstream, _ := ops.GetUpstream(ctx, path, branch)
+	return upstream
 }
 
-func loadPRCountCmd(path string, upstream string) tea.Cmd {
+func loadPRCountCmd(path string, upstream string, sem semaphore) tea.Cmd {
 	if upstream == "" {
 		return nil
 	}
 	return func() tea.Msg {
+		sem.acquire()
+		defer sem.release()
+
 		ctx := context.Background()
 		count, err := github.GetPRCount(ctx, path, upstream)
 		if err != nil {
@@ -907,8 +1272,11 @@ func loadPRDetailCmd(repoPath string, prNumber int) tea.Cmd {
 	}
 }
 
-func prefetchPRDetailCmd(repoPath string, prNumber int) tea.Cmd {
+func prefetchPRDetailCmd(repoPath string, prNumber int, sem semaphore) tea.Cmd {
 	return func() tea.Msg {
+		sem.acquire()
+		defer sem.release()
+
 		ctx := context.Background()
 		// Prefetch runs in background and populates cache
 		// No message sent to avoid UI updates during prefetch
@@ -926,41 +1294,51 @@ func openOrCreatePRCmd(repoPath string, branchName string) tea.Cmd {
 	}
 }
 
-func copyToClipboardCmd(text string) tea.Cmd {
-	return func() tea.Msg {
-		var cmd *exec.Cmd
-		switch runtime.GOOS {
-		case "darwin":
-			cmd = exec.Command("pbcopy")
-		case "linux":
-			cmd = exec.Command("sh", "-c", "type xclip >/dev/null 2>&1 && xclip -selection clipboard || type xsel >/dev/null 2>&1 && xsel --clipboard --input || type wl-copy >/dev/null 2>&1 && wl-copy")
-		case "windows":
-			cmd = exec.Command("clip")
-		default:
-			return StatusMsg{Message: "Clipboard not supported on this platform"}
+// clipboardCommand picks the platform's clipboard tool once per run instead of
+// probing for it through a shell on every copy. It is nil when none is found.
+var clipboardCommand = sync.OnceValue(func() []string {
+	var candidates [][]string
+	switch runtime.GOOS {
+	case "darwin":
+		candidates = [][]string{{"pbcopy"}}
+	case "linux":
+		candidates = [][]string{
+			{"xclip", "-selection", "clipboard"},
+			{"xsel", "--clipboard", "--input"},
+			{"wl-copy"},
 		}
+	case "windows":
+		candidates = [][]string{{"clip"}}
+	}
 
-		if cmd != nil {
-			stdin, err := cmd.StdinPipe()
-			if err != nil {
-				return StatusMsg{Message: fmt.Sprintf("Failed to copy: %v", err)}
-			}
+	for _, argv := range candidates {
+		if path, err := exec.LookPath(argv[0]); err == nil {
+			return append([]string{path}, argv[1:]...)
+		}
+	}
+	return nil
+})
 
-			if err := cmd.Start(); err != nil {
-				return StatusMsg{Message: fmt.Sprintf("Failed to copy: %v", err)}
-			}
+// clipboardTimeout bounds a copy, so a clipboard tool that hangs (for example
+// xclip without a reachable display) cannot hold the command open forever.
+const clipboardTimeout = 5 * time.Second
 
-			if _, err := stdin.Write([]byte(text)); err != nil {
-				return StatusMsg{Message: fmt.Sprintf("Failed to copy: %v", err)}
-			}
+// copyToClipboardCmd runs off the update loop like every tea.Cmd; the
+// clipboard tool reads the text from stdin and is given clipboardTimeout.
+func copyToClipboardCmd(text string) tea.Cmd {
+	return func() tea.Msg {
+		argv := clipboardCommand()
+		if argv == nil {
+			return StatusMsg{Message: "No clipboard tool found"}
+		}
 
-			if err := stdin.Close(); err != nil {
-				return StatusMsg{Message: fmt.Sprintf("Failed to copy: %v", err)}
-			}
+		ctx, cancel := context.WithTimeout(context.Background(), clipboardTimeout)
+		defer cancel()
 
-			if err := cmd.Wait(); err != nil {
-				return StatusMsg{Message: fmt.Sprintf("Failed to copy: %v", err)}
-			}
+		cmd := exec.CommandContext(ctx, argv[0], argv[1:]...)
+		cmd.Stdin = strings.NewReader(text)
+		if err := cmd.Run(); err != nil {
+			return StatusMsg{Message: fmt.Sprintf("Failed to copy: %v", err)}
 		}
 
 		return CopySuccessMsg{Text: text}
@@ -989,6 +1367,36 @@ func openURLCmd(url string) tea.Cmd {
 	}
 }
 
+const tableRefreshInterval = 100 * time.Millisecond
+
+// scheduleTableRefresh coalesces re-filtering while summaries stream in.
+func scheduleTableRefresh() tea.Cmd {
+	return tea.Tick(tableRefreshInterval, func(t time.Time) tea.Msg {
+		return TableRefreshMsg{}
+	})
+}
+
+const cacheSweepInterval = 30 * time.Second
+
+// scheduleCacheSweep periodically drops expired cache entries that are never
+// read again. The sweep runs on the timer goroutine, off the update loop.
+func scheduleCacheSweep() tea.Cmd {
+	return tea.Tick(cacheSweepInterval, func(t time.Time) tea.Msg {
+		cache.SweepAll()
+		return CacheSweepMsg{}
+	})
+}
+
+const searchDebounce = 150 * time.Millisecond
+
+// scheduleSearchRefresh re-filters once typing pauses; ticks for superseded
+// keystrokes are ignored by sequence number.
+func scheduleSearchRefresh(seq int) tea.Cmd {
+	return tea.Tick(searchDebounce, func(t time.Time) tea.Msg {
+		return SearchDebounceMsg{seq: seq}
+	})
+}
+
 func clearStatusAfterDelay() tea.Cmd {
 	return tea.Tick(3*time.Second, func(t time.Time) tea.Msg {
 		return ClearStatusMsg{}
@@ -4,6 +4,8 @@ import (
 	"fmt"
 	"path/filepath"
 	"strings"
+	"sync"
+	"unicode/utf8"
 
 	"github.com/charmbracelet/lipgloss"
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
@@ -35,6 +37,101 @@ func (m Model) View() string {
 	}
 }
 
+// renderedText memoizes one style's output for the fixed section titles and
+// field labels of the detail views, a small set of strings that would
+// otherwise be styled again on every frame.
+type renderedText struct {
+	style    lipgloss.Style
+	rendered sync.Map
+}
+
+func (r *renderedText) Render(text string) string {
+	if out, ok := r.rendered.Load(text); ok {
+		return out.(string)
+	}
+	out := r.style.Render(text)
+	r.rendered.Store(text, out)
+	return out
+}
+
+var (
+	sectionTitles       = &renderedText{style: styles.SectionStyle}
+	spacedSectionTitles = &renderedText{style: styles.SpacedSectionStyle}
+	detailLabels        = &renderedText{style: styles.DetailLabelStyle}
+	prLabels            = &renderedText{style: styles.PRLabelStyle}
+)
+
+// Headers, help lines and action rows that never change are rendered once,
+// on first use, after the terminal's color profile is known.
+var (
+	repoTableHeader = sync.OnceValue(func() string {
+		return styles.HeaderStyle.Render(fmt.Sprintf("  %-*s  %-*s  %-*s  %-*s  %-*s  %s",
+			repoColumns.name, "NAME",
+			repoColumns.branch, "BRANCH",
+			repoColumns.status, "STATUS",
+			repoColumns.pr, "PR",
+			repoColumns.prs, "PRs",
+			"MODIFIED",
+		))
+	})
+	branchListHeader = sync.OnceValue(func() string {
+		return styles.HeaderStyle.Render(fmt.Sprintf("  %-20s  %-20s  %-10s  %s",
+			"BRANCH", "UPSTREAM", "STATUS", "LAST COMMIT"))
+	})
+	stashListHeader = sync.OnceValue(func() string {
+		return styles.HeaderStyle.Render(fmt.Sprintf("  %-8s  %-40s  %s",
+			"INDEX", "MESSAGE", "DATE"))
+	})
+	worktreeListHeader = sync.OnceValue(func() string {
+		return styles.HeaderStyle.Render(fmt.Sprintf("  %-30s  %-20s  %s",
+			"PATH", "BRANCH", "STATUS"))
+	})
+	prListHeader = sync.OnceValue(func() string {
+		return styles.HeaderStyle.Render(fmt.Sprintf("  %-8s  %-40s  %-10s  %-18s  %s",
+			"NUMBER", "TITLE", "STATE", "REVIEW", "BRANCH"))
+	})
+	filterModalHeader = sync.OnceValue(func() string {
+		return styles.HeaderStyle.Render(fmt.Sprintf("  %-4s  %-3s  %-15s  %s",
+			"", "Key", "Filter", "Count"))
+	})
+	filterModalHelp = sync.OnceValue(func() string {
+		return styles.FooterKeyStyle.Render("enter/key") + styles.FooterDescStyle.Render(" cycle (off/on/NOT)") + "  " +
+			styles.FooterKeyStyle.Render("*") + styles.FooterDescStyle.Render(" reset") + "  " +
+			styles.FooterKeyStyle.Render("esc") + styles.FooterDescStyle.Render(" close")
+	})
+	sortModalHeader = sync.OnceValue(func() string {
+		return styles.HeaderStyle.Render(fmt.Sprintf("  %-4s  %-3s  %s",
+			"", "Key", "Sort By"))
+	})
+	sortModalHelp = sync.OnceValue(func() string {
+		return styles.FooterKeyStyle.Render("enter/key") + styles.FooterDescStyle.Render(" cycle (off/ASC/DESC)") + "  " +
+			styles.FooterKeyStyle.Render("[/]") + styles.FooterDescStyle.Render(" reorder") + "  " +
+			styles.FooterKeyStyle.Render("*") + styles.FooterDescStyle.Render(" reset") + "  " +
+			styles.FooterKeyStyle.Render("esc") + styles.FooterDescStyle.Render(" close")
+	})
+	branchPRActions = sync.OnceValue(func() string {
+		return styles.FooterKeyStyle.Render("y") + styles.ActionStyle.Render(" copy branch name") + "  " +
+			styles.FooterKeyStyle.Render("p") + styles.ActionStyle.Render(" open PR in browser") + "  " +
+			styles.FooterKeyStyle.Render("o") + styles.ActionStyle.Render(" open PR URL")
+	})
+	branchNoPRActions = sync.OnceValue(func() string {
+		return styles.FooterKeyStyle.Render("y") + styles.ActionStyle.Render(" copy branch name") + "  " +
+			styles.FooterKeyStyle.Render("p") + styles.ActionStyle.Render(" create new PR")
+	})
+	prDetailActions = sync.OnceValue(func() string {
+		return styles.IndentStyle.Render(
+			styles.FooterKeyStyle.Render("o") + styles.FooterDescStyle.Render(" open in browser") + "    " +
+				styles.FooterKeyStyle.Render("u") + styles.FooterDescStyle.Render(" copy URL") + "    " +
+				styles.FooterKeyStyle.Render("n") + styles.FooterDescStyle.Render(" copy PR number") + "    " +
+				styles.FooterKeyStyle.Render("b") + styles.FooterDescStyle.Render(" copy branch name"))
+	})
+	prDetailFooter = sync.OnceValue(func() string {
+		return styles.FooterStyle.Render(
+			styles.FooterKeyStyle.Render("esc") + styles.FooterDescStyle.Render(" back  ") +
+				styles.FooterKeyStyle.Render("?") + styles.FooterDescStyle.Render(" help"))
+	})
+)
+
 func (m Model) renderRepoList() string {
 	var b strings.Builder
 
@@ -112,31 +209,71 @@ func (m Model) renderBreadcrumbs() string {
 		return home + sep + repo + sep + branch + "  " + strings.Join(badges, " ")
 
 	default:
-		title := styles.TitleStyle.Render("repo-dashboard")
-
-		badges := []string{}
-
-		repoCount := fmt.Sprintf("%d repos", len(m.filteredPaths))
-		if len(m.filteredPaths) != len(m.repoPaths) {
-			repoCount = fmt.Sprintf("%d/%d repos", len(m.filteredPaths), len(m.repoPaths))
+		key := breadcrumbKey{
+			filtered:     len(m.filteredPaths),
+			total:        len(m.repoPaths),
+			dirty:        m.filterCounts[models.FilterModeDirty],
+			prs:          m.filterCounts[models.FilterModeHasPR],
+			loading:      m.loading,
+			loaded:       m.loadedCount,
+			loadingCount: m.loadingCount,
 		}
-		badges = append(badges, styles.Badge(repoCount, styles.CountBadgeStyle))
-
-		if dirtyCount := m.DirtyCount(); dirtyCount > 0 {
-			badges = append(badges, styles.Badge(fmt.Sprintf("%d dirty", dirtyCount), styles.FilterBadgeStyle))
+		if m.breadcrumbs != nil && m.breadcrumbs.valid && m.breadcrumbs.key == key {
+			return m.breadcrumbs.value
 		}
 
-		if prCount := m.PRCount(); prCount > 0 {
-			badges = append(badges, styles.Badge(fmt.Sprintf("%d PRs", prCount), styles.PROpenStyle))
+		value := renderRepoListBreadcrumbs(key)
+		if m.breadcrumbs != nil {
+			*m.breadcrumbs = breadcrumbCache{key: key, value: value, valid: true}
 		}
+		return value
+	}
+}
 
-		if m.loading {
-			progress := fmt.Sprintf("Loading %d/%d", m.loadedCount, m.loadingCount)
-			badges = append(badges, styles.Badge(progress, styles.CountBadgeStyle))
-		}
+// breadcrumbKey captures every input to the repo list breadcrumbs.
+type breadcrumbKey struct {
+	filtered     int
+	total        int
+	dirty        int
+	prs          int
+	loading      bool
+	loaded       int
+	loadingCount int
+}
+
+// breadcrumbCache memoizes the last rendered repo list breadcrumbs. It is held
+// by pointer so View, which has a value receiver, can update it.
+type breadcrumbCache struct {
+	key   breadcrumbKey
+	value string
+	valid bool
+}
+
+func renderRepoListBreadcrumbs(k breadcrumbKey) string {
+	title := styles.TitleStyle.Render("repo-dashboard")
 
-		return title + "  " + strings.Join(badges, " ")
+	badges := []string{}
+
+	repoCount := fmt.Sprintf("%d repos", k.filtered)
+	if k.filtered != k.total {
+		repoCount = fmt.Sprintf("%d/%d repos", k.filtered, k.total)
 	}
+	badges = append(badges, styles.Badge(repoCount, styles.CountBadgeStyle))
+
+	if k.dirty > 0 {
+		badges = append(badges, styles.Badge(fmt.Sprintf("%d dirty", k.dirty), styles.FilterBadgeStyle))
+	}
+
+	if k.prs > 0 {
+		badges = append(badges, styles.Badge(fmt.Sprintf("%d PRs", k.prs), styles.PROpenStyle))
+	}
+
+	if k.loading {
+		progress := fmt.Sprintf("Loading %d/%d", k.loaded, k.loadingCount)
+		badges = append(badges, styles.Badge(progress, styles.CountBadgeStyle))
+	}
+
+	return title + "  " + strings.Join(badges, " ")
 }
 
 func (m Model) renderStatusBar() string {
@@ -179,11 +316,7 @@ func (m Model) renderStatusBar() string {
 
 func (m Model) renderTable() string {
 	if len(m.filteredPaths) == 0 {
-		emptyStyle := lipgloss.NewStyle().
-			Border(lipgloss.RoundedBorder()).
-			BorderForeground(styles.Surface1).
-			Padding(2, 4).
-			Foreground(styles.Subtext0)
+		emptyStyle := styles.EmptyStateStyle
 
 		if m.loading {
 			return emptyStyle.Render("Discovering repositories...")
@@ -191,79 +324,79 @@ func (m Model) renderTable() string {
 		return emptyStyle.Render("No repositories found")
 	}
 
-	colWidths := struct {
-		name     int
-		branch   int
-		status   int
-		pr       int
-		prs      int
-		modified int
-	}{
-		name:     20,
-		branch:   15,
-		status:   12,
-		pr:       12,
-		prs:      6,
-		modified: 12,
-	}
-
-	header := fmt.Sprintf("  %-*s  %-*s  %-*s  %-*s  %-*s  %s",
-		colWidths.name, "NAME",
-		colWidths.branch, "BRANCH",
-		colWidths.status, "STATUS",
-		colWidths.pr, "PR",
-		colWidths.prs, "PRs",
-		"MODIFIED",
-	)
-	header = styles.HeaderStyle.Render(header)
-
 	availableHeight := m.height - 6
 	if m.searching {
 		availableHeight--
 	}
 
-	startIdx := m.cursor - availableHeight/2
-	if startIdx < 0 {
-		startIdx = 0
-	}
-
-	endIdx := startIdx + availableHeight
-	if endIdx > len(m.filteredPaths) {
-		endIdx = len(m.filteredPaths)
-		if endIdx-availableHeight >= 0 {
-			startIdx = endIdx - availableHeight
-		}
-	}
+	startIdx, endIdx := visibleRange(m.cursor, len(m.filteredPaths), availableHeight)
 
-	var rows []string
-	rows = append(rows, header)
+	var b strings.Builder
+	b.WriteString(repoTableHeader())
 
 	for i := startIdx; i < endIdx; i++ {
 		path := m.filteredPaths[i]
 		summary := m.summaries[path]
-		row := m.renderTableRow(summary, i == m.cursor, colWidths)
-		rows = append(rows, row)
+		cells, ok := m.rows[path]
+		if !ok {
+			cells = newRepoRow(summary, m.prCount[path])
+		}
+		b.WriteByte('\n')
+		b.WriteString(m.renderTableRow(summary, cells, i == m.cursor))
+	}
+
+	return b.String()
+}
+
+// visibleRange returns the [start, end) window of a list of total rows that
+// fits in height lines while keeping the cursor roughly centered.
+func visibleRange(cursor, total, height int) (int, int) {
+	if height <= 0 || total <= height {
+		return 0, total
+	}
+
+	start := max(cursor-height/2, 0)
+	end := start + height
+	if end > total {
+		end = total
+		start = end - height
 	}
+	return start, end
+}
 
-	return strings.Join(rows, "\n")
+// detailListHeight is the number of list rows that fit below the repo detail
+// breadcrumbs, tabs and column header.
+func (m Model) detailListHeight() int {
+	return m.height - 10
 }
 
-func (m Model) renderTableRow(s models.RepoSummary, selected bool, colWidths struct {
+var repoColumns = struct {
 	name     int
 	branch   int
 	status   int
 	pr       int
 	prs      int
 	modified int
-}) string {
-	cursor := "  "
-	if selected {
-		cursor = "> "
-	}
+}{
+	name:     20,
+	branch:   15,
+	status:   12,
+	pr:       12,
+	prs:      6,
+	modified: 12,
+}
 
-	name := truncate(s.Name(), colWidths.name)
-	branch := truncate(s.Branch, colWidths.branch)
-	status := s.StatusSummary()
+// repoRow holds the padded, unstyled cell text for a repo so rendering only
+// has to apply styles.
+type repoRow struct {
+	name    string
+	branch  string
+	status  string
+	pr      string
+	prCount string
+}
+
+func newRepoRow(s models.RepoSummary, prCount int) repoRow {
 	pr := "—"
 	if s.PRInfo != nil {
 		// Show PR number with review and CI indicators
@@ -294,60 +427,140 @@ func (m Model) renderTableRow(s models.RepoSummary, selected bool, colWidths str
 	}
 
 	prCountStr := "—"
-	if count, ok := m.prCount[s.Path]; ok && count > 0 {
-		prCountStr = fmt.Sprintf("%d", count)
+	if prCount > 0 {
+		prCountStr = fmt.Sprintf("%d", prCount)
 	}
 
-	modified := s.RelativeModified()
+	return repoRow{
+		name:    fmt.Sprintf("%-*s", repoColumns.name, truncate(s.Name(), repoColumns.name)),
+		branch:  fmt.Sprintf("%-*s", repoColumns.branch, truncate(s.Branch, repoColumns.branch)),
+		status:  fmt.Sprintf("%-*s", repoColumns.status, s.StatusSummary()),
+		pr:      fmt.Sprintf("%-*s", repoColumns.pr, pr),
+		prCount: fmt.Sprintf("%-*s", repoColumns.prs, prCountStr),
+	}
+}
 
-	var style lipgloss.Style
-	if selected {
-		style = styles.SelectedRowStyle
-	} else {
-		style = styles.TableRowStyle
+// statusStyles colors the check, workflow and review summaries shown in the
+// detail views. Any other status is muted.
+var statusStyles = map[string]lipgloss.Style{
+	"passing":           styles.CleanStyle,
+	"approved":          styles.CleanStyle,
+	"failing":           styles.ErrorStyle,
+	"changes requested": styles.ErrorStyle,
+}
+
+func statusStyle(status string) lipgloss.Style {
+	if style, ok := statusStyles[status]; ok {
+		return style
 	}
+	return styles.SubtitleStyle
+}
+
+// repoRowStyle holds the styles for one repo table row state.
+type repoRowStyle struct {
+	row    lipgloss.Style
+	branch lipgloss.Style
+	dirty  lipgloss.Style
+	clean  lipgloss.Style
+	pr     lipgloss.Style
+}
+
+// repoRowStyles is indexed by whether the row is selected, so rendering does
+// not derive highlighted variants for every row on every frame.
+var repoRowStyles = [2]repoRowStyle{
+	{
+		row:    styles.TableRowStyle,
+		branch: styles.BranchStyle,
+		dirty:  styles.DirtyStyle,
+		clean:  styles.CleanStyle,
+		pr:     styles.PROpenStyle,
+	},
+	{
+		row:    styles.SelectedRowStyle,
+		branch: styles.BranchStyle.Background(styles.Surface0),
+		dirty:  styles.DirtyStyle.Background(styles.Surface0),
+		clean:  styles.CleanStyle.Background(styles.Surface0),
+		pr:     styles.PROpenStyle.Background(styles.Surface0),
+	},
+}
+
+// detailRowStyle is repoRowStyle for the repo detail lists.
+type detailRowStyle struct {
+	row     lipgloss.Style
+	branch  lipgloss.Style
+	current lipgloss.Style
+	open    lipgloss.Style
+	draft   lipgloss.Style
+	merged  lipgloss.Style
+	errored lipgloss.Style
+	muted   lipgloss.Style
+	clean   lipgloss.Style
+}
 
-	nameStyle := style
-	branchStyle := styles.BranchStyle
+var detailRowStyles = [2]detailRowStyle{
+	{
+		row:     styles.TableRowStyle,
+		branch:  styles.BranchStyle,
+		current: styles.PROpenStyle,
+		open:    styles.PROpenStyle,
+		draft:   styles.PRDraftStyle,
+		merged:  styles.PRMergedStyle,
+		errored: styles.ErrorStyle,
+		muted:   styles.SubtitleStyle,
+		clean:   styles.CleanStyle,
+	},
+	{
+		row:     styles.SelectedRowStyle,
+		branch:  styles.BranchStyle.Background(styles.Surface0),
+		current: styles.PROpenStyle.Background(styles.Surface0),
+		open:    styles.PROpenStyle.Background(styles.Surface0),
+		draft:   styles.PRDraftStyle.Background(styles.Surface0),
+		merged:  styles.PRMergedStyle.Background(styles.Surface0),
+		errored: styles.ErrorStyle.Background(styles.Surface0),
+		muted:   styles.SubtitleStyle.Background(styles.Surface0),
+		clean:   styles.CleanStyle.Background(styles.Surface0),
+	},
+}
+
+// detailRowStyleFor returns the cursor prefix and styles for row i.
+func (m Model) detailRowStyleFor(i int) (string, detailRowStyle) {
+	if i == m.detailCursor {
+		return "> ", detailRowStyles[1]
+	}
+	return "  ", detailRowStyles[0]
+}
+
+func (m Model) renderTableRow(s models.RepoSummary, cells repoRow, selected bool) string {
+	cursor := "  "
+	rs := repoRowStyles[0]
 	if selected {
-		branchStyle = branchStyle.Background(styles.Surface0)
+		cursor = "> "
+		rs = repoRowStyles[1]
 	}
 
-	var statusStyle lipgloss.Style
+	modified := s.RelativeModified()
+
+	statusStyle := rs.row
 	switch {
 	case s.IsDirty():
-		statusStyle = styles.DirtyStyle
+		statusStyle = rs.dirty
 	case s.Status() == models.RepoStatusClean:
-		statusStyle = styles.CleanStyle
-	default:
-		statusStyle = style
-	}
-	if selected {
-		statusStyle = statusStyle.Background(styles.Surface0)
+		statusStyle = rs.clean
 	}
 
-	prStyle := style
+	prStyle := rs.row
 	if s.PRInfo != nil {
-		prStyle = styles.PROpenStyle
-		if selected {
-			prStyle = prStyle.Background(styles.Surface0)
-		}
+		prStyle = rs.pr
 	}
 
-	formattedName := fmt.Sprintf("%-*s", colWidths.name, name)
-	formattedBranch := fmt.Sprintf("%-*s", colWidths.branch, branch)
-	formattedStatus := fmt.Sprintf("%-*s", colWidths.status, status)
-	formattedPR := fmt.Sprintf("%-*s", colWidths.pr, pr)
-	formattedPRCount := fmt.Sprintf("%-*s", colWidths.prs, prCountStr)
-
 	row := fmt.Sprintf("%s%s  %s  %s  %s  %s  %s",
 		cursor,
-		nameStyle.Render(formattedName),
-		branchStyle.Render(formattedBranch),
-		statusStyle.Render(formattedStatus),
-		prStyle.Render(formattedPR),
-		style.Render(formattedPRCount),
-		style.Render(modified),
+		rs.row.Render(cells.name),
+		rs.branch.Render(cells.branch),
+		statusStyle.Render(cells.status),
+		prStyle.Render(cells.pr),
+		rs.row.Render(cells.prCount),
+		rs.row.Render(modified),
 	)
 
 	return row
@@ -384,10 +597,7 @@ func (m Model) renderHelp() string {
 	b.WriteString(styles.TitleStyle.Render("Help"))
 	b.WriteString("\n\n")
 
-	sectionStyle := lipgloss.NewStyle().
-		Foreground(styles.Blue).
-		Bold(true).
-		PaddingLeft(1)
+	sectionStyle := sectionTitles
 
 	sections := []struct {
 		title string
@@ -467,7 +677,8 @@ func (m Model) renderRepoDetail() string {
 	b.WriteString(styles.SubtitleStyle.Render(summary.Path))
 	b.WriteString("\n\n")
 
-	b.WriteString(m.renderDetailTabs())
+	isJJ := summary.VCSType == models.VCSTypeJJ
+	b.WriteString(m.renderDetailTabs(isJJ))
 	b.WriteString("\n\n")
 
 	switch m.detailTab {
@@ -476,7 +687,7 @@ func (m Model) renderRepoDetail() string {
 	case DetailTabStashes:
 		b.WriteString(m.renderStashList())
 	case DetailTabWorktrees:
-		b.WriteString(m.renderWorktreeList())
+		b.WriteString(m.renderWorktreeList(isJJ))
 	case DetailTabPRs:
 		b.WriteString(m.renderPRList())
 	}
@@ -501,10 +712,9 @@ func (m Model) renderRepoDetail() string {
 	return b.String()
 }
 
-func (m Model) renderDetailTabs() string {
-	summary, _ := m.summaries[m.selectedRepo]
-	isJJ := summary.VCSType == models.VCSTypeJJ
-
+// renderDetailTabs and renderWorktreeList take the VCS type from
+// renderRepoDetail, which has already looked up the selected summary.
+func (m Model) renderDetailTabs(isJJ bool) string {
 	worktreeLabel := "Worktrees"
 	if isJJ {
 		worktreeLabel = "Workspaces"
@@ -541,134 +751,111 @@ func (m Model) renderDetailTabs() string {
 
 func (m Model) renderBranchList() string {
 	if len(m.branches) == 0 {
-		emptyStyle := lipgloss.NewStyle().
-			Border(lipgloss.RoundedBorder()).
-			BorderForeground(styles.Surface1).
-			Padding(2, 4).
-			Foreground(styles.Subtext0)
+		emptyStyle := styles.EmptyStateStyle
 		return emptyStyle.Render("No branches found")
 	}
 
-	var rows []string
-	header := fmt.Sprintf("  %-20s  %-20s  %-10s  %s",
-		"BRANCH", "UPSTREAM", "STATUS", "LAST COMMIT")
-	rows = append(rows, styles.HeaderStyle.Render(header))
+	var b strings.Builder
+	b.WriteString(branchListHeader())
 
-	for i, branch := range m.branches {
-		cursor := "  "
-		if i == m.detailCursor {
-			cursor = "> "
-		}
+	start, end := visibleRange(m.detailCursor, len(m.branches), m.detailListHeight())
+	for i := start; i < end; i++ {
+		branch := m.branches[i]
+		cursor, rs := m.detailRowStyleFor(i)
 
-		name := truncate(branch.Name, 20)
-		if branch.IsCurrent {
-			name = "* " + name
-		}
-		upstream := truncate(branch.Upstream, 20)
-		status := ""
-		if branch.Ahead > 0 {
-			status += fmt.Sprintf("↑%d", branch.Ahead)
-		}
-		if branch.Behind > 0 {
-			if status != "" {
-				status += " "
-			}
-			status += fmt.Sprintf("↓%d", branch.Behind)
-		}
-		if status == "" {
-			status = "✓"
+		cells := newBranchRow(branch)
+		if i < len(m.branchRows) {
+			cells = m.branchRows[i]
 		}
 		lastCommit := branch.RelativeLastCommit()
 
-		var style lipgloss.Style
-		if i == m.detailCursor {
-			style = styles.SelectedRowStyle
-		} else {
-			style = styles.TableRowStyle
-		}
-
-		nameStyle := styles.BranchStyle
+		style := rs.row
+		nameStyle := rs.branch
 		if branch.IsCurrent {
-			nameStyle = styles.PROpenStyle
+			nameStyle = rs.current
 		}
-		if i == m.detailCursor {
-			nameStyle = nameStyle.Background(styles.Surface0)
-		}
-
-		formattedName := fmt.Sprintf("%-20s", name)
-		formattedUpstream := fmt.Sprintf("%-20s", upstream)
-		formattedStatus := fmt.Sprintf("%-10s", status)
 
-		row := fmt.Sprintf("%s%s  %s  %s  %s",
+		fmt.Fprintf(&b, "\n%s%s  %s  %s  %s",
 			cursor,
-			nameStyle.Render(formattedName),
-			style.Render(formattedUpstream),
-			style.Render(formattedStatus),
+			nameStyle.Render(cells.name),
+			style.Render(cells.upstream),
+			style.Render(cells.status),
 			style.Render(lastCommit),
 		)
-		rows = append(rows, row)
 	}
 
-	return strings.Join(rows, "\n")
+	return b.String()
+}
+
+// branchRow holds the padded, unstyled cell text for a branch list row.
+type branchRow struct {
+	name     string
+	upstream string
+	status   string
+}
+
+func newBranchRow(branch models.BranchInfo) branchRow {
+	name := truncate(branch.Name, 20)
+	if branch.IsCurrent {
+		name = "* " + name
+	}
+	status := ""
+	if branch.Ahead > 0 {
+		status += fmt.Sprintf("↑%d", branch.Ahead)
+	}
+	if branch.Behind > 0 {
+		if status != "" {
+			status += " "
+		}
+		status += fmt.Sprintf("↓%d", branch.Behind)
+	}
+	if status == "" {
+		status = "✓"
+	}
+
+	return branchRow{
+		name:     fmt.Sprintf("%-20s", name),
+		upstream: fmt.Sprintf("%-20s", truncate(branch.Upstream, 20)),
+		status:   fmt.Sprintf("%-10s", status),
+	}
 }
 
 func (m Model) renderStashList() string {
 	if len(m.stashes) == 0 {
-		emptyStyle := lipgloss.NewStyle().
-			Border(lipgloss.RoundedBorder()).
-			BorderForeground(styles.Surface1).
-			Padding(2, 4).
-			Foreground(styles.Subtext0)
+		emptyStyle := styles.EmptyStateStyle
 		return emptyStyle.Render("No stashes found\n\nStashes are only available for git repositories.\nJJ repositories use the working copy change instead.")
 	}
 
-	var rows []string
-	header := fmt.Sprintf("  %-8s  %-40s  %s",
-		"INDEX", "MESSAGE", "DATE")
-	rows = append(rows, styles.HeaderStyle.Render(header))
+	var b strings.Builder
+	b.WriteString(stashListHeader())
 
-	for i, stash := range m.stashes {
-		cursor := "  "
-		if i == m.detailCursor {
-			cursor = "> "
-		}
+	start, end := visibleRange(m.detailCursor, len(m.stashes), m.detailListHeight())
+	for i := start; i < end; i++ {
+		stash := m.stashes[i]
+		cursor, rs := m.detailRowStyleFor(i)
 
 		index := fmt.Sprintf("stash@{%d}", stash.Index)
 		message := truncate(stash.Message, 40)
 		date := stash.RelativeDate()
-
-		var style lipgloss.Style
-		if i == m.detailCursor {
-			style = styles.SelectedRowStyle
-		} else {
-			style = styles.TableRowStyle
-		}
+		style := rs.row
 
 		formattedIndex := fmt.Sprintf("%-8s", index)
 		formattedMessage := fmt.Sprintf("%-40s", message)
 
-		row := fmt.Sprintf("%s%s  %s  %s",
+		fmt.Fprintf(&b, "\n%s%s  %s  %s",
 			cursor,
 			style.Render(formattedIndex),
 			style.Render(formattedMessage),
 			style.Render(date),
 		)
-		rows = append(rows, row)
 	}
 
-	return strings.Join(rows, "\n")
+	return b.String()
 }
 
-func (m Model) renderWorktreeList() string {
-	summary, _ := m.summaries[m.selectedRepo]
-	isJJ := summary.VCSType == models.VCSTypeJJ
-
+func (m Model) renderWorktreeList(isJJ bool) string {
 	if len(m.worktrees) == 0 {
-		emptyStyle := lipgloss.NewStyle().
-			Border(lipgloss.RoundedBorder()).
-			BorderForeground(styles.Surface1).
-			Padding(2, 4).
-			Foreground(styles.Subtext0)
+		emptyStyle := styles.EmptyStateStyle
 
 		emptyMsg := "No worktrees found\n\nWorktrees allow working on multiple branches simultaneously."
 		if isJJ {
@@ -677,80 +864,75 @@ func (m Model) renderWorktreeList() string {
 		return emptyStyle.Render(emptyMsg)
 	}
 
-	var rows []string
-	header := fmt.Sprintf("  %-30s  %-20s  %s",
-		"PATH", "BRANCH", "STATUS")
-	rows = append(rows, styles.HeaderStyle.Render(header))
-
-	for i, wt := range m.worktrees {
-		cursor := "  "
-		if i == m.detailCursor {
-			cursor = "> "
-		}
+	var b strings.Builder
+	b.WriteString(worktreeListHeader())
 
-		path := truncate(filepath.Base(wt.Path), 30)
-		branch := truncate(wt.Branch, 20)
-		status := ""
-		if wt.IsBare {
-			status = "bare"
-		}
-		if wt.IsLocked {
-			if status != "" {
-				status += ", "
-			}
-			status += "locked"
-		}
-		if status == "" {
-			status = "active"
-		}
+	start, end := visibleRange(m.detailCursor, len(m.worktrees), m.detailListHeight())
+	for i := start; i < end; i++ {
+		wt := m.worktrees[i]
+		cursor, rs := m.detailRowStyleFor(i)
 
-		var style lipgloss.Style
-		if i == m.detailCursor {
-			style = styles.SelectedRowStyle
-		} else {
-			style = styles.TableRowStyle
+		cells := newWorktreeRow(wt)
+		if i < len(m.worktreeRows) {
+			cells = m.worktreeRows[i]
 		}
 
-		formattedPath := fmt.Sprintf("%-30s", path)
-		formattedBranch := fmt.Sprintf("%-20s", branch)
+		style := rs.row
+		branchStyleLocal := rs.branch
 
-		branchStyleLocal := styles.BranchStyle
-		if i == m.detailCursor {
-			branchStyleLocal = branchStyleLocal.Background(styles.Surface0)
-		}
-
-		row := fmt.Sprintf("%s%s  %s  %s",
+		fmt.Fprintf(&b, "\n%s%s  %s  %s",
 			cursor,
-			style.Render(formattedPath),
-			branchStyleLocal.Render(formattedBranch),
-			style.Render(status),
+			style.Render(cells.path),
+			branchStyleLocal.Render(cells.branch),
+			style.Render(cells.status),
 		)
-		rows = append(rows, row)
 	}
 
-	return strings.Join(rows, "\n")
+	return b.String()
+}
+
+// worktreeRow holds the padded, unstyled cell text for a worktree list row.
+type worktreeRow struct {
+	path   string
+	branch string
+	status string
+}
+
+func newWorktreeRow(wt models.WorktreeInfo) worktreeRow {
+	status := ""
+	if wt.IsBare {
+		status = "bare"
+	}
+	if wt.IsLocked {
+		if status != "" {
+			status += ", "
+		}
+		status += "locked"
+	}
+	if status == "" {
+		status = "active"
+	}
+
+	return worktreeRow{
+		path:   fmt.Sprintf("%-30s", truncate(filepath.Base(wt.Path), 30)),
+		branch: fmt.Sprintf("%-20s", truncate(wt.Branch, 20)),
+		status: status,
+	}
 }
 
 func (m Model) renderPRList() string {
 	if len(m.prs) == 0 {
-		emptyStyle := lipgloss.NewStyle().
-			Border(lipgloss.RoundedBorder()).
-			BorderForeground(styles.Surface1).
-			Padding(2, 4).
-			Foreground(styles.Subtext0)
+		emptyStyle := styles.EmptyStateStyle
 		return emptyStyle.Render("No open pull requests")
 	}
 
-	var rows []string
-	header := fmt.Sprintf("  %-8s  %-40s  %-10s  %-18s  %s",
-		"NUMBER", "TITLE", "STATE", "REVIEW", "BRANCH")
-	rows = append(rows, styles.HeaderStyle.Render(header))
+	var b strings.Builder
+	b.WriteString(prListHeader())
 
-	for i, pr := range m.prs {
-		cursor := "  "
-		if i == m.detailCursor {
-			cursor = "> "
-		}
+	start, end := visibleRange(m.detailCursor, len(m.prs), m.detailListHeight())
+	for i := start; i < end; i++ {
+		pr := m.prs[i]
+		cursor, rs := m.detailRowStyleFor(i)
 
 		number := fmt.Sprintf("#%d", pr.Number)
 		title := truncate(pr.Title, 40)
@@ -758,41 +940,27 @@ func (m Model) renderPRList() string {
 		review := pr.ReviewStatus()
 		branch := truncate(pr.HeadRef, 20)
 
-		var rowStyle lipgloss.Style
-		if i == m.detailCursor {
-			rowStyle = styles.SelectedRowStyle
-		} else {
-			rowStyle = styles.TableRowStyle
-		}
+		rowStyle := rs.row
 
-		stateStyle := styles.PROpenStyle
+		stateStyle := rs.open
 		if pr.IsDraft {
-			stateStyle = styles.PRDraftStyle
+			stateStyle = rs.draft
 		} else if state == "MERGED" {
-			stateStyle = styles.PRMergedStyle
+			stateStyle = rs.merged
 		} else if state == "CLOSED" {
-			stateStyle = styles.ErrorStyle
-		}
-		if i == m.detailCursor {
-			stateStyle = stateStyle.Background(styles.Surface0)
+			stateStyle = rs.errored
 		}
 
-		reviewStyle := styles.SubtitleStyle
+		reviewStyle := rs.muted
 		if review == "approved" {
-			reviewStyle = styles.CleanStyle
+			reviewStyle = rs.clean
 		} else if review == "changes requested" {
-			reviewStyle = styles.ErrorStyle
-		}
-		if i == m.detailCursor {
-			reviewStyle = reviewStyle.Background(styles.Surface0)
+			reviewStyle = rs.errored
 		}
 
-		branchStyleLocal := styles.BranchStyle
-		if i == m.detailCursor {
-			branchStyleLocal = branchStyleLocal.Background(styles.Surface0)
-		}
+		branchStyleLocal := rs.branch
 
-		row := fmt.Sprintf("%s%-8s  %-40s  %s  %-18s  %s",
+		fmt.Fprintf(&b, "\n%s%-8s  %-40s  %s  %-18s  %s",
 			cursor,
 			rowStyle.Render(number),
 			rowStyle.Render(title),
@@ -800,13 +968,60 @@ func (m Model) renderPRList() string {
 			reviewStyle.Render(review),
 			branchStyleLocal.Render(branch),
 		)
-		rows = append(rows, row)
 	}
 
-	return strings.Join(rows, "\n")
+	return b.String()
+}
+
+// filterModalKey captures every input to the filter modal. Rows are indexed
+// by filter mode.
+type filterModalKey struct {
+	width  int
+	height int
+	cursor int
+	rows   [filterModeCount]filterModalRow
+}
+
+type filterModalRow struct {
+	enabled  bool
+	inverted bool
+	count    int
+}
+
+const filterModeCount = int(models.FilterModeHasStash) + 1
+
+// filterModalCache memoizes the last rendered filter modal, like
+// breadcrumbCache, so frames without a keypress that changes it reuse it.
+type filterModalCache struct {
+	key   filterModalKey
+	value string
+	valid bool
 }
 
 func (m Model) renderFilterModal() string {
+	key := filterModalKey{width: m.width, height: m.height, cursor: m.filterCursor}
+	for _, f := range m.activeFilters {
+		if int(f.Mode) < filterModeCount {
+			key.rows[f.Mode] = filterModalRow{enabled: f.Enabled, inverted: f.Inverted}
+		}
+	}
+	for mode, count := range m.filterCounts {
+		if int(mode) < filterModeCount {
+			key.rows[mode].count = count
+		}
+	}
+	if m.filterModal != nil && m.filterModal.valid && m.filterModal.key == key {
+		return m.filterModal.value
+	}
+
+	value := m.buildFilterModal()
+	if m.filterModal != nil {
+		*m.filterModal = filterModalCache{key: key, value: value, valid: true}
+	}
+	return value
+}
+
+func (m Model) buildFilterModal() string {
 	var b strings.Builder
 
 	b.WriteString(styles.TitleStyle.Render("Filter Repositories"))
@@ -814,13 +1029,7 @@ func (m Model) renderFilterModal() string {
 
 	modes := models.SelectableFilterModes()
 
-	headerStyle := lipgloss.NewStyle().
-		Foreground(styles.Subtext0).
-		Bold(true)
-
-	header := fmt.Sprintf("  %-4s  %-3s  %-15s  %s",
-		"", "Key", "Filter", "Count")
-	b.WriteString(headerStyle.Render(header))
+	b.WriteString(filterModalHeader())
 	b.WriteString("\n")
 
 	for i, mode := range modes {
@@ -846,7 +1055,7 @@ func (m Model) renderFilterModal() string {
 
 		shortKey := mode.ShortKey()
 		label := mode.String()
-		count := m.countForFilter(mode)
+		count := m.filterCounts[mode]
 
 		var rowStyle lipgloss.Style
 		if i == m.filterCursor {
@@ -855,14 +1064,12 @@ func (m Model) renderFilterModal() string {
 			rowStyle = styles.TableRowStyle
 		}
 
-		checkStyle := lipgloss.NewStyle().Foreground(styles.Green)
+		checkStyle := styles.CheckStyle
 		if filterState.Inverted {
-			checkStyle = lipgloss.NewStyle().Foreground(styles.Peach)
+			checkStyle = styles.InvertedCheckStyle
 		}
 
-		keyStyle := lipgloss.NewStyle().
-			Foreground(styles.Mauve).
-			Bold(true)
+		keyStyle := styles.ShortKeyStyle
 
 		formattedCheck := fmt.Sprintf("%-4s", checkbox)
 		formattedKey := fmt.Sprintf("%-3s", shortKey)
@@ -881,92 +1088,49 @@ func (m Model) renderFilterModal() string {
 	}
 
 	b.WriteString("\n")
-	helpLines := []string{
-		styles.FooterKeyStyle.Render("enter/key") + styles.FooterDescStyle.Render(" cycle (off/on/NOT)"),
-		styles.FooterKeyStyle.Render("*") + styles.FooterDescStyle.Render(" reset"),
-		styles.FooterKeyStyle.Render("esc") + styles.FooterDescStyle.Render(" close"),
-	}
-	b.WriteString(strings.Join(helpLines, "  "))
+	b.WriteString(filterModalHelp())
 
 	content := b.String()
 	return lipgloss.Place(m.width, m.height, lipgloss.Center, lipgloss.Center, content)
 }
 
-func (m Model) countForFilter(mode models.FilterMode) int {
-	count := 0
-	for _, s := range m.summaries {
-		switch mode {
-		case models.FilterModeAll:
-			count++
-		case models.FilterModeAhead:
-			if s.Ahead > 0 {
-				count++
-			}
-		case models.FilterModeBehind:
-			if s.Behind > 0 {
-				count++
-			}
-		case models.FilterModeDirty:
-			if s.IsDirty() {
-				count++
-			}
-		case models.FilterModeHasPR:
-			if s.PRInfo != nil {
-				count++
-			}
-		case models.FilterModeHasStash:
-			if s.StashCount > 0 {
-				count++
-			}
-		}
-	}
-	return count
-}
-
 func (m Model) renderSortModal() string {
 	var b strings.Builder
 
 	b.WriteString(styles.TitleStyle.Render("Sort Repositories"))
 	b.WriteString("\n\n")
 
-	sortsByPriority := make([]models.ActiveSort, 0)
+	// Enabled sorts come first, then disabled ones, in one slice sized for all.
+	displaySorts := make([]models.ActiveSort, 0, len(m.activeSorts))
 	for _, s := range m.activeSorts {
 		if s.IsEnabled() {
-			sortsByPriority = append(sortsByPriority, s)
+			displaySorts = append(displaySorts, s)
 		}
 	}
 
-	for i := 0; i < len(sortsByPriority); i++ {
-		for j := range sortsByPriority {
-			if sortsByPriority[j].Priority == i {
+	// Renumber priorities to close gaps; only the enabled prefix is touched.
+	for i := 0; i < len(displaySorts); i++ {
+		for j := range displaySorts {
+			if displaySorts[j].Priority == i {
 				break
 			}
-			if j == len(sortsByPriority)-1 {
-				for k := range sortsByPriority {
-					if sortsByPriority[k].Priority > i {
-						sortsByPriority[k].Priority--
+			if j == len(displaySorts)-1 {
+				for k := range displaySorts {
+					if displaySorts[k].Priority > i {
+						displaySorts[k].Priority--
 					}
 				}
 			}
 		}
 	}
 
-	inactiveSorts := make([]models.ActiveSort, 0)
 	for _, s := range m.activeSorts {
 		if !s.IsEnabled() {
-			inactiveSorts = append(inactiveSorts, s)
+			displaySorts = append(displaySorts, s)
 		}
 	}
 
-	displaySorts := append(sortsByPriority, inactiveSorts...)
-
-	headerStyle := lipgloss.NewStyle().
-		Foreground(styles.Subtext0).
-		Bold(true)
-
-	header := fmt.Sprintf("  %-4s  %-3s  %s",
-		"", "Key", "Sort By")
-	b.WriteString(headerStyle.Render(header))
+	b.WriteString(sortModalHeader())
 	b.WriteString("\n")
 
 	cursorIndex := -1
@@ -1001,10 +1165,8 @@ func (m Model) renderSortModal() string {
 			rowStyle = styles.TableRowStyle
 		}
 
-		checkStyle := lipgloss.NewStyle().Foreground(styles.Green)
-		keyStyle := lipgloss.NewStyle().
-			Foreground(styles.Mauve).
-			Bold(true)
+		checkStyle := styles.CheckStyle
+		keyStyle := styles.ShortKeyStyle
 
 		formattedIndicator := fmt.Sprintf("%-4s", indicator)
 		formattedKey := fmt.Sprintf("%-3s", shortKey)
@@ -1020,13 +1182,7 @@ func (m Model) renderSortModal() string {
 	}
 
 	b.WriteString("\n")
-	helpLines := []string{
-		styles.FooterKeyStyle.Render("enter/key") + styles.FooterDescStyle.Render(" cycle (off/ASC/DESC)"),
-		styles.FooterKeyStyle.Render("[/]") + styles.FooterDescStyle.Render(" reorder"),
-		styles.FooterKeyStyle.Render("*") + styles.FooterDescStyle.Render(" reset"),
-		styles.FooterKeyStyle.Render("esc") + styles.FooterDescStyle.Render(" close"),
-	}
-	b.WriteString(strings.Join(helpLines, "  "))
+	b.WriteString(sortModalHelp())
 
 	content := b.String()
 	return lipgloss.Place(m.width, m.height, lipgloss.Center, lipgloss.Center, content)
@@ -1048,26 +1204,17 @@ func (m Model) renderBatchProgress() string {
 	b.WriteString(progressStr)
 	b.WriteString("\n\n")
 
-	if len(m.batchResults) > 0 {
+	if len(m.batchRows) > 0 {
 		b.WriteString(styles.HeaderStyle.Render("Results"))
 		b.WriteString("\n")
 
 		maxShow := 15
 		startIdx := 0
-		if len(m.batchResults) > maxShow {
-			startIdx = len(m.batchResults) - maxShow
+		if len(m.batchRows) > maxShow {
+			startIdx = len(m.batchRows) - maxShow
 		}
 
-		for i := startIdx; i < len(m.batchResults); i++ {
-			result := m.batchResults[i]
-			icon := styles.SuccessStyle.Render("✓")
-			if !result.Success {
-				icon = styles.ErrorStyle.Render("✗")
-			}
-			name := truncate(filepath.Base(result.Path), 25)
-			msg := truncate(result.Message, 40)
-
-			row := fmt.Sprintf("  %s %-25s  %s", icon, name, styles.SubtitleStyle.Render(msg))
+		for _, row := range m.batchRows[startIdx:] {
 			b.WriteString(row)
 			b.WriteString("\n")
 		}
@@ -1083,6 +1230,46 @@ func (m Model) renderBatchProgress() string {
 	return b.String()
 }
 
+func newBatchRow(result BatchResult) string {
+	icon := styles.SuccessStyle.Render("✓")
+	if !result.Success {
+		icon = styles.ErrorStyle.Render("✗")
+	}
+	name := truncate(filepath.Base(result.Path), 25)
+	msg := truncate(result.Message, 40)
+
+	return fmt.Sprintf("  %s %-25s  %s", icon, name, styles.SubtitleStyle.Render(msg))
+}
+
+// renderAheadBehind formats the non-zero halves of an ahead/behind pair,
+// returning "" when both are zero.
+func renderAheadBehind(ahead, behind int) string {
+	switch {
+	case ahead > 0 && behind > 0:
+		return styles.AheadStyle.Render(fmt.Sprintf("↑%d ahead", ahead)) + " " +
+			styles.BehindStyle.Render(fmt.Sprintf("↓%d behind", behind))
+	case ahead > 0:
+		return styles.AheadStyle.Render(fmt.Sprintf("↑%d ahead", ahead))
+	case behind > 0:
+		return styles.BehindStyle.Render(fmt.Sprintf("↓%d behind", behind))
+	}
+	return ""
+}
+
+// newCommitRow renders the parts of a branch detail commit line that never
+// change for a commit: everything except its relative date.
+func newCommitRow(commit models.CommitInfo) string {
+	return fmt.Sprintf("  %s  %-50s  %s  ",
+		styles.SubtitleStyle.Render(commit.ShortHash),
+		truncate(commit.Subject, 50),
+		styles.SubtitleStyle.Render(truncate(commit.Author, 15)),
+	)
+}
+
+// branchDetailTrailerLines is how many lines the actions section and footer
+// take below the commit list in the branch detail view.
+const branchDetailTrailerLines = 6
+
 func (m Model) renderBranchDetail() string {
 	summary, _ := m.summaries[m.selectedRepo]
 	isJJ := summary.VCSType == models.VCSTypeJJ
@@ -1092,18 +1279,11 @@ func (m Model) renderBranchDetail() string {
 	b.WriteString(m.renderBreadcrumbs())
 	b.WriteString("\n\n")
 
-	sectionStyle := lipgloss.NewStyle().
-		Foreground(styles.Blue).
-		Bold(true).
-		PaddingLeft(1)
+	sectionStyle := sectionTitles
 
-	infoStyle := lipgloss.NewStyle().
-		Foreground(styles.Text).
-		PaddingLeft(2)
+	infoStyle := styles.InfoStyle
 
-	labelStyle := lipgloss.NewStyle().
-		Foreground(styles.Subtext0).
-		Width(18)
+	labelStyle := detailLabels
 
 	// Branch Information Section
 	b.WriteString(sectionStyle.Render("Branch Information"))
@@ -1117,36 +1297,18 @@ func (m Model) renderBranchDetail() string {
 	}
 
 	if m.branchDetail.Branch.Ahead > 0 || m.branchDetail.Branch.Behind > 0 {
-		status := ""
-		if m.branchDetail.Branch.Ahead > 0 {
-			status += styles.AheadStyle.Render(fmt.Sprintf("↑%d ahead", m.branchDetail.Branch.Ahead))
-		}
-		if m.branchDetail.Branch.Behind > 0 {
-			if status != "" {
-				status += " "
-			}
-			status += styles.BehindStyle.Render(fmt.Sprintf("↓%d behind", m.branchDetail.Branch.Behind))
-		}
+		status := renderAheadBehind(m.branchDetail.Branch.Ahead, m.branchDetail.Branch.Behind)
 		b.WriteString(infoStyle.Render(
 			labelStyle.Render("Tracking:") + " " + status,
 		))
 		b.WriteString("\n")
 	}
 
-	defaultBranch := m.findDefaultBranch()
+	defaultBranch := m.defaultBranch
 	if defaultBranch != "" && m.branchDetail.Branch.Name != defaultBranch {
 		ahead, behind := m.compareToDefaultBranch(defaultBranch)
 		if ahead >= 0 && behind >= 0 {
-			status := ""
-			if ahead > 0 {
-				status += styles.AheadStyle.Render(fmt.Sprintf("↑%d ahead", ahead))
-			}
-			if behind > 0 {
-				if status != "" {
-					status += " "
-				}
-				status += styles.BehindStyle.Render(fmt.Sprintf("↓%d behind", behind))
-			}
+			status := renderAheadBehind(ahead, behind)
 			if status == "" {
 				status = styles.CleanStyle.Render("up to date")
 			}
@@ -1170,12 +1332,13 @@ func (m Model) renderBranchDetail() string {
 	}
 
 	// File Changes
-	fileChanges := m.branchDetail.FileChangesSummary()
+	fileChanges := m.fileChanges
+	if fileChanges == "" {
+		fileChanges = m.branchDetail.FileChangesSummary()
+	}
 	fileStyle := infoStyle
 	if m.branchDetail.UncommittedCount() > 0 {
-		fileStyle = lipgloss.NewStyle().
-			Foreground(styles.Peach).
-			PaddingLeft(2)
+		fileStyle = styles.InfoWarningStyle
 	}
 	b.WriteString(fileStyle.Render(
 		labelStyle.Render("File changes:") + " " + fileChanges,
@@ -1225,12 +1388,7 @@ func (m Model) renderBranchDetail() string {
 
 			// Review Status
 			reviewStatus := pr.ReviewStatus()
-			reviewStyle := styles.SubtitleStyle
-			if reviewStatus == "approved" {
-				reviewStyle = styles.CleanStyle
-			} else if reviewStatus == "changes requested" {
-				reviewStyle = styles.ErrorStyle
-			}
+			reviewStyle := statusStyle(reviewStatus)
 			b.WriteString(infoStyle.Render(
 				labelStyle.Render("Review:") + " " + reviewStyle.Render(reviewStatus),
 			))
@@ -1247,12 +1405,7 @@ func (m Model) renderBranchDetail() string {
 			// CI Checks
 			if pr.Checks.Total > 0 {
 				checkStatus := pr.Checks.Summary()
-				checkStyle := styles.SubtitleStyle
-				if checkStatus == "passing" {
-					checkStyle = styles.CleanStyle
-				} else if checkStatus == "failing" {
-					checkStyle = styles.ErrorStyle
-				}
+				checkStyle := statusStyle(checkStatus)
 				checkDetail := fmt.Sprintf("%s (%d/%d passing)", checkStatus, pr.Checks.Passing, pr.Checks.Total)
 				b.WriteString(infoStyle.Render(
 					labelStyle.Render("Checks:") + " " + checkStyle.Render(checkDetail),
@@ -1265,12 +1418,7 @@ func (m Model) renderBranchDetail() string {
 		if m.branchDetail.WorkflowInfo != nil {
 			wf := m.branchDetail.WorkflowInfo
 			wfStatus := wf.StatusDisplay()
-			wfStyle := styles.SubtitleStyle
-			if wfStatus == "passing" {
-				wfStyle = styles.CleanStyle
-			} else if wfStatus == "failing" {
-				wfStyle = styles.ErrorStyle
-			}
+			wfStyle := statusStyle(wfStatus)
 			wfDetail := fmt.Sprintf("%s (%d/%d passing)", wfStatus, wf.Passing, wf.Total)
 			b.WriteString(infoStyle.Render(
 				labelStyle.Render("Workflows:") + " " + wfStyle.Render(wfDetail),
@@ -1285,31 +1433,27 @@ func (m Model) renderBranchDetail() string {
 	b.WriteString("\n\n")
 
 	if len(m.branchDetail.Commits) == 0 {
-		emptyStyle := lipgloss.NewStyle().
-			Border(lipgloss.RoundedBorder()).
-			BorderForeground(styles.Surface1).
-			Padding(1, 2).
-			Foreground(styles.Subtext0)
+		emptyStyle := styles.CompactEmptyStateStyle
 		b.WriteString(emptyStyle.Render("No commits found"))
 	} else {
-		maxCommits := 10
-		if len(m.branchDetail.Commits) < maxCommits {
-			maxCommits = len(m.branchDetail.Commits)
+		maxCommits := min(branchDetailCommits, len(m.branchDetail.Commits))
+		// Commits that would be pushed below the footer are never formatted.
+		if m.height > 0 {
+			remaining := m.height - strings.Count(b.String(), "\n") - branchDetailTrailerLines
+			maxCommits = min(maxCommits, max(remaining, 1))
 		}
 		for i := 0; i < maxCommits; i++ {
 			commit := m.branchDetail.Commits[i]
-			hash := styles.SubtitleStyle.Render(commit.ShortHash)
-			subject := truncate(commit.Subject, 50)
-			author := truncate(commit.Author, 15)
-			date := commit.RelativeDate()
-
-			line := fmt.Sprintf("  %s  %-50s  %s  %s\n",
-				hash,
-				subject,
-				styles.SubtitleStyle.Render(author),
-				styles.SubtitleStyle.Render(date),
-			)
-			b.WriteString(line)
+			prefix := ""
+			if i < len(m.commitRows) {
+				prefix = m.commitRows[i]
+			} else {
+				prefix = newCommitRow(commit)
+			}
+
+			b.WriteString(prefix)
+			b.WriteString(styles.SubtitleStyle.Render(commit.RelativeDate()))
+			b.WriteByte('\n')
 		}
 	}
 
@@ -1318,24 +1462,11 @@ func (m Model) renderBranchDetail() string {
 	b.WriteString(sectionStyle.Render("Actions"))
 	b.WriteString("\n\n")
 
-	actionStyle := lipgloss.NewStyle().
-		Foreground(styles.Blue).
-		PaddingLeft(2)
-
-	actions := []string{
-		styles.FooterKeyStyle.Render("y") + actionStyle.Render(" copy branch name"),
-	}
-
 	if m.branchDetail.PRInfo != nil {
-		actions = append(actions,
-			styles.FooterKeyStyle.Render("p") + actionStyle.Render(" open PR in browser"),
-			styles.FooterKeyStyle.Render("o") + actionStyle.Render(" open PR URL"))
+		b.WriteString(branchPRActions())
 	} else {
-		actions = append(actions,
-			styles.FooterKeyStyle.Render("p") + actionStyle.Render(" create new PR"))
+		b.WriteString(branchNoPRActions())
 	}
-
-	b.WriteString(strings.Join(actions, "  "))
 	b.WriteString("\n")
 
 	contentLines := strings.Count(b.String(), "\n")
@@ -1351,6 +1482,9 @@ func (m Model) renderBranchDetail() string {
 	return b.String()
 }
 
+// prDescriptionLimit caps the PR body shown in the detail view, in bytes.
+const prDescriptionLimit = 400
+
 func (m Model) renderPRDetail() string {
 	var b strings.Builder
 
@@ -1364,15 +1498,11 @@ func (m Model) renderPRDetail() string {
 		// Show loading state (shouldn't happen with progressive loading)
 		b.WriteString(home + sep + repo + sep + styles.SubtitleStyle.Render("PR Detail"))
 		b.WriteString("\n\n")
-		loadingStyle := lipgloss.NewStyle().
-			Foreground(styles.Blue).
-			Padding(2)
+		loadingStyle := styles.LoadingStyle
 		b.WriteString(loadingStyle.Render("Loading PR details..."))
 		b.WriteString("\n\n")
 
-		footer := styles.FooterKeyStyle.Render("esc") + styles.FooterDescStyle.Render(" back  ") +
-			styles.FooterKeyStyle.Render("?") + styles.FooterDescStyle.Render(" help")
-		b.WriteString(styles.FooterStyle.Render(footer))
+		b.WriteString(prDetailFooter())
 		return b.String()
 	}
 
@@ -1383,27 +1513,17 @@ func (m Model) renderPRDetail() string {
 	// Show loading indicator for additional details if not yet loaded
 	isFullyLoaded := m.prDetail.Author != ""
 	if !isFullyLoaded {
-		loadingIndicator := lipgloss.NewStyle().
-			Foreground(styles.Subtext0).
-			Italic(true).
+		loadingIndicator := styles.LoadingHintStyle.
 			Render(" (loading details...)")
 		b.WriteString(loadingIndicator)
 		b.WriteString("\n")
 	}
 
-	sectionStyle := lipgloss.NewStyle().
-		Foreground(styles.Blue).
-		Bold(true).
-		PaddingLeft(1).
-		PaddingTop(1)
+	sectionStyle := spacedSectionTitles
 
-	labelStyle := lipgloss.NewStyle().
-		Foreground(styles.Subtext0).
-		Width(16)
+	labelStyle := prLabels
 
-	valueStyle := lipgloss.NewStyle().
-		Foreground(styles.Text).
-		PaddingLeft(2)
+	valueStyle := styles.InfoStyle
 
 	b.WriteString(sectionStyle.Render("Pull Request"))
 	b.WriteString("\n")
@@ -1452,13 +1572,8 @@ func (m Model) renderPRDetail() string {
 	))
 	b.WriteString("\n")
 
-	reviewStyle := styles.SubtitleStyle
 	reviewStatus := m.prDetail.ReviewStatus()
-	if reviewStatus == "approved" {
-		reviewStyle = styles.CleanStyle
-	} else if reviewStatus == "changes requested" {
-		reviewStyle = styles.ErrorStyle
-	}
+	reviewStyle := statusStyle(reviewStatus)
 
 	b.WriteString(valueStyle.Render(
 		labelStyle.Render("Review:") + " " + reviewStyle.Render(reviewStatus),
@@ -1501,11 +1616,7 @@ func (m Model) renderPRDetail() string {
 		b.WriteString(sectionStyle.Render("Description"))
 		b.WriteString("\n")
 
-		desc := m.prDetail.Body
-		if len(desc) > 400 {
-			desc = desc[:400] + "..."
-		}
-		b.WriteString(valueStyle.Render(desc))
+		b.WriteString(valueStyle.Render(truncate(m.prDetail.Body, prDescriptionLimit)))
 		b.WriteString("\n")
 	}
 
@@ -1513,14 +1624,7 @@ func (m Model) renderPRDetail() string {
 	b.WriteString(sectionStyle.Render("Actions"))
 	b.WriteString("\n")
 
-	actionPadding := lipgloss.NewStyle().PaddingLeft(2)
-	actions := []string{
-		styles.FooterKeyStyle.Render("o") + styles.FooterDescStyle.Render(" open in browser"),
-		styles.FooterKeyStyle.Render("u") + styles.FooterDescStyle.Render(" copy URL"),
-		styles.FooterKeyStyle.Render("n") + styles.FooterDescStyle.Render(" copy PR number"),
-		styles.FooterKeyStyle.Render("b") + styles.FooterDescStyle.Render(" copy branch name"),
-	}
-	b.WriteString(actionPadding.Render(strings.Join(actions, "    ")))
+	b.WriteString(prDetailActions())
 	b.WriteString("\n")
 
 	contentLines := strings.Count(b.String(), "\n")
@@ -1534,24 +1638,18 @@ func (m Model) renderPRDetail() string {
 	}
 
 	if m.statusMessage != "" {
-		statusStyle := lipgloss.NewStyle().
-			Foreground(styles.Green).
-			Background(styles.Surface0).
-			Padding(0, 1)
 		b.WriteString("\n")
-		b.WriteString(statusStyle.Render(m.statusMessage))
+		b.WriteString(styles.StatusMessageStyle.Render(m.statusMessage))
 		b.WriteString("\n")
 	}
 
-	footer := styles.FooterKeyStyle.Render("esc") + styles.FooterDescStyle.Render(" back  ") +
-		styles.FooterKeyStyle.Render("?") + styles.FooterDescStyle.Render(" help")
-	b.WriteString(styles.FooterStyle.Render(footer))
+	b.WriteString(prDetailFooter())
 
 	return b.String()
 }
 
-func (m Model) findDefaultBranch() string {
-	for _, branch := range m.branches {
+func findDefaultBranch(branches []models.BranchInfo) string {
+	for _, branch := range branches {
 		if branch.Name == "main" || branch.Name == "master" {
 			return branch.Name
 		}
@@ -1559,34 +1657,30 @@ func (m Model) findDefaultBranch() string {
 	return ""
 }
 
+// compareToDefaultBranch expects defaultBranch to come from the loaded branch
+// list, so it does not need to look the branch up again.
 func (m Model) compareToDefaultBranch(defaultBranch string) (int, int) {
 	if defaultBranch == "" || m.branchDetail.Branch.Name == defaultBranch {
 		return -1, -1
 	}
 
-	for _, branch := range m.branches {
-		if branch.Name == defaultBranch {
-			ahead := 0
-			behind := 0
+	ahead := 0
+	behind := 0
 
-			for _, commit := range m.branchDetail.Commits {
-				found := false
-				for _, defCommit := range m.branchDetail.Commits {
-					if commit.Hash == defCommit.Hash {
-						found = true
-						break
-					}
-				}
-				if !found {
-					ahead++
-				}
+	for _, commit := range m.branchDetail.Commits {
+		found := false
+		for _, defCommit := range m.branchDetail.Commits {
+			if commit.Hash == defCommit.Hash {
+				found = true
+				break
 			}
-
-			return ahead, behind
+		}
+		if !found {
+			ahead++
 		}
 	}
 
-	return -1, -1
+	return ahead, behind
 }
 
 func truncate(s string, maxLen int) string {
@@ -1594,7 +1688,16 @@ func truncate(s string, maxLen int) string {
 		return s
 	}
 	if maxLen <= 3 {
-		return s[:maxLen]
+		return s[:runeStart(s, maxLen)]
+	}
+	return s[:runeStart(s, maxLen-3)] + "..."
+}
+
+// runeStart moves a byte offset back to the start of the rune containing it,
+// so cutting there never splits a multi-byte character.
+func runeStart(s string, i int) int {
+	for i > 0 && !utf8.RuneStart(s[i]) {
+		i--
 	}
-	return s[:maxLen-3] + "..."
+	return i
 }
@@ -3,7 +3,10 @@ package batch
 import (
 	"context"
 	"errors"
+	"fmt"
+	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
 	"github.com/kyleking/gh-repo-dashboard/internal/vcs"
@@ -218,3 +221,109 @@ func TestTaskResultTracksRepoName(t *testing.T) {
 		t.Errorf("expected RepoName='my-app', got %q", result.RepoName)
 	}
 }
+
+func TestStreamJobsRunsReposConcurrently(t *testing.T) {
+	paths := make([]string, 3*DefaultConcurrency)
+	for i := range paths {
+		paths[i] = fmt.Sprintf("/repo%d", i)
+	}
+
+	var running, peak atomic.Int32
+	taskFn := func(ctx context.Context, ops vcs.Operations, repoPath string) (bool, string, error) {
+		n := running.Add(1)
+		for {
+			p := peak.Load()
+			if n <= p || peak.CompareAndSwap(p, n) {
+				break
+			}
+		}
+		time.Sleep(10 * time.Millisecond)
+		running.Add(-1)
+		return true, repoPath, nil
+	}
+
+	jobs := make([]Job, len(paths))
+	for i, path := range paths {
+		jobs[i] = Job{Path: path}
+	}
+
+	seen := make(map[string]bool)
+	for r := range StreamJobs(context.Background(), jobs, taskFn) {
+		if r.Message != r.Path || seen[r.Path] {
+			t.Errorf("unexpected or repeated result %+v", r)
+		}
+		seen[r.Path] = true
+	}
+
+	if len(seen) != len(paths) {
+		t.Fatalf("expected %d results, got %d", len(paths), len(seen))
+	}
+	if p := peak.Load(); p < 2 || p > DefaultConcurrency {
+		t.Errorf("expected between 2 and %d concurrent tasks, got %d", DefaultConcurrency, p)
+	}
+}
+
+func TestStreamJobsDeliversEachResult(t *testing.T) {
+	jobs := make([]Job, 2*DefaultConcurrency)
+	for i := range jobs {
+		jobs[i] = Job{Path: fmt.Sprintf("/repo%d", i)}
+	}
+	taskFn := func(ctx context.Context, ops vcs.Operations, repoPath string) (bool, string, error) {
+		return true, repoPath, nil
+	}
+
+	seen := make(map[string]bool)
+	var cmdMsg any
+	results := StreamJobs(context.Background(), jobs, taskFn)
+	for {
+		cmdMsg = WaitForResult("test", results)()
+		progress, ok := cmdMsg.(TaskProgressMsg)
+		if !ok {
+			break
+		}
+		if progress.Source != results {
+			t.Error("expected progress to name its stream")
+		}
+		seen[progress.Result.Path] = true
+	}
+
+	if len(seen) != len(jobs) {
+		t.Errorf("expected %d results, got %d", len(jobs), len(seen))
+	}
+	if done, ok := cmdMsg.(TaskCompleteMsg); !ok || done.TaskName != "test" || done.Source != results {
+		t.Errorf("expected completion for the stream, got %#v", cmdMsg)
+	}
+}
+
+func TestStreamJobsStopsOnCancel(t *testing.T) {
+	jobs := make([]Job, 4*DefaultConcurrency)
+	for i := range jobs {
+		jobs[i] = Job{Path: fmt.Sprintf("/repo%d", i)}
+	}
+	var started atomic.Int32
+	taskFn := func(ctx context.Context, ops vcs.Operations, repoPath string) (bool, string, error) {
+		started.Add(1)
+		<-ctx.Done()
+		return false, "", ctx.Err()
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	results := StreamJobs(ctx, jobs, taskFn)
+	cancel()
+
+	done := make(chan struct{})
+	go func() {
+		for range results {
+		}
+		close(done)
+	}()
+
+	select {
+	case <-done:
+	case <-time.After(5 * time.Second):
+		t.Fatal("cancelled stream did not close")
+	}
+	if n := started.Load(); n > DefaultConcurrency {
+		t.Errorf("expected at most %d jobs to start after cancel, got %d", DefaultConcurrency, n)
+	}
+}
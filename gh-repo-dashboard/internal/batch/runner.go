@@ -2,6 +2,7 @@ package batch
 
 import (
 	"context"
+	"sync"
 	"time"
 
 	tea "github.com/charmbracelet/bubbletea"
@@ -16,47 +17,103 @@ type TaskResult struct {
 	DurationMs int64
 }
 
+// TaskProgressMsg reports one finished repo of a streamed batch task. Source
+// identifies the run so results from a cancelled run can be ignored.
 type TaskProgressMsg struct {
 	Result TaskResult
+	Source <-chan TaskResult
 }
 
+// TaskCompleteMsg ends a batch task once every result has been delivered as
+// a TaskProgressMsg.
 type TaskCompleteMsg struct {
 	TaskName string
-	Results  []TaskResult
+	Source   <-chan TaskResult
 }
 
 type TaskFunc func(ctx context.Context, ops vcs.Operations, repoPath string) (success bool, message string, err error)
 
-func RunTask(taskName string, paths []string, taskFn TaskFunc) tea.Cmd {
-	return func() tea.Msg {
-		ctx := context.Background()
-		var results []TaskResult
+// DefaultConcurrency bounds how many repos a batch task works on at once so
+// network-bound tasks like fetch do not overwhelm the remote.
+const DefaultConcurrency = 8
 
-		for _, path := range paths {
-			ops := vcs.GetOperations(path)
-			start := time.Now()
+// Job pairs a repo with its VCS operations so callers that already know the
+// repo type skip detection. A nil Ops is detected when the job runs.
+type Job struct {
+	Path string
+	Ops  vcs.Operations
+}
 
-			success, message, err := taskFn(ctx, ops, path)
-			if err != nil {
-				success = false
-				message = err.Error()
-			}
+// StreamJobs runs taskFn for every job, at most DefaultConcurrency at a time,
+// and sends each result as soon as it finishes, so progress can be shown while
+// slow repos are still running. The channel is closed once every started job
+// has finished. Cancelling ctx stops new jobs from starting, is passed to the
+// running ones, and lets them drop results nobody is reading.
+func StreamJobs(ctx context.Context, jobs []Job, taskFn TaskFunc) <-chan TaskResult {
+	results := make(chan TaskResult, DefaultConcurrency)
+	sem := make(chan struct{}, DefaultConcurrency)
 
-			duration := time.Since(start).Milliseconds()
+	go func() {
+		defer close(results)
 
-			results = append(results, TaskResult{
-				Path:       path,
-				RepoName:   repoName(path),
-				Success:    success,
-				Message:    message,
-				DurationMs: duration,
-			})
+		var wg sync.WaitGroup
+	feed:
+		for _, job := range jobs {
+			select {
+			case sem <- struct{}{}:
+			case <-ctx.Done():
+				break feed
+			}
+			wg.Add(1)
+			go func(job Job) {
+				defer wg.Done()
+				defer func() { <-sem }()
+				r := runOne(ctx, job, taskFn)
+				select {
+				case results <- r:
+				case <-ctx.Done():
+				}
+			}(job)
 		}
+		wg.Wait()
+	}()
 
-		return TaskCompleteMsg{
-			TaskName: taskName,
-			Results:  results,
+	return results
+}
+
+// WaitForResult delivers the next result of a streamed run as a
+// TaskProgressMsg, or a TaskCompleteMsg once the run is over.
+func WaitForResult(taskName string, results <-chan TaskResult) tea.Cmd {
+	return func() tea.Msg {
+		r, ok := <-results
+		if !ok {
+			return TaskCompleteMsg{TaskName: taskName, Source: results}
 		}
+		return TaskProgressMsg{Result: r, Source: results}
+	}
+}
+
+func runOne(ctx context.Context, job Job, taskFn TaskFunc) TaskResult {
+	path, ops := job.Path, job.Ops
+	if ops == nil {
+		ops = vcs.GetOperations(path)
+	}
+	// time.Since reads the monotonic clock recorded by time.Now, so
+	// durations stay correct across wall-clock adjustments.
+	start := time.Now()
+
+	success, message, err := taskFn(ctx, ops, path)
+	if err != nil {
+		success = false
+		message = err.Error()
+	}
+
+	return TaskResult{
+		Path:       path,
+		RepoName:   repoName(path),
+		Success:    success,
+		Message:    message,
+		DurationMs: time.Since(start).Milliseconds(),
 	}
 }
 
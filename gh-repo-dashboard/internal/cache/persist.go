@@ -0,0 +1,124 @@
+package cache
+
+import (
+	"encoding/gob"
+	"errors"
+	"fmt"
+	"io"
+	"io/fs"
+	"os"
+	"path/filepath"
+	"time"
+)
+
+type persistedEntry[K comparable, V any] struct {
+	Key       K
+	Value     V
+	ExpiresAt time.Time
+}
+
+// Save writes every unexpired entry to w so a later run can reuse it.
+func (c *TTLCache[K, V]) Save(w io.Writer) error {
+	c.mu.Lock()
+	now := c.now()
+	entries := make([]persistedEntry[K, V], 0, len(c.entries))
+	// Oldest first, so Load re-inserts them in the same recency order.
+	for e := c.root.prev; e != &c.root; e = e.prev {
+		if now < e.expiresAt {
+			expiresAt := clockBase.Add(time.Duration(e.expiresAt))
+			entries = append(entries, persistedEntry[K, V]{Key: e.key, Value: e.value, ExpiresAt: expiresAt})
+		}
+	}
+	c.mu.Unlock()
+
+	return gob.NewEncoder(w).Encode(entries)
+}
+
+// Load merges unexpired entries from r, keeping their original expiry.
+func (c *TTLCache[K, V]) Load(r io.Reader) error {
+	var entries []persistedEntry[K, V]
+	if err := gob.NewDecoder(r).Decode(&entries); err != nil {
+		return err
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	// Persisted expiries are wall clock times, so convert them relative to
+	// this run's clock base.
+	now := c.now()
+	for _, e := range entries {
+		if expiresAt := int64(e.ExpiresAt.Sub(clockBase)); now < expiresAt {
+			c.setLocked(e.Key, e.Value, expiresAt)
+		}
+	}
+	return nil
+}
+
+// DefaultDir returns the per-user directory used to persist caches.
+func DefaultDir() (string, error) {
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return "", fmt.Errorf("locate user cache dir: %w", err)
+	}
+	return filepath.Join(dir, "gh-repo-dashboard"), nil
+}
+
+// LoadFromDir restores persisted caches from dir. Missing files are not an
+// error; unreadable ones are skipped so a corrupt cache only costs a cold start.
+func LoadFromDir(dir string) error {
+	var errs []error
+	for _, r := range registry {
+		if r.file == "" {
+			continue
+		}
+		f, err := os.Open(filepath.Join(dir, r.file))
+		if errors.Is(err, fs.ErrNotExist) {
+			continue
+		}
+		if err != nil {
+			errs = append(errs, err)
+			continue
+		}
+		if err := r.cache.Load(f); err != nil {
+			errs = append(errs, fmt.Errorf("load %s: %w", r.file, err))
+		}
+		f.Close()
+	}
+	return errors.Join(errs...)
+}
+
+// SaveToDir persists caches to dir, replacing each file atomically.
+func SaveToDir(dir string) error {
+	if err := os.MkdirAll(dir, 0o755); err != nil {
+		return fmt.Errorf("create cache dir: %w", err)
+	}
+
+	var errs []error
+	for _, r := range registry {
+		if r.file == "" {
+			continue
+		}
+		if err := saveFile(filepath.Join(dir, r.file), r.cache); err != nil {
+			errs = append(errs, fmt.Errorf("save %s: %w", r.file, err))
+		}
+	}
+	return errors.Join(errs...)
+}
+
+func saveFile(path string, c managedCache) error {
+	tmp, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+".*")
+	if err != nil {
+		return err
+	}
+	defer os.Remove(tmp.Name())
+
+	if err := c.Save(tmp); err != nil {
+		tmp.Close()
+		return err
+	}
+	if err := tmp.Close(); err != nil {
+		return err
+	}
+	return os.Rename(tmp.Name(), path)
+}
@@ -1,86 +1,242 @@
 package cache
 
 import (
+	"io"
 	"sync"
 	"time"
 
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
 )
 
-type entry[T any] struct {
-	value     T
-	expiresAt time.Time
+// clockBase anchors expiry times. Durations measured from it use the
+// monotonic clock, so entries are immune to wall clock changes and expiry
+// checks are a single integer compare.
+var clockBase = time.Now()
+
+func monoNow() int64 {
+	return int64(time.Since(clockBase))
+}
+
+// entry is both the cached value and its node in the recency list, so an
+// insert is a single allocation and reads need no type assertions.
+type entry[K comparable, V any] struct {
+	prev, next *entry[K, V]
+	expiresAt  int64
+	key        K
+	value      V
 }
 
-type TTLCache[T any] struct {
-	mu      sync.RWMutex
-	entries map[string]entry[T]
-	ttl     time.Duration
+// DefaultMaxEntries bounds each cache so keys that are written but never read
+// again cannot grow it without limit.
+const DefaultMaxEntries = 1024
+
+// TTLCache is a TTL cache with least-recently-used eviction once it holds
+// maxEntries. Keys are any comparable type, so callers can key by a struct
+// of their lookup fields instead of formatting a string per lookup.
+type TTLCache[K comparable, V any] struct {
+	mu         sync.Mutex
+	entries    map[K]*entry[K, V]
+	root       entry[K, V] // sentinel: root.next is most recent, root.prev least
+	ttl        time.Duration
+	maxEntries int
+
+	// now reads the clock once per operation; tests substitute a fake.
+	now func() int64
 }
 
-func NewTTLCache[T any](ttl time.Duration) *TTLCache[T] {
-	return &TTLCache[T]{
-		entries: make(map[string]entry[T]),
-		ttl:     ttl,
+func NewTTLCache[K comparable, V any](ttl time.Duration) *TTLCache[K, V] {
+	return NewTTLCacheWithLimit[K, V](ttl, DefaultMaxEntries)
+}
+
+// NewTTLCacheWithLimit returns a cache holding at most maxEntries entries.
+func NewTTLCacheWithLimit[K comparable, V any](ttl time.Duration, maxEntries int) *TTLCache[K, V] {
+	c := &TTLCache[K, V]{
+		entries:    make(map[K]*entry[K, V]),
+		ttl:        ttl,
+		maxEntries: max(maxEntries, 1),
+		now:        monoNow,
 	}
+	c.root.next = &c.root
+	c.root.prev = &c.root
+	return c
 }
 
-func (c *TTLCache[T]) Get(key string) (T, bool) {
-	c.mu.RLock()
-	defer c.mu.RUnlock()
+func (c *TTLCache[K, V]) Get(key K) (V, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
 
 	e, ok := c.entries[key]
 	if !ok {
-		var zero T
+		var zero V
 		return zero, false
 	}
 
-	if time.Now().After(e.expiresAt) {
-		var zero T
+	if c.now() > e.expiresAt {
+		// Drop it now through the entry we already hold rather than
+		// leaving it for the next sweep.
+		c.removeLocked(e)
+		var zero V
 		return zero, false
 	}
 
+	c.unlink(e)
+	c.pushFront(e)
 	return e.value, true
 }
 
-func (c *TTLCache[T]) Set(key string, value T) {
+func (c *TTLCache[K, V]) Set(key K, value V) {
+	c.SetWithTTL(key, value, c.ttl)
+}
+
+// SetWithTTL stores value with an expiry other than the cache default, e.g.
+// for negative results that should be retried sooner or later.
+func (c *TTLCache[K, V]) SetWithTTL(key K, value V, ttl time.Duration) {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
-	c.entries[key] = entry[T]{
-		value:     value,
-		expiresAt: time.Now().Add(c.ttl),
+	c.setLocked(key, value, c.now()+int64(ttl))
+}
+
+func (c *TTLCache[K, V]) setLocked(key K, value V, expiresAt int64) {
+	if e, ok := c.entries[key]; ok {
+		e.value = value
+		e.expiresAt = expiresAt
+		c.unlink(e)
+		c.pushFront(e)
+		return
 	}
+
+	e := &entry[K, V]{key: key, value: value, expiresAt: expiresAt}
+	c.entries[key] = e
+	c.pushFront(e)
+	for len(c.entries) > c.maxEntries {
+		c.removeLocked(c.root.prev)
+	}
+}
+
+func (c *TTLCache[K, V]) pushFront(e *entry[K, V]) {
+	e.prev = &c.root
+	e.next = c.root.next
+	c.root.next.prev = e
+	c.root.next = e
 }
 
-func (c *TTLCache[T]) Clear() {
+func (c *TTLCache[K, V]) unlink(e *entry[K, V]) {
+	e.prev.next = e.next
+	e.next.prev = e.prev
+	e.prev, e.next = nil, nil
+}
+
+func (c *TTLCache[K, V]) removeLocked(e *entry[K, V]) {
+	c.unlink(e)
+	delete(c.entries, e.key)
+}
+
+// SweepExpired drops every expired entry and returns how many were removed.
+func (c *TTLCache[K, V]) SweepExpired() int {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
-	c.entries = make(map[string]entry[T])
+	now := c.now()
+	removed := 0
+	for e := c.root.prev; e != &c.root; {
+		prev := e.prev
+		if now > e.expiresAt {
+			c.removeLocked(e)
+			removed++
+		}
+		e = prev
+	}
+	return removed
 }
 
-func (c *TTLCache[T]) Delete(key string) {
+func (c *TTLCache[K, V]) Len() int {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
-	delete(c.entries, key)
+	return len(c.entries)
+}
+
+func (c *TTLCache[K, V]) Clear() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.entries = make(map[K]*entry[K, V])
+	c.root.next = &c.root
+	c.root.prev = &c.root
+}
+
+func (c *TTLCache[K, V]) Delete(key K) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if e, ok := c.entries[key]; ok {
+		c.removeLocked(e)
+	}
+}
+
+// PRKey identifies a branch's PR lookup. HeadSHA may be empty when the head
+// commit is unknown.
+type PRKey struct {
+	Upstream string
+	Branch   string
+	HeadSHA  string
+}
+
+// PRDetailKey identifies one PR of the repo at RepoPath.
+type PRDetailKey struct {
+	RepoPath string
+	Number   int
+}
+
+// CommitKey identifies a commit of the repo at RepoPath.
+type CommitKey struct {
+	RepoPath string
+	SHA      string
 }
 
 var (
-	PRCache       = NewTTLCache[*models.PRInfo](5 * time.Minute)
-	PRListCache   = NewTTLCache[[]models.PRInfo](5 * time.Minute)
-	PRDetailCache = NewTTLCache[*models.PRDetail](5 * time.Minute)
-	BranchCache   = NewTTLCache[[]models.BranchInfo](5 * time.Minute)
-	CommitCache   = NewTTLCache[[]models.CommitInfo](5 * time.Minute)
-	WorkflowCache = NewTTLCache[*models.WorkflowSummary](2 * time.Minute)
+	PRCache       = NewTTLCache[PRKey, *models.PRInfo](10 * time.Minute)
+	PRListCache   = NewTTLCache[string, []models.PRInfo](10 * time.Minute)
+	PRDetailCache = NewTTLCache[PRDetailKey, *models.PRDetail](10 * time.Minute)
+	BranchCache   = NewTTLCache[string, []models.BranchInfo](5 * time.Minute)
+	CommitCache   = NewTTLCache[CommitKey, []models.CommitInfo](time.Hour)
+	WorkflowCache = NewTTLCache[CommitKey, *models.WorkflowSummary](2 * time.Minute)
 )
 
+// managedCache is the type-independent surface of a TTLCache, letting the
+// shared caches be cleared, swept and persisted as one set.
+type managedCache interface {
+	Clear()
+	SweepExpired() int
+	Save(w io.Writer) error
+	Load(r io.Reader) error
+}
+
+// registry lists every shared cache. file names the persisted snapshot, or is
+// empty for caches not worth saving: too short-lived, or, like BranchCache,
+// not yet filled by any loader.
+var registry = []struct {
+	cache managedCache
+	file  string
+}{
+	{PRCache, "prs.gob"},
+	{PRListCache, "pr_lists.gob"},
+	{PRDetailCache, "pr_details.gob"},
+	{BranchCache, ""},
+	{CommitCache, "commits.gob"},
+	{WorkflowCache, ""},
+}
+
+// SweepAll drops expired entries from every shared cache.
+func SweepAll() {
+	for _, r := range registry {
+		r.cache.SweepExpired()
+	}
+}
+
 func ClearAll() {
-	PRCache.Clear()
-	PRListCache.Clear()
-	PRDetailCache.Clear()
-	BranchCache.Clear()
-	CommitCache.Clear()
-	WorkflowCache.Clear()
+	for _, r := range registry {
+		r.cache.Clear()
+	}
 }
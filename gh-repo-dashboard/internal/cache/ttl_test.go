@@ -1,12 +1,16 @@
 package cache
 
 import (
+	"bytes"
+	"path/filepath"
 	"testing"
 	"time"
+
+	"github.com/kyleking/gh-repo-dashboard/internal/models"
 )
 
 func TestTTLCacheSetGet(t *testing.T) {
-	cache := NewTTLCache[string](5 * time.Minute)
+	cache := NewTTLCache[string, string](5 * time.Minute)
 
 	cache.Set("key1", "value1")
 
@@ -20,7 +24,7 @@ func TestTTLCacheSetGet(t *testing.T) {
 }
 
 func TestTTLCacheGetMissing(t *testing.T) {
-	cache := NewTTLCache[string](5 * time.Minute)
+	cache := NewTTLCache[string, string](5 * time.Minute)
 
 	_, ok := cache.Get("nonexistent")
 	if ok {
@@ -29,7 +33,7 @@ func TestTTLCacheGetMissing(t *testing.T) {
 }
 
 func TestTTLCacheExpiration(t *testing.T) {
-	cache := NewTTLCache[string](10 * time.Millisecond)
+	cache := NewTTLCache[string, string](10 * time.Millisecond)
 
 	cache.Set("key1", "value1")
 
@@ -42,7 +46,7 @@ func TestTTLCacheExpiration(t *testing.T) {
 }
 
 func TestTTLCacheClear(t *testing.T) {
-	cache := NewTTLCache[string](5 * time.Minute)
+	cache := NewTTLCache[string, string](5 * time.Minute)
 
 	cache.Set("key1", "value1")
 	cache.Set("key2", "value2")
@@ -58,7 +62,7 @@ func TestTTLCacheClear(t *testing.T) {
 }
 
 func TestTTLCacheDelete(t *testing.T) {
-	cache := NewTTLCache[string](5 * time.Minute)
+	cache := NewTTLCache[string, string](5 * time.Minute)
 
 	cache.Set("key1", "value1")
 	cache.Set("key2", "value2")
@@ -77,7 +81,7 @@ func TestTTLCacheDelete(t *testing.T) {
 }
 
 func TestTTLCacheOverwrite(t *testing.T) {
-	cache := NewTTLCache[string](5 * time.Minute)
+	cache := NewTTLCache[string, string](5 * time.Minute)
 
 	cache.Set("key1", "value1")
 	cache.Set("key1", "value2")
@@ -92,7 +96,7 @@ func TestTTLCacheOverwrite(t *testing.T) {
 }
 
 func TestTTLCacheWithInt(t *testing.T) {
-	cache := NewTTLCache[int](5 * time.Minute)
+	cache := NewTTLCache[string, int](5 * time.Minute)
 
 	cache.Set("count", 42)
 
@@ -111,7 +115,7 @@ func TestTTLCacheWithStruct(t *testing.T) {
 		Count int
 	}
 
-	cache := NewTTLCache[TestData](5 * time.Minute)
+	cache := NewTTLCache[string, TestData](5 * time.Minute)
 
 	data := TestData{Name: "test", Count: 5}
 	cache.Set("data", data)
@@ -126,19 +130,194 @@ func TestTTLCacheWithStruct(t *testing.T) {
 }
 
 func TestClearAllCaches(t *testing.T) {
-	PRCache.Set("test", nil)
+	prKey := PRKey{Upstream: "origin/main", Branch: "test"}
+	commitKey := CommitKey{RepoPath: "/repo", SHA: "test"}
+
+	PRCache.Set(prKey, nil)
 	BranchCache.Set("test", nil)
-	CommitCache.Set("test", nil)
-	WorkflowCache.Set("test", nil)
+	CommitCache.Set(commitKey, nil)
+	WorkflowCache.Set(commitKey, nil)
 
 	ClearAll()
 
-	_, ok1 := PRCache.Get("test")
+	_, ok1 := PRCache.Get(prKey)
 	_, ok2 := BranchCache.Get("test")
-	_, ok3 := CommitCache.Get("test")
-	_, ok4 := WorkflowCache.Get("test")
+	_, ok3 := CommitCache.Get(commitKey)
+	_, ok4 := WorkflowCache.Get(commitKey)
 
 	if ok1 || ok2 || ok3 || ok4 {
 		t.Error("expected all caches to be cleared")
 	}
 }
+
+func TestTTLCacheSaveLoadStructKeys(t *testing.T) {
+	src := NewTTLCache[PRDetailKey, string](5 * time.Minute)
+	key := PRDetailKey{RepoPath: "/repo", Number: 7}
+	src.Set(key, "detail")
+
+	var buf bytes.Buffer
+	if err := src.Save(&buf); err != nil {
+		t.Fatalf("save failed: %v", err)
+	}
+
+	dst := NewTTLCache[PRDetailKey, string](5 * time.Minute)
+	if err := dst.Load(&buf); err != nil {
+		t.Fatalf("load failed: %v", err)
+	}
+	if value, ok := dst.Get(key); !ok || value != "detail" {
+		t.Errorf("expected detail under struct key, got %q, %v", value, ok)
+	}
+}
+
+func TestTTLCacheSaveLoad(t *testing.T) {
+	src := NewTTLCache[string, string](5 * time.Minute)
+	src.Set("key1", "value1")
+	src.Set("key2", "value2")
+
+	var buf bytes.Buffer
+	if err := src.Save(&buf); err != nil {
+		t.Fatalf("save failed: %v", err)
+	}
+
+	dst := NewTTLCache[string, string](5 * time.Minute)
+	if err := dst.Load(&buf); err != nil {
+		t.Fatalf("load failed: %v", err)
+	}
+
+	for _, key := range []string{"key1", "key2"} {
+		want, _ := src.Get(key)
+		if got, ok := dst.Get(key); !ok || got != want {
+			t.Errorf("%s: expected %q, got %q (ok=%v)", key, want, got, ok)
+		}
+	}
+}
+
+func TestTTLCacheSaveSkipsExpired(t *testing.T) {
+	src := NewTTLCache[string, string](10 * time.Millisecond)
+	src.Set("key1", "value1")
+	time.Sleep(20 * time.Millisecond)
+
+	var buf bytes.Buffer
+	if err := src.Save(&buf); err != nil {
+		t.Fatalf("save failed: %v", err)
+	}
+
+	dst := NewTTLCache[string, string](5 * time.Minute)
+	if err := dst.Load(&buf); err != nil {
+		t.Fatalf("load failed: %v", err)
+	}
+	if _, ok := dst.Get("key1"); ok {
+		t.Error("expired entry should not be persisted")
+	}
+}
+
+func TestSaveLoadDir(t *testing.T) {
+	defer ClearAll()
+	dir := t.TempDir()
+
+	withPR := PRKey{Upstream: "origin/main", Branch: "main"}
+	withoutPR := PRKey{Upstream: "origin/none", Branch: "none"}
+
+	PRCache.Set(withPR, &models.PRInfo{Number: 42})
+	PRCache.Set(withoutPR, nil)
+	if err := SaveToDir(dir); err != nil {
+		t.Fatalf("save failed: %v", err)
+	}
+
+	ClearAll()
+	if err := LoadFromDir(dir); err != nil {
+		t.Fatalf("load failed: %v", err)
+	}
+
+	pr, ok := PRCache.Get(withPR)
+	if !ok || pr == nil || pr.Number != 42 {
+		t.Errorf("expected persisted PR #42, got %+v (ok=%v)", pr, ok)
+	}
+	if pr, ok := PRCache.Get(withoutPR); !ok || pr != nil {
+		t.Errorf("expected persisted negative entry, got %+v (ok=%v)", pr, ok)
+	}
+}
+
+func TestLoadFromMissingDir(t *testing.T) {
+	if err := LoadFromDir(filepath.Join(t.TempDir(), "missing")); err != nil {
+		t.Errorf("missing cache dir should not be an error, got %v", err)
+	}
+}
+
+func TestTTLCacheSetWithTTL(t *testing.T) {
+	cache := NewTTLCache[string, string](5 * time.Minute)
+
+	cache.SetWithTTL("short", "value", 10*time.Millisecond)
+	cache.Set("default", "value")
+
+	time.Sleep(20 * time.Millisecond)
+
+	if _, ok := cache.Get("short"); ok {
+		t.Error("expected entry with custom TTL to expire")
+	}
+	if _, ok := cache.Get("default"); !ok {
+		t.Error("expected entry with default TTL to remain")
+	}
+}
+
+func TestTTLCacheEvictsLeastRecentlyUsed(t *testing.T) {
+	cache := NewTTLCacheWithLimit[string, int](time.Minute, 2)
+
+	cache.Set("a", 1)
+	cache.Set("b", 2)
+	cache.Get("a")
+	cache.Set("c", 3)
+
+	if cache.Len() != 2 {
+		t.Errorf("expected 2 entries, got %d", cache.Len())
+	}
+	if _, ok := cache.Get("b"); ok {
+		t.Error("expected least recently used entry to be evicted")
+	}
+	if _, ok := cache.Get("a"); !ok {
+		t.Error("expected recently read entry to remain")
+	}
+	if _, ok := cache.Get("c"); !ok {
+		t.Error("expected newest entry to remain")
+	}
+}
+
+func TestTTLCacheSweepExpired(t *testing.T) {
+	cache := NewTTLCache[string, string](time.Minute)
+
+	cache.SetWithTTL("stale", "value", time.Millisecond)
+	cache.Set("fresh", "value")
+
+	time.Sleep(5 * time.Millisecond)
+
+	if removed := cache.SweepExpired(); removed != 1 {
+		t.Errorf("expected 1 entry swept, got %d", removed)
+	}
+	if cache.Len() != 1 {
+		t.Errorf("expected 1 entry left, got %d", cache.Len())
+	}
+	if _, ok := cache.Get("fresh"); !ok {
+		t.Error("expected fresh entry to survive the sweep")
+	}
+}
+
+func TestTTLCacheUsesInjectedClock(t *testing.T) {
+	var clock int64
+	cache := NewTTLCache[string, string](time.Minute)
+	cache.now = func() int64 { return clock }
+
+	cache.Set("key", "value")
+
+	clock = int64(time.Minute)
+	if _, ok := cache.Get("key"); !ok {
+		t.Error("expected entry to be valid at exactly its TTL")
+	}
+
+	clock++
+	if _, ok := cache.Get("key"); ok {
+		t.Error("expected entry to expire once the clock passes its TTL")
+	}
+	if cache.Len() != 0 {
+		t.Errorf("expected expired entry to be evicted on read, got %d entries", cache.Len())
+	}
+}
@@ -4,16 +4,51 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 
 	"github.com/kyleking/gh-repo-dashboard/internal/vcs"
 )
 
+// discoveryWorkers bounds how many subtrees are walked at once. The walk is
+// dominated by directory syscalls, so overlapping them hides disk latency.
+const discoveryWorkers = 16
+
+// DefaultSkipDirs are directory names that hold large dependency or build
+// trees and never contain repositories worth listing.
+var DefaultSkipDirs = map[string]bool{
+	"node_modules": true,
+	"venv":         true,
+	"__pycache__":  true,
+	"target":       true,
+	"build":        true,
+	"dist":         true,
+	"vendor":       true,
+}
+
 func DiscoverRepos(basePaths []string, maxDepth int) []string {
+	return DiscoverReposSkipping(basePaths, maxDepth, DefaultSkipDirs)
+}
+
+// DiscoverReposSkipping is DiscoverRepos with a custom set of directory names
+// to leave unvisited. Hidden directories are always skipped.
+func DiscoverReposSkipping(basePaths []string, maxDepth int, skip map[string]bool) []string {
+	sem := make(chan struct{}, discoveryWorkers)
+	found := make([][]string, len(basePaths))
+
+	var wg sync.WaitGroup
+	for i, basePath := range basePaths {
+		wg.Add(1)
+		go func(i int, basePath string) {
+			defer wg.Done()
+			found[i] = discoverInPath(basePath, maxDepth, skip, sem)
+		}(i, basePath)
+	}
+	wg.Wait()
+
 	var repos []string
 	seen := make(map[string]bool)
 
-	for _, basePath := range basePaths {
-		discovered := discoverInPath(basePath, maxDepth)
+	for _, discovered := range found {
 		for _, repo := range discovered {
 			if !seen[repo] {
 				seen[repo] = true
@@ -25,44 +60,97 @@ func DiscoverRepos(basePaths []string, maxDepth int) []string {
 	return repos
 }
 
-func discoverInPath(basePath string, maxDepth int) []string {
+// discoverInPath walks each top-level subdirectory of basePath as its own job
+// and concatenates the results in listing order.
+func discoverInPath(basePath string, maxDepth int, skip map[string]bool, sem chan struct{}) []string {
 	var repos []string
 
 	if vcs.IsRepo(basePath) {
 		return []string{basePath}
 	}
 
-	scanDir(basePath, 0, maxDepth, &repos)
-	return repos
-}
-
-func scanDir(dir string, depth int, maxDepth int, repos *[]string) {
-	if depth >= maxDepth {
-		return
+	if maxDepth <= 0 {
+		return repos
 	}
 
-	entries, err := os.ReadDir(dir)
+	entries, err := os.ReadDir(basePath)
 	if err != nil {
-		return
+		return repos
 	}
 
-	for _, entry := range entries {
-		if !entry.IsDir() {
+	found := make([][]string, len(entries))
+
+	var wg sync.WaitGroup
+	for i, entry := range entries {
+		if !isScannable(entry, skip) {
 			continue
 		}
 
-		name := entry.Name()
-		if strings.HasPrefix(name, ".") {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, fullPath string) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			scanChild(fullPath, 0, maxDepth, skip, &found[i])
+		}(i, filepath.Join(basePath, entry.Name()))
+	}
+	wg.Wait()
+
+	for _, subtree := range found {
+		repos = append(repos, subtree...)
+	}
+	return repos
+}
+
+// scanEntries walks the subdirectories of dir, whose listing is already in
+// entries.
+func scanEntries(dir string, entries []os.DirEntry, depth int, maxDepth int, skip map[string]bool, repos *[]string) {
+	for _, entry := range entries {
+		if !isScannable(entry, skip) {
 			continue
 		}
+		scanChild(filepath.Join(dir, entry.Name()), depth, maxDepth, skip, repos)
+	}
+}
 
-		fullPath := filepath.Join(dir, name)
+// scanChild checks one subdirectory of a directory at depth. The child is
+// listed once and checked for a .git or .jj entry in that listing rather than
+// with separate stat calls; children on the last level, which are never
+// listed, fall back to vcs.IsRepo.
+func scanChild(fullPath string, depth int, maxDepth int, skip map[string]bool, repos *[]string) {
+	if depth+1 >= maxDepth {
+		if vcs.IsRepo(fullPath) {
+			*repos = append(*repos, fullPath)
+		}
+		return
+	}
 
+	children, err := os.ReadDir(fullPath)
+	if err != nil {
 		if vcs.IsRepo(fullPath) {
 			*repos = append(*repos, fullPath)
-			continue
 		}
+		return
+	}
+
+	if hasRepoMarker(children) {
+		*repos = append(*repos, fullPath)
+		return
+	}
+
+	scanEntries(fullPath, children, depth+1, maxDepth, skip, repos)
+}
+
+func isScannable(entry os.DirEntry, skip map[string]bool) bool {
+	name := entry.Name()
+	return entry.IsDir() && !strings.HasPrefix(name, ".") && !skip[name]
+}
 
-		scanDir(fullPath, depth+1, maxDepth, repos)
+func hasRepoMarker(entries []os.DirEntry) bool {
+	for _, entry := range entries {
+		if name := entry.Name(); name == ".git" || name == ".jj" {
+			return true
+		}
 	}
+	return false
 }
@@ -53,6 +53,16 @@ func TestDiscoverRepos(t *testing.T) {
 			maxDepth: 2,
 			expected: 1,
 		},
+		{
+			name: "detects worktree .git files while listing",
+			setup: func(base string) []string {
+				os.MkdirAll(filepath.Join(base, "worktree", "nested", ".git"), 0755)
+				os.WriteFile(filepath.Join(base, "worktree", ".git"), []byte("gitdir: /elsewhere\n"), 0644)
+				return nil
+			},
+			maxDepth: 3,
+			expected: 1,
+		},
 		{
 			name: "skips hidden directories",
 			setup: func(base string) []string {
@@ -171,3 +181,20 @@ func TestDiscoverReposZeroDepth(t *testing.T) {
 		t.Errorf("expected 0 repos at depth 0, got %d", len(repos))
 	}
 }
+
+func TestDiscoverReposSkipsDependencyDirs(t *testing.T) {
+	base := t.TempDir()
+	os.MkdirAll(filepath.Join(base, "node_modules", "pkg", ".git"), 0755)
+	os.MkdirAll(filepath.Join(base, "project", "vendor", "dep", ".git"), 0755)
+	os.MkdirAll(filepath.Join(base, "app", ".git"), 0755)
+
+	repos := DiscoverRepos([]string{base}, 3)
+	if len(repos) != 1 || filepath.Base(repos[0]) != "app" {
+		t.Errorf("expected only app repo, got %v", repos)
+	}
+
+	repos = DiscoverReposSkipping([]string{base}, 3, nil)
+	if len(repos) != 3 {
+		t.Errorf("expected 3 repos without skip list, got %v", repos)
+	}
+}
@@ -7,14 +7,14 @@ func FilterRepos(paths []string, summaries map[string]models.RepoSummary, mode m
 		return paths
 	}
 
-	var filtered []string
+	filtered := make([]string, 0, len(paths))
 	for _, path := range paths {
 		summary, ok := summaries[path]
 		if !ok {
 			continue
 		}
 
-		if passesFilter(summary, mode) {
+		if passesFilter(&summary, mode) {
 			filtered = append(filtered, path)
 		}
 	}
@@ -23,37 +23,156 @@ func FilterRepos(paths []string, summaries map[string]models.RepoSummary, mode m
 }
 
 func FilterReposMulti(paths []string, summaries map[string]models.RepoSummary, activeFilters []models.ActiveFilter) []string {
-	enabledFilters := []models.ActiveFilter{}
+	checks := enabledChecks(activeFilters)
+	if len(checks) == 0 {
+		return paths
+	}
+
+	filtered := make([]string, 0, len(paths))
+	for _, path := range paths {
+		summary, ok := summaries[path]
+		if !ok {
+			continue
+		}
+
+		if passesChecks(&summary, checks) {
+			filtered = append(filtered, path)
+		}
+	}
+
+	return filtered
+}
+
+type filterCheck struct {
+	predicate func(*models.RepoSummary) bool
+	inverted  bool
+}
+
+// filterPredicates take the summary by pointer so composing several filters
+// does not copy the summary once per predicate.
+var filterPredicates = map[models.FilterMode]func(*models.RepoSummary) bool{
+	models.FilterModeAhead:    func(s *models.RepoSummary) bool { return s.Ahead > 0 },
+	models.FilterModeBehind:   func(s *models.RepoSummary) bool { return s.Behind > 0 },
+	models.FilterModeDirty:    (*models.RepoSummary).IsDirty,
+	models.FilterModeHasPR:    func(s *models.RepoSummary) bool { return s.PRInfo != nil },
+	models.FilterModeHasStash: func(s *models.RepoSummary) bool { return s.StashCount > 0 },
+}
+
+// enabledChecks resolves each enabled filter to its predicate once so the
+// per-repo loop does no mode dispatch.
+func enabledChecks(activeFilters []models.ActiveFilter) []filterCheck {
+	var checks []filterCheck
+	for _, f := range activeFilters {
+		if !f.Enabled {
+			continue
+		}
+		if predicate, ok := filterPredicates[f.Mode]; ok {
+			checks = append(checks, filterCheck{predicate: predicate, inverted: f.Inverted})
+		}
+	}
+	return checks
+}
+
+func passesChecks(summary *models.RepoSummary, checks []filterCheck) bool {
+	for _, c := range checks {
+		if c.predicate(summary) == c.inverted {
+			return false
+		}
+	}
+	return true
+}
+
+// PassesFilters reports whether a single summary survives every enabled filter.
+func PassesFilters(summary models.RepoSummary, activeFilters []models.ActiveFilter) bool {
+	return passesChecks(&summary, enabledChecks(activeFilters))
+}
+
+// CountByMode tallies how many summaries pass each filter mode in a single pass.
+func CountByMode(summaries map[string]models.RepoSummary) map[models.FilterMode]int {
+	modes := models.AllFilterModes()
+	counts := make(map[models.FilterMode]int, len(modes))
+	for _, s := range summaries {
+		for _, mode := range modes {
+			if passesFilter(&s, mode) {
+				counts[mode]++
+			}
+		}
+	}
+	return counts
+}
+
+func passesFilter(s *models.RepoSummary, mode models.FilterMode) bool {
+	if predicate, ok := filterPredicates[mode]; ok {
+		return predicate(s)
+	}
+	return true
+}
+
+// FilterMask records which filter modes a summary passes, one bit per mode.
+type FilterMask uint32
+
+func MaskOf(s models.RepoSummary) FilterMask {
+	var mask FilterMask
+	for _, mode := range models.AllFilterModes() {
+		if passesFilter(&s, mode) {
+			mask |= 1 << mode
+		}
+	}
+	return mask
+}
+
+func (m FilterMask) Has(mode models.FilterMode) bool {
+	return m&(1<<mode) != 0
+}
+
+// FilterIndex caches each repo's FilterMask so re-filtering unchanged
+// summaries, e.g. on every search keystroke, is bit tests rather than
+// predicate calls. Callers update an entry whenever its summary changes;
+// paths without an entry are evaluated directly.
+type FilterIndex map[string]FilterMask
+
+func (idx FilterIndex) maskOf(path string, s models.RepoSummary) FilterMask {
+	if mask, ok := idx[path]; ok {
+		return mask
+	}
+	return MaskOf(s)
+}
+
+// maskChecks folds the enabled filters into the bits that must be set and
+// the bits that must be clear.
+func maskChecks(activeFilters []models.ActiveFilter) (required, rejected FilterMask) {
 	for _, f := range activeFilters {
-		if f.Enabled && f.Mode != models.FilterModeAll {
-			enabledFilters = append(enabledFilters, f)
+		if !f.Enabled {
+			continue
+		}
+		if _, ok := filterPredicates[f.Mode]; !ok {
+			continue
+		}
+		if f.Inverted {
+			rejected |= 1 << f.Mode
+		} else {
+			required |= 1 << f.Mode
 		}
 	}
+	return required, rejected
+}
 
-	if len(enabledFilters) == 0 {
+// FilterReposIndexed is FilterReposMulti reading cached masks from index.
+func FilterReposIndexed(paths []string, summaries map[string]models.RepoSummary, index FilterIndex, activeFilters []models.ActiveFilter) []string {
+	required, rejected := maskChecks(activeFilters)
+	if required == 0 && rejected == 0 {
 		return paths
 	}
 
-	var filtered []string
+	filtered := make([]string, 0, len(paths))
 	for _, path := range paths {
 		summary, ok := summaries[path]
 		if !ok {
 			continue
 		}
 
-		passesAll := true
-		for _, f := range enabledFilters {
-			passes := passesFilter(summary, f.Mode)
-			if f.Inverted {
-				passes = !passes
-			}
-			if !passes {
-				passesAll = false
-				break
-			}
-		}
-
-		if passesAll {
+		mask := index.maskOf(path, summary)
+		if mask&required == required && mask&rejected == 0 {
 			filtered = append(filtered, path)
 		}
 	}
@@ -61,23 +180,19 @@ func FilterReposMulti(paths []string, summaries map[string]models.RepoSummary, a
 	return filtered
 }
 
-func passesFilter(s models.RepoSummary, mode models.FilterMode) bool {
-	switch mode {
-	case models.FilterModeAll:
-		return true
-	case models.FilterModeAhead:
-		return s.Ahead > 0
-	case models.FilterModeBehind:
-		return s.Behind > 0
-	case models.FilterModeDirty:
-		return s.IsDirty()
-	case models.FilterModeHasPR:
-		return s.PRInfo != nil
-	case models.FilterModeHasStash:
-		return s.StashCount > 0
-	default:
-		return true
+// CountIndexed is CountByMode reading cached masks from index.
+func CountIndexed(summaries map[string]models.RepoSummary, index FilterIndex) map[models.FilterMode]int {
+	modes := models.AllFilterModes()
+	counts := make(map[models.FilterMode]int, len(modes))
+	for path, s := range summaries {
+		mask := index.maskOf(path, s)
+		for _, mode := range modes {
+			if mask.Has(mode) {
+				counts[mode]++
+			}
+		}
 	}
+	return counts
 }
 
 func FilterAndSort(
@@ -116,3 +231,21 @@ func FilterAndSortMulti(
 
 	return sorted
 }
+
+// FilterAndSortIndexed is FilterAndSortMulti reading cached masks from index.
+func FilterAndSortIndexed(
+	paths []string,
+	summaries map[string]models.RepoSummary,
+	index FilterIndex,
+	activeFilters []models.ActiveFilter,
+	activeSorts []models.ActiveSort,
+	searchText string,
+) []string {
+	filtered := FilterReposIndexed(paths, summaries, index, activeFilters)
+
+	if searchText != "" {
+		filtered = SearchRepos(filtered, summaries, searchText)
+	}
+
+	return SortPathsMulti(filtered, summaries, activeSorts)
+}
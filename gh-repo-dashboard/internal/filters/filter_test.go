@@ -1,6 +1,8 @@
 package filters
 
 import (
+	"maps"
+	"slices"
 	"testing"
 
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
@@ -227,3 +229,99 @@ func TestFilterReposMultiMixedInverted(t *testing.T) {
 		t.Errorf("expected /repo2, got %s", result[0])
 	}
 }
+
+func TestPassesFilters(t *testing.T) {
+	filters := []models.ActiveFilter{
+		{Mode: models.FilterModeDirty, Enabled: true},
+		{Mode: models.FilterModeAhead, Enabled: true, Inverted: true},
+		{Mode: models.FilterModeBehind, Enabled: false},
+	}
+
+	tests := []struct {
+		name    string
+		summary models.RepoSummary
+		want    bool
+	}{
+		{"dirty not ahead", models.RepoSummary{Staged: 1}, true},
+		{"dirty and ahead", models.RepoSummary{Staged: 1, Ahead: 1}, false},
+		{"clean", models.RepoSummary{Behind: 3}, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := PassesFilters(tt.summary, filters); got != tt.want {
+				t.Errorf("PassesFilters() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestCountByMode(t *testing.T) {
+	summaries := map[string]models.RepoSummary{
+		"/repo1": {Path: "/repo1", Ahead: 1, Staged: 1},
+		"/repo2": {Path: "/repo2", Behind: 2, StashCount: 1},
+		"/repo3": {Path: "/repo3", PRInfo: &models.PRInfo{Number: 1}},
+	}
+
+	counts := CountByMode(summaries)
+
+	expected := map[models.FilterMode]int{
+		models.FilterModeAll:      3,
+		models.FilterModeAhead:    1,
+		models.FilterModeBehind:   1,
+		models.FilterModeDirty:    1,
+		models.FilterModeHasPR:    1,
+		models.FilterModeHasStash: 1,
+	}
+	for mode, want := range expected {
+		if counts[mode] != want {
+			t.Errorf("%s: expected %d, got %d", mode, want, counts[mode])
+		}
+	}
+}
+
+func TestFilterReposIndexedMatchesMulti(t *testing.T) {
+	summaries := map[string]models.RepoSummary{
+		"/ahead":       {Path: "/ahead", Ahead: 1},
+		"/dirty":       {Path: "/dirty", Unstaged: 2},
+		"/pr":          {Path: "/pr", PRInfo: &models.PRInfo{Number: 1}},
+		"/ahead-stash": {Path: "/ahead-stash", Ahead: 2, StashCount: 1},
+		"/clean":       {Path: "/clean"},
+	}
+	paths := []string{"/ahead", "/dirty", "/pr", "/ahead-stash", "/clean"}
+
+	index := FilterIndex{}
+	for path, s := range summaries {
+		if path != "/clean" {
+			index[path] = MaskOf(s)
+		}
+	}
+
+	tests := []struct {
+		name    string
+		filters []models.ActiveFilter
+	}{
+		{"none", nil},
+		{"ahead", []models.ActiveFilter{{Mode: models.FilterModeAhead, Enabled: true}}},
+		{"not stash", []models.ActiveFilter{{Mode: models.FilterModeHasStash, Enabled: true, Inverted: true}}},
+		{"ahead and not stash", []models.ActiveFilter{
+			{Mode: models.FilterModeAhead, Enabled: true},
+			{Mode: models.FilterModeHasStash, Enabled: true, Inverted: true},
+		}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			expected := FilterReposMulti(paths, summaries, tt.filters)
+			got := FilterReposIndexed(paths, summaries, index, tt.filters)
+			if !slices.Equal(got, expected) {
+				t.Errorf("expected %v, got %v", expected, got)
+			}
+		})
+	}
+
+	counts := CountIndexed(summaries, index)
+	if expected := CountByMode(summaries); !maps.Equal(counts, expected) {
+		t.Errorf("expected counts %v, got %v", expected, counts)
+	}
+}
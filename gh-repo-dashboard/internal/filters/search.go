@@ -3,6 +3,7 @@ package filters
 import (
 	"path/filepath"
 	"strings"
+	"unicode/utf8"
 
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
 	"github.com/sahilm/fuzzy"
@@ -16,16 +17,20 @@ func SearchRepos(paths []string, summaries map[string]models.RepoSummary, search
 	}
 
 	searchLower := strings.ToLower(searchText)
+	patternLen := utf8.RuneCountInString(searchText)
 
 	var substringMatches []string
 	var nonMatches []string
+	var names []string
 
 	for _, path := range paths {
-		name := strings.ToLower(filepath.Base(path))
-		if strings.Contains(name, searchLower) {
+		base := filepath.Base(path)
+		if containsLower(base, searchLower) {
 			substringMatches = append(substringMatches, path)
-		} else {
+		} else if utf8.RuneCountInString(base) >= patternLen {
+			// A fuzzy match is a subsequence, so shorter names can never match.
 			nonMatches = append(nonMatches, path)
+			names = append(names, base)
 		}
 	}
 
@@ -33,11 +38,6 @@ func SearchRepos(paths []string, summaries map[string]models.RepoSummary, search
 		return substringMatches
 	}
 
-	names := make([]string, len(nonMatches))
-	for i, path := range nonMatches {
-		names[i] = filepath.Base(path)
-	}
-
 	matches := fuzzy.Find(searchText, names)
 
 	var results []string
@@ -51,6 +51,54 @@ func SearchRepos(paths []string, summaries map[string]models.RepoSummary, search
 	return results
 }
 
+// NarrowSearch keeps the paths whose names contain searchText, preserving
+// order. Appending to a query can only shrink its substring matches, so the
+// previous result is a valid candidate set. ok is false when nothing matches
+// by substring, since the fuzzy fallback must then consider every repo.
+func NarrowSearch(paths []string, searchText string) ([]string, bool) {
+	searchLower := strings.ToLower(searchText)
+
+	var matches []string
+	for _, path := range paths {
+		if containsLower(filepath.Base(path), searchLower) {
+			matches = append(matches, path)
+		}
+	}
+
+	return matches, len(matches) > 0
+}
+
+// containsLower reports whether s contains substrLower, ignoring the case of
+// s. The caller lowercases the query once, so ASCII names are compared in
+// place instead of allocating a lowercased copy for every repo.
+func containsLower(s, substrLower string) bool {
+	n := len(substrLower)
+	for i := 0; i < len(s); i++ {
+		if s[i] >= utf8.RuneSelf {
+			return strings.Contains(strings.ToLower(s), substrLower)
+		}
+	}
+	for i := 0; i+n <= len(s); i++ {
+		if asciiHasPrefixLower(s[i:], substrLower) {
+			return true
+		}
+	}
+	return false
+}
+
+func asciiHasPrefixLower(s, prefixLower string) bool {
+	for j := 0; j < len(prefixLower); j++ {
+		c := s[j]
+		if 'A' <= c && c <= 'Z' {
+			c += 'a' - 'A'
+		}
+		if c != prefixLower[j] {
+			return false
+		}
+	}
+	return true
+}
+
 func FuzzyMatch(pattern, text string) bool {
 	if pattern == "" {
 		return true
@@ -83,3 +83,49 @@ func TestFuzzyMatchNoMatch(t *testing.T) {
 		t.Error("expected no match for unrelated strings")
 	}
 }
+
+func TestNarrowSearch(t *testing.T) {
+	paths := []string{"/web-api", "/api-service", "/web-app", "/api-client"}
+
+	result, ok := NarrowSearch(paths, "API-")
+	if !ok {
+		t.Fatal("expected substring matches")
+	}
+	if len(result) != 2 || result[0] != "/api-service" || result[1] != "/api-client" {
+		t.Errorf("expected ordered api- matches, got %v", result)
+	}
+
+	if _, ok := NarrowSearch(paths, "xyz"); ok {
+		t.Error("expected no substring matches to require a full search")
+	}
+}
+
+func TestSearchReposFuzzySkipsShortNames(t *testing.T) {
+	paths := []string{"/a-u", "/authn-service-x"}
+	summaries := map[string]models.RepoSummary{}
+
+	result := SearchRepos(paths, summaries, "authx")
+	if len(result) != 1 || result[0] != "/authn-service-x" {
+		t.Errorf("expected only the long enough fuzzy match, got %v", result)
+	}
+}
+
+func TestContainsLower(t *testing.T) {
+	tests := []struct {
+		s, substr string
+		want      bool
+	}{
+		{"MyRepo", "repo", true},
+		{"MyRepo", "", true},
+		{"api-Service", "i-s", true},
+		{"api", "api-service", false},
+		{"Ünïcode-Repo", "ünï", true},
+		{"Ünïcode-Repo", "xyz", false},
+	}
+
+	for _, tt := range tests {
+		if got := containsLower(tt.s, tt.substr); got != tt.want {
+			t.Errorf("containsLower(%q, %q) = %v, want %v", tt.s, tt.substr, got, tt.want)
+		}
+	}
+}
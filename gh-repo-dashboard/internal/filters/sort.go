@@ -1,9 +1,12 @@
 package filters
 
 import (
+	"cmp"
 	"path/filepath"
+	"slices"
 	"sort"
 	"strings"
+	"time"
 
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
 )
@@ -13,24 +16,59 @@ func SortPaths(paths []string, summaries map[string]models.RepoSummary, mode mod
 		return paths
 	}
 
-	sorted := make([]string, len(paths))
-	copy(sorted, paths)
-
-	sort.Slice(sorted, func(i, j int) bool {
-		si := summaries[sorted[i]]
-		sj := summaries[sorted[j]]
-
-		less := comparePaths(si, sj, mode)
+	keys := sortKeys(paths, summaries)
+	slices.SortStableFunc(keys, func(a, b sortKey) int {
+		c := comparePaths(&a, &b, mode)
 		if reverse {
-			return !less
+			return -c
 		}
-		return less
+		return c
 	})
 
-	return sorted
+	return keyPaths(keys)
+}
+
+// sortKey holds the fields comparisons read, derived once per path so sorting
+// does not repeat map lookups and lowercasing on every comparison.
+type sortKey struct {
+	path         string
+	name         string
+	branch       string
+	lastModified time.Time
+	dirty        bool
+	uncommitted  int
+}
+
+func newSortKey(path string, s models.RepoSummary) sortKey {
+	return sortKey{
+		path:         path,
+		name:         strings.ToLower(filepath.Base(s.Path)),
+		branch:       strings.ToLower(s.Branch),
+		lastModified: s.LastModified,
+		dirty:        s.IsDirty(),
+		uncommitted:  s.UncommittedCount(),
+	}
+}
+
+func sortKeys(paths []string, summaries map[string]models.RepoSummary) []sortKey {
+	keys := make([]sortKey, len(paths))
+	for i, path := range paths {
+		keys[i] = newSortKey(path, summaries[path])
+	}
+	return keys
+}
+
+func keyPaths(keys []sortKey) []string {
+	paths := make([]string, len(keys))
+	for i := range keys {
+		paths[i] = keys[i].path
+	}
+	return paths
 }
 
-func comparePaths(a, b models.RepoSummary, mode models.SortMode) bool {
+// comparePaths orders two repos for mode, returning a negative number when a
+// sorts first, zero when tied and a positive number otherwise.
+func comparePaths(a, b *sortKey, mode models.SortMode) int {
 	switch mode {
 	case models.SortModeName:
 		return compareByName(a, b)
@@ -45,37 +83,35 @@ func comparePaths(a, b models.RepoSummary, mode models.SortMode) bool {
 	}
 }
 
-func compareByName(a, b models.RepoSummary) bool {
-	return strings.ToLower(filepath.Base(a.Path)) < strings.ToLower(filepath.Base(b.Path))
+func compareByName(a, b *sortKey) int {
+	return strings.Compare(a.name, b.name)
 }
 
-func compareByModified(a, b models.RepoSummary) bool {
-	if a.LastModified.Equal(b.LastModified) {
-		return compareByName(a, b)
+func compareByModified(a, b *sortKey) int {
+	if c := b.lastModified.Compare(a.lastModified); c != 0 {
+		return c
 	}
-	return a.LastModified.After(b.LastModified)
+	return compareByName(a, b)
 }
 
-func compareByStatus(a, b models.RepoSummary) bool {
-	aDirty := a.IsDirty()
-	bDirty := b.IsDirty()
-
-	if aDirty != bDirty {
-		return aDirty
+func compareByStatus(a, b *sortKey) int {
+	if a.dirty != b.dirty {
+		if a.dirty {
+			return -1
+		}
+		return 1
 	}
 
-	aCount := a.UncommittedCount()
-	bCount := b.UncommittedCount()
-	if aCount != bCount {
-		return aCount > bCount
+	if c := cmp.Compare(b.uncommitted, a.uncommitted); c != 0 {
+		return c
 	}
 
 	return compareByName(a, b)
 }
 
-func compareByBranch(a, b models.RepoSummary) bool {
-	if a.Branch != b.Branch {
-		return strings.ToLower(a.Branch) < strings.ToLower(b.Branch)
+func compareByBranch(a, b *sortKey) int {
+	if c := strings.Compare(a.branch, b.branch); c != 0 {
+		return c
 	}
 	return compareByName(a, b)
 }
@@ -85,6 +121,34 @@ func SortPathsMulti(paths []string, summaries map[string]models.RepoSummary, act
 		return paths
 	}
 
+	enabledSorts := enabledSortsByPriority(activeSorts)
+	if len(enabledSorts) == 0 {
+		sorted := make([]string, len(paths))
+		copy(sorted, paths)
+		return sorted
+	}
+
+	keys := sortKeys(paths, summaries)
+	compare := multiCompare(enabledSorts)
+	slices.SortStableFunc(keys, func(a, b sortKey) int {
+		return compare(&a, &b)
+	})
+
+	return keyPaths(keys)
+}
+
+// InsertSorted inserts path into paths, which must already be ordered by SortPathsMulti.
+func InsertSorted(paths []string, path string, summaries map[string]models.RepoSummary, activeSorts []models.ActiveSort) []string {
+	compare := multiCompare(enabledSortsByPriority(activeSorts))
+	key := newSortKey(path, summaries[path])
+	i := sort.Search(len(paths), func(i int) bool {
+		other := newSortKey(paths[i], summaries[paths[i]])
+		return compare(&key, &other) < 0
+	})
+	return slices.Insert(paths, i, path)
+}
+
+func enabledSortsByPriority(activeSorts []models.ActiveSort) []models.ActiveSort {
 	enabledSorts := []models.ActiveSort{}
 	for _, s := range activeSorts {
 		if s.IsEnabled() {
@@ -92,39 +156,28 @@ func SortPathsMulti(paths []string, summaries map[string]models.RepoSummary, act
 		}
 	}
 
-	if len(enabledSorts) == 0 {
-		return paths
-	}
-
 	sort.Slice(enabledSorts, func(i, j int) bool {
 		return enabledSorts[i].Priority < enabledSorts[j].Priority
 	})
 
-	sorted := make([]string, len(paths))
-	copy(sorted, paths)
-
-	sort.Slice(sorted, func(i, j int) bool {
-		si := summaries[sorted[i]]
-		sj := summaries[sorted[j]]
+	return enabledSorts
+}
 
+// multiCompare chains the enabled sorts into one three-way comparison, with
+// each sort's direction applied.
+func multiCompare(enabledSorts []models.ActiveSort) func(a, b *sortKey) int {
+	return func(si, sj *sortKey) int {
 		for _, activeSort := range enabledSorts {
-			less := comparePaths(si, sj, activeSort.Mode)
-			if activeSort.Direction == models.SortDirectionDesc {
-				less = !less
+			c := comparePaths(si, sj, activeSort.Mode)
+			if c == 0 {
+				continue
 			}
-
-			greater := comparePaths(sj, si, activeSort.Mode)
 			if activeSort.Direction == models.SortDirectionDesc {
-				greater = !greater
-			}
-
-			if less != greater {
-				return less
+				return -c
 			}
+			return c
 		}
 
-		return false
-	})
-
-	return sorted
+		return 0
+	}
 }
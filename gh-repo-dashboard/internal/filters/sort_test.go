@@ -1,6 +1,7 @@
 package filters
 
 import (
+	"slices"
 	"testing"
 	"time"
 
@@ -111,3 +112,70 @@ func TestSortPathsEmpty(t *testing.T) {
 		t.Errorf("expected empty result, got %d items", len(result))
 	}
 }
+
+func TestInsertSortedMatchesFullSort(t *testing.T) {
+	now := time.Now()
+	summaries := map[string]models.RepoSummary{
+		"/alice":   {Path: "/alice", LastModified: now.Add(-2 * time.Hour)},
+		"/bob":     {Path: "/bob", LastModified: now},
+		"/charlie": {Path: "/charlie", LastModified: now.Add(-time.Hour)},
+		"/dave":    {Path: "/dave", LastModified: now.Add(-30 * time.Minute)},
+	}
+	sorts := []models.ActiveSort{
+		{Mode: models.SortModeModified, Direction: models.SortDirectionAsc, Priority: 0},
+	}
+
+	sorted := SortPathsMulti([]string{"/alice", "/bob", "/charlie"}, summaries, sorts)
+	result := InsertSorted(sorted, "/dave", summaries, sorts)
+
+	expected := SortPathsMulti([]string{"/alice", "/bob", "/charlie", "/dave"}, summaries, sorts)
+	for i, p := range result {
+		if p != expected[i] {
+			t.Errorf("position %d: expected %s, got %s", i, expected[i], p)
+		}
+	}
+}
+
+func TestSortPathsMultiNoSortsCopies(t *testing.T) {
+	paths := []string{"/b", "/a"}
+
+	result := SortPathsMulti(paths, map[string]models.RepoSummary{}, nil)
+	result[0] = "/changed"
+
+	if paths[0] != "/b" {
+		t.Error("SortPathsMulti should not alias its input")
+	}
+}
+
+func TestSortPathsReverseFlipsTieBreaker(t *testing.T) {
+	now := time.Now()
+	paths := []string{"/b", "/a", "/c"}
+	summaries := map[string]models.RepoSummary{
+		"/a": {Path: "/a", LastModified: now},
+		"/b": {Path: "/b", LastModified: now},
+		"/c": {Path: "/c", LastModified: now.Add(-time.Hour)},
+	}
+
+	result := SortPaths(paths, summaries, models.SortModeModified, true)
+
+	expected := []string{"/c", "/b", "/a"}
+	for i, p := range result {
+		if p != expected[i] {
+			t.Errorf("position %d: expected %s, got %s", i, expected[i], p)
+		}
+	}
+}
+
+func TestSortPathsMultiIsStable(t *testing.T) {
+	paths := []string{"/b/dup", "/a/dup", "/c/dup", "/d/dup"}
+	summaries := map[string]models.RepoSummary{}
+	for _, p := range paths {
+		summaries[p] = models.RepoSummary{Path: p}
+	}
+	sorts := []models.ActiveSort{{Mode: models.SortModeName, Direction: models.SortDirectionAsc, Priority: 0}}
+
+	result := SortPathsMulti(paths, summaries, sorts)
+	if !slices.Equal(result, paths) {
+		t.Errorf("expected ties to keep input order %v, got %v", paths, result)
+	}
+}
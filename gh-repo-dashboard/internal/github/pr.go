@@ -1,9 +1,11 @@
 package github
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
-	"fmt"
+	"errors"
+	"io"
 	"os/exec"
 	"strconv"
 	"strings"
@@ -32,29 +34,62 @@ type statusCheck struct {
 	Conclusion string `json:"conclusion,omitempty"`
 }
 
-func GetPRForBranch(ctx context.Context, repoPath string, branch string, upstream string) (*models.PRInfo, error) {
-	cacheKey := upstream + ":" + branch
-	if cached, ok := cache.PRCache.Get(cacheKey); ok {
-		return cached, nil
-	}
-
-	env := vcs.GetGitHubEnv(repoPath)
+// ghBinary resolves the gh executable. vcs.Binary caches the lookup for the
+// whole process, so tests replace this function rather than PATH.
+var ghBinary = func() string { return vcs.Binary("gh") }
 
-	cmd := exec.CommandContext(ctx, "gh", "pr", "view", branch,
-		"--json", "number,title,state,url,isDraft,mergeStateStatus,headRefName,baseRefName,statusCheckRollup")
+// runGH runs gh in repoPath and decodes its JSON output into v as it is
+// written, rather than buffering the whole response first. A failed run
+// returns the *exec.ExitError with the captured stderr attached.
+func runGH(ctx context.Context, repoPath string, v any, args ...string) error {
+	cmd := exec.CommandContext(ctx, ghBinary(), args...)
 	cmd.Dir = repoPath
-	if len(env) > 0 {
+	if env := vcs.GetGitHubEnv(repoPath); len(env) > 0 {
 		cmd.Env = append(cmd.Environ(), env...)
 	}
 
-	out, err := cmd.Output()
+	var stderr bytes.Buffer
+	cmd.Stderr = &stderr
+	stdout, err := cmd.StdoutPipe()
 	if err != nil {
-		cache.PRCache.Set(cacheKey, nil)
-		return nil, err
+		return err
+	}
+	if err := cmd.Start(); err != nil {
+		return err
+	}
+
+	decodeErr := json.NewDecoder(stdout).Decode(v)
+	if decodeErr != nil {
+		// Keep reading so gh is not blocked writing to a full pipe.
+		_, _ = io.Copy(io.Discard, stdout)
+	}
+
+	if err := cmd.Wait(); err != nil {
+		var exitErr *exec.ExitError
+		if errors.As(err, &exitErr) {
+			exitErr.Stderr = stderr.Bytes()
+		}
+		return err
+	}
+	return decodeErr
+}
+
+// GetPRForBranch looks up the PR for branch. When headSHA is known it is part
+// of the cache key, so a new commit re-checks a branch previously found to
+// have no PR instead of waiting out the negative TTL.
+func GetPRForBranch(ctx context.Context, repoPath string, branch string, upstream string, headSHA string) (*models.PRInfo, error) {
+	cacheKey := cache.PRKey{Upstream: upstream, Branch: branch, HeadSHA: headSHA}
+	if cached, ok := cache.PRCache.Get(cacheKey); ok {
+		return cached, nil
 	}
 
 	var resp prResponse
-	if err := json.Unmarshal(out, &resp); err != nil {
+	err := runGH(ctx, repoPath, &resp, "pr", "view", branch,
+		"--json", "number,title,state,url,isDraft,mergeStateStatus,headRefName,baseRefName,statusCheckRollup")
+	if err != nil {
+		if isNegativeResult(ctx, err) {
+			cache.PRCache.SetWithTTL(cacheKey, nil, negativeTTL(err))
+		}
 		return nil, err
 	}
 
@@ -76,22 +111,47 @@ func GetPRForBranch(ctx context.Context, repoPath string, branch string, upstrea
 	return pr, nil
 }
 
+const (
+	noPRTTL           = 5 * time.Minute
+	noGitHubRemoteTTL = time.Hour
+)
+
+// negativeTTL picks how long to remember a failed lookup. Repos whose remotes
+// are not on GitHub will never have PRs, so they are skipped for longer.
+func negativeTTL(err error) time.Duration {
+	var exitErr *exec.ExitError
+	if errors.As(err, &exitErr) && bytes.Contains(exitErr.Stderr, []byte("known GitHub host")) {
+		return noGitHubRemoteTTL
+	}
+	return noPRTTL
+}
+
+// isNegativeResult reports whether err is gh answering that there is nothing
+// to return, as opposed to gh being missing or the lookup being cancelled.
+// Only the former is worth caching.
+func isNegativeResult(ctx context.Context, err error) bool {
+	var exitErr *exec.ExitError
+	return errors.As(err, &exitErr) && ctx.Err() == nil
+}
+
 func parseChecks(checks []statusCheck) models.ChecksStatus {
 	var status models.ChecksStatus
 	status.Total = len(checks)
 
+	// Compare case-insensitively in place; lowercasing copied every
+	// uppercase state GitHub returns.
 	for _, c := range checks {
-		state := strings.ToLower(c.State)
-		conclusion := strings.ToLower(c.Conclusion)
+		state, conclusion := c.State, c.Conclusion
 
 		switch {
-		case state == "pending" || c.Status == "IN_PROGRESS" || c.Status == "QUEUED":
+		case strings.EqualFold(state, "pending") || c.Status == "IN_PROGRESS" || c.Status == "QUEUED":
 			status.Pending++
-		case conclusion == "success" || state == "success":
+		case strings.EqualFold(conclusion, "success") || strings.EqualFold(state, "success"):
 			status.Passing++
-		case conclusion == "failure" || conclusion == "error" || state == "failure" || state == "error":
+		case strings.EqualFold(conclusion, "failure") || strings.EqualFold(conclusion, "error") ||
+			strings.EqualFold(state, "failure") || strings.EqualFold(state, "error"):
 			status.Failing++
-		case conclusion == "skipped" || conclusion == "neutral":
+		case strings.EqualFold(conclusion, "skipped") || strings.EqualFold(conclusion, "neutral"):
 			status.Skipped++
 		default:
 			status.Pending++
@@ -102,25 +162,11 @@ func parseChecks(checks []statusCheck) models.ChecksStatus {
 }
 
 func GetPRDetail(ctx context.Context, repoPath string, prNumber int) (*models.PRDetail, error) {
-	cacheKey := fmt.Sprintf("%s:pr:%d", repoPath, prNumber)
+	cacheKey := cache.PRDetailKey{RepoPath: repoPath, Number: prNumber}
 	if cached, ok := cache.PRDetailCache.Get(cacheKey); ok {
 		return cached, nil
 	}
 
-	env := vcs.GetGitHubEnv(repoPath)
-
-	cmd := exec.CommandContext(ctx, "gh", "pr", "view", strconv.Itoa(prNumber),
-		"--json", "number,title,state,url,isDraft,mergeStateStatus,headRefName,baseRefName,body,author,assignees,reviewRequests,createdAt,updatedAt,additions,deletions,comments,reviewDecision")
-	cmd.Dir = repoPath
-	if len(env) > 0 {
-		cmd.Env = append(cmd.Environ(), env...)
-	}
-
-	out, err := cmd.Output()
-	if err != nil {
-		return nil, err
-	}
-
 	var resp struct {
 		Number         int    `json:"number"`
 		Title          string `json:"title"`
@@ -140,21 +186,20 @@ func GetPRDetail(ctx context.Context, repoPath string, prNumber int) (*models.PR
 		ReviewRequests []struct {
 			Login string `json:"login"`
 		} `json:"reviewRequests"`
-		CreatedAt      string `json:"createdAt"`
-		UpdatedAt      string `json:"updatedAt"`
+		CreatedAt      time.Time `json:"createdAt"`
+		UpdatedAt      time.Time `json:"updatedAt"`
 		Additions      int    `json:"additions"`
 		Deletions      int    `json:"deletions"`
 		Comments       int    `json:"comments"`
 		ReviewDecision string `json:"reviewDecision"`
 	}
 
-	if err := json.Unmarshal(out, &resp); err != nil {
+	err := runGH(ctx, repoPath, &resp, "pr", "view", strconv.Itoa(prNumber),
+		"--json", "number,title,state,url,isDraft,mergeStateStatus,headRefName,baseRefName,body,author,assignees,reviewRequests,createdAt,updatedAt,additions,deletions,comments,reviewDecision")
+	if err != nil {
 		return nil, err
 	}
 
-	createdAt, _ := time.Parse(time.RFC3339, resp.CreatedAt)
-	updatedAt, _ := time.Parse(time.RFC3339, resp.UpdatedAt)
-
 	assignees := make([]string, 0, len(resp.Assignees))
 	for _, a := range resp.Assignees {
 		assignees = append(assignees, a.Login)
@@ -181,8 +226,8 @@ func GetPRDetail(ctx context.Context, repoPath string, prNumber int) (*models.PR
 		Author:    resp.Author.Login,
 		Assignees: assignees,
 		Reviewers: reviewers,
-		CreatedAt: createdAt,
-		UpdatedAt: updatedAt,
+		CreatedAt: resp.CreatedAt,
+		UpdatedAt: resp.UpdatedAt,
 		Additions: resp.Additions,
 		Deletions: resp.Deletions,
 		Comments:  resp.Comments,
@@ -197,27 +242,11 @@ func GetPRsForRepo(ctx context.Context, repoPath string, upstream string) ([]mod
 		return []models.PRInfo{}, nil
 	}
 
-	cacheKey := upstream + ":all_prs"
+	cacheKey := upstream
 	if cached, ok := cache.PRListCache.Get(cacheKey); ok {
 		return cached, nil
 	}
 
-	env := vcs.GetGitHubEnv(repoPath)
-
-	cmd := exec.CommandContext(ctx, "gh", "pr", "list",
-		"--json", "number,title,state,url,isDraft,headRefName,baseRefName,reviewDecision",
-		"--limit", "100")
-	cmd.Dir = repoPath
-	if len(env) > 0 {
-		cmd.Env = append(cmd.Environ(), env...)
-	}
-
-	out, err := cmd.Output()
-	if err != nil {
-		cache.PRListCache.Set(cacheKey, []models.PRInfo{})
-		return []models.PRInfo{}, err
-	}
-
 	var prList []struct {
 		Number         int    `json:"number"`
 		Title          string `json:"title"`
@@ -229,7 +258,13 @@ func GetPRsForRepo(ctx context.Context, repoPath string, upstream string) ([]mod
 		ReviewDecision string `json:"reviewDecision"`
 	}
 
-	if err := json.Unmarshal(out, &prList); err != nil {
+	err := runGH(ctx, repoPath, &prList, "pr", "list",
+		"--json", "number,title,state,url,isDraft,headRefName,baseRefName,reviewDecision",
+		"--limit", "100")
+	if err != nil {
+		if isNegativeResult(ctx, err) {
+			cache.PRListCache.SetWithTTL(cacheKey, []models.PRInfo{}, negativeTTL(err))
+		}
 		return []models.PRInfo{}, err
 	}
 
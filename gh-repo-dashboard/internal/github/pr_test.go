@@ -1,8 +1,17 @@
 package github
 
 import (
+	"context"
+	"errors"
+	"fmt"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"runtime"
 	"testing"
+	"time"
 
+	"github.com/kyleking/gh-repo-dashboard/internal/cache"
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
 )
 
@@ -100,6 +109,20 @@ func TestParseChecks(t *testing.T) {
 				Failing: 1,
 			},
 		},
+		{
+			name: "uppercase values from the API",
+			input: []statusCheck{
+				{Status: "COMPLETED", Conclusion: "SUCCESS"},
+				{Status: "COMPLETED", Conclusion: "FAILURE"},
+				{State: "PENDING"},
+			},
+			expected: models.ChecksStatus{
+				Total:   3,
+				Passing: 1,
+				Failing: 1,
+				Pending: 1,
+			},
+		},
 		{
 			name: "unknown state defaults to pending",
 			input: []statusCheck{
@@ -121,3 +144,109 @@ func TestParseChecks(t *testing.T) {
 		})
 	}
 }
+
+func TestNegativeTTL(t *testing.T) {
+	tests := []struct {
+		name     string
+		err      error
+		expected time.Duration
+	}{
+		{
+			name:     "no GitHub remote",
+			err:      &exec.ExitError{Stderr: []byte("none of the git remotes configured for this repository point to a known GitHub host")},
+			expected: noGitHubRemoteTTL,
+		},
+		{
+			name:     "no pull request",
+			err:      &exec.ExitError{Stderr: []byte("no pull requests found for branch \"main\"")},
+			expected: noPRTTL,
+		},
+		{
+			name:     "other error",
+			err:      errors.New("boom"),
+			expected: noPRTTL,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := negativeTTL(tt.err); got != tt.expected {
+				t.Errorf("expected %v, got %v", tt.expected, got)
+			}
+		})
+	}
+}
+
+func TestIsNegativeResult(t *testing.T) {
+	cancelled, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	tests := []struct {
+		name     string
+		ctx      context.Context
+		err      error
+		expected bool
+	}{
+		{"gh exited non-zero", context.Background(), &exec.ExitError{}, true},
+		{"wrapped exit error", context.Background(), fmt.Errorf("gh: %w", &exec.ExitError{}), true},
+		{"gh not installed", context.Background(), exec.ErrNotFound, false},
+		{"lookup cancelled", cancelled, &exec.ExitError{}, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := isNegativeResult(tt.ctx, tt.err); got != tt.expected {
+				t.Errorf("expected %v, got %v", tt.expected, got)
+			}
+		})
+	}
+}
+
+func TestRunGH(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("uses a shell script in place of gh")
+	}
+
+	dir := t.TempDir()
+	script := `#!/bin/sh
+if [ "$1" = "fail" ]; then
+	echo "none of the git remotes point to a known GitHub host" >&2
+	exit 1
+fi
+echo '{"number": 7, "title": "Streamed"}'
+`
+	if err := os.WriteFile(filepath.Join(dir, "gh"), []byte(script), 0755); err != nil {
+		t.Fatal(err)
+	}
+	defer func(resolve func() string) { ghBinary = resolve }(ghBinary)
+	ghBinary = func() string { return filepath.Join(dir, "gh") }
+
+	var resp prResponse
+	if err := runGH(context.Background(), dir, &resp, "pr", "view"); err != nil {
+		t.Fatalf("runGH failed: %v", err)
+	}
+	if resp.Number != 7 || resp.Title != "Streamed" {
+		t.Errorf("unexpected decoded response %+v", resp)
+	}
+
+	err := runGH(context.Background(), dir, &resp, "fail")
+	if negativeTTL(err) != noGitHubRemoteTTL {
+		t.Errorf("expected stderr to reach negativeTTL, got error %v", err)
+	}
+}
+
+func TestGetPRForBranchKeysCacheByHead(t *testing.T) {
+	defer cache.PRCache.Clear()
+
+	pr := &models.PRInfo{Number: 3}
+	cache.PRCache.Set(cache.PRKey{Upstream: "origin/feature", Branch: "feature", HeadSHA: "abc123"}, pr)
+
+	got, err := GetPRForBranch(context.Background(), t.TempDir(), "feature", "origin/feature", "abc123")
+	if err != nil || got != pr {
+		t.Errorf("expected cached PR for the same head, got %+v, %v", got, err)
+	}
+
+	if _, ok := cache.PRCache.Get(cache.PRKey{Upstream: "origin/feature", Branch: "feature"}); ok {
+		t.Error("expected no entry under the head-less key")
+	}
+}
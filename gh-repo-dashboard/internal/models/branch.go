@@ -89,6 +89,39 @@ func (s StashDetail) RelativeDate() string {
 	return RelativeTime(s.Date)
 }
 
+// Relative-time labels are rendered for every row on every frame, but only a
+// few dozen distinct ones exist below a year, so they are formatted once.
+var (
+	minuteLabels = countLabels(60, "min", "mins")
+	hourLabels   = countLabels(24, "hour", "hours")
+	dayLabels    = countLabels(7, "day", "days")
+	weekLabels   = countLabels(5, "week", "weeks")
+	monthLabels  = countLabels(13, "month", "months")
+	yearLabels   = countLabels(11, "year", "years")
+)
+
+func countLabels(n int, one string, many string) []string {
+	labels := make([]string, n)
+	for i := range labels {
+		labels[i] = formatCount(i, one, many)
+	}
+	return labels
+}
+
+func formatCount(n int, one string, many string) string {
+	if n == 1 {
+		return "1 " + one + " ago"
+	}
+	return fmt.Sprintf("%d %s ago", n, many)
+}
+
+func countLabel(labels []string, n int, one string, many string) string {
+	if n >= 0 && n < len(labels) {
+		return labels[n]
+	}
+	return formatCount(n, one, many)
+}
+
 func RelativeTime(t time.Time) string {
 	if t.IsZero() {
 		return "—"
@@ -101,40 +134,16 @@ func RelativeTime(t time.Time) string {
 	case diff < time.Minute:
 		return "just now"
 	case diff < time.Hour:
-		mins := int(diff.Minutes())
-		if mins == 1 {
-			return "1 min ago"
-		}
-		return fmt.Sprintf("%d mins ago", mins)
+		return countLabel(minuteLabels, int(diff.Minutes()), "min", "mins")
 	case diff < 24*time.Hour:
-		hours := int(diff.Hours())
-		if hours == 1 {
-			return "1 hour ago"
-		}
-		return fmt.Sprintf("%d hours ago", hours)
+		return countLabel(hourLabels, int(diff.Hours()), "hour", "hours")
 	case diff < 7*24*time.Hour:
-		days := int(diff.Hours() / 24)
-		if days == 1 {
-			return "1 day ago"
-		}
-		return fmt.Sprintf("%d days ago", days)
+		return countLabel(dayLabels, int(diff.Hours()/24), "day", "days")
 	case diff < 30*24*time.Hour:
-		weeks := int(diff.Hours() / 24 / 7)
-		if weeks == 1 {
-			return "1 week ago"
-		}
-		return fmt.Sprintf("%d weeks ago", weeks)
+		return countLabel(weekLabels, int(diff.Hours()/24/7), "week", "weeks")
 	case diff < 365*24*time.Hour:
-		months := int(diff.Hours() / 24 / 30)
-		if months == 1 {
-			return "1 month ago"
-		}
-		return fmt.Sprintf("%d months ago", months)
+		return countLabel(monthLabels, int(diff.Hours()/24/30), "month", "months")
 	default:
-		years := int(diff.Hours() / 24 / 365)
-		if years == 1 {
-			return "1 year ago"
-		}
-		return fmt.Sprintf("%d years ago", years)
+		return countLabel(yearLabels, int(diff.Hours()/24/365), "year", "years")
 	}
 }
@@ -74,6 +74,24 @@ func TestRelativeTimeYears(t *testing.T) {
 	}
 }
 
+func TestRelativeTimeBeyondLabelTable(t *testing.T) {
+	result := RelativeTime(time.Now().Add(-20 * 366 * 24 * time.Hour))
+	if result != "20 years ago" {
+		t.Errorf("expected '20 years ago', got '%s'", result)
+	}
+}
+
+func TestCountLabelsMatchFormatting(t *testing.T) {
+	for n, label := range minuteLabels {
+		if want := formatCount(n, "min", "mins"); label != want {
+			t.Errorf("minuteLabels[%d] = %q, want %q", n, label, want)
+		}
+	}
+	if minuteLabels[1] != "1 min ago" || minuteLabels[59] != "59 mins ago" {
+		t.Errorf("unexpected minute labels: %q, %q", minuteLabels[1], minuteLabels[59])
+	}
+}
+
 func TestRelativeTimeZero(t *testing.T) {
 	result := RelativeTime(time.Time{})
 	if result != "—" {
@@ -1,5 +1,16 @@
 package models
 
+// Enum names are indexed by value rather than switched on; the filter and
+// sort labels are looked up for every rendered header and modal row.
+
+// enumName returns table[v], or fallback for values outside the table.
+func enumName[T ~int](table []string, v T, fallback string) string {
+	if v < 0 || int(v) >= len(table) {
+		return fallback
+	}
+	return table[v]
+}
+
 type VCSType int
 
 const (
@@ -7,15 +18,13 @@ const (
 	VCSTypeJJ
 )
 
+var vcsTypeNames = []string{
+	VCSTypeGit: "git",
+	VCSTypeJJ:  "jj",
+}
+
 func (v VCSType) String() string {
-	switch v {
-	case VCSTypeGit:
-		return "git"
-	case VCSTypeJJ:
-		return "jj"
-	default:
-		return "unknown"
-	}
+	return enumName(vcsTypeNames, v, "unknown")
 }
 
 type FilterMode int
@@ -29,42 +38,30 @@ const (
 	FilterModeHasStash
 )
 
+var filterModeNames = []string{
+	FilterModeAll:      "All",
+	FilterModeAhead:    "Ahead",
+	FilterModeBehind:   "Behind",
+	FilterModeDirty:    "Dirty",
+	FilterModeHasPR:    "Has PR",
+	FilterModeHasStash: "Has Stash",
+}
+
+var filterModeKeys = []string{
+	FilterModeAll:      "a",
+	FilterModeAhead:    ">",
+	FilterModeBehind:   "<",
+	FilterModeDirty:    "d",
+	FilterModeHasPR:    "p",
+	FilterModeHasStash: "s",
+}
+
 func (f FilterMode) String() string {
-	switch f {
-	case FilterModeAll:
-		return "All"
-	case FilterModeAhead:
-		return "Ahead"
-	case FilterModeBehind:
-		return "Behind"
-	case FilterModeDirty:
-		return "Dirty"
-	case FilterModeHasPR:
-		return "Has PR"
-	case FilterModeHasStash:
-		return "Has Stash"
-	default:
-		return "Unknown"
-	}
+	return enumName(filterModeNames, f, "Unknown")
 }
 
 func (f FilterMode) ShortKey() string {
-	switch f {
-	case FilterModeAll:
-		return "a"
-	case FilterModeAhead:
-		return ">"
-	case FilterModeBehind:
-		return "<"
-	case FilterModeDirty:
-		return "d"
-	case FilterModeHasPR:
-		return "p"
-	case FilterModeHasStash:
-		return "s"
-	default:
-		return "?"
-	}
+	return enumName(filterModeKeys, f, "?")
 }
 
 func AllFilterModes() []FilterMode {
@@ -97,34 +94,26 @@ const (
 	SortModeBranch
 )
 
+var sortModeNames = []string{
+	SortModeName:     "Name",
+	SortModeModified: "Modified",
+	SortModeStatus:   "Status",
+	SortModeBranch:   "Branch",
+}
+
+var sortModeKeys = []string{
+	SortModeName:     "n",
+	SortModeModified: "m",
+	SortModeStatus:   "s",
+	SortModeBranch:   "b",
+}
+
 func (s SortMode) String() string {
-	switch s {
-	case SortModeName:
-		return "Name"
-	case SortModeModified:
-		return "Modified"
-	case SortModeStatus:
-		return "Status"
-	case SortModeBranch:
-		return "Branch"
-	default:
-		return "Unknown"
-	}
+	return enumName(sortModeNames, s, "Unknown")
 }
 
 func (s SortMode) ShortKey() string {
-	switch s {
-	case SortModeName:
-		return "n"
-	case SortModeModified:
-		return "m"
-	case SortModeStatus:
-		return "s"
-	case SortModeBranch:
-		return "b"
-	default:
-		return "?"
-	}
+	return enumName(sortModeKeys, s, "?")
 }
 
 func (s SortMode) Next() SortMode {
@@ -150,21 +139,16 @@ const (
 	RepoStatusDiverged
 )
 
+var repoStatusNames = []string{
+	RepoStatusClean:    "clean",
+	RepoStatusDirty:    "dirty",
+	RepoStatusAhead:    "ahead",
+	RepoStatusBehind:   "behind",
+	RepoStatusDiverged: "diverged",
+}
+
 func (r RepoStatus) String() string {
-	switch r {
-	case RepoStatusClean:
-		return "clean"
-	case RepoStatusDirty:
-		return "dirty"
-	case RepoStatusAhead:
-		return "ahead"
-	case RepoStatusBehind:
-		return "behind"
-	case RepoStatusDiverged:
-		return "diverged"
-	default:
-		return "unknown"
-	}
+	return enumName(repoStatusNames, r, "unknown")
 }
 
 type ItemKind int
@@ -175,15 +159,12 @@ const (
 	ItemKindWorktree
 )
 
+var itemKindNames = []string{
+	ItemKindBranch:   "branch",
+	ItemKindStash:    "stash",
+	ItemKindWorktree: "worktree",
+}
+
 func (i ItemKind) String() string {
-	switch i {
-	case ItemKindBranch:
-		return "branch"
-	case ItemKindStash:
-		return "stash"
-	case ItemKindWorktree:
-		return "worktree"
-	default:
-		return "unknown"
-	}
+	return enumName(itemKindNames, i, "unknown")
 }
@@ -136,3 +136,18 @@ func TestItemKindString(t *testing.T) {
 		}
 	}
 }
+
+func TestEnumNamesOutOfRange(t *testing.T) {
+	if got := FilterMode(-1).String(); got != "Unknown" {
+		t.Errorf("expected Unknown for negative filter mode, got %s", got)
+	}
+	if got := FilterMode(99).ShortKey(); got != "?" {
+		t.Errorf("expected ? for unknown filter mode, got %s", got)
+	}
+	if got := SortMode(99).String(); got != "Unknown" {
+		t.Errorf("expected Unknown for unknown sort mode, got %s", got)
+	}
+	if got := VCSType(99).String(); got != "unknown" {
+		t.Errorf("expected unknown for unknown VCS type, got %s", got)
+	}
+}
@@ -30,15 +30,14 @@ const (
 	SortDirectionDesc
 )
 
+var sortDirectionNames = []string{
+	SortDirectionOff:  "",
+	SortDirectionAsc:  "ASC",
+	SortDirectionDesc: "DESC",
+}
+
 func (d SortDirection) String() string {
-	switch d {
-	case SortDirectionAsc:
-		return "ASC"
-	case SortDirectionDesc:
-		return "DESC"
-	default:
-		return ""
-	}
+	return enumName(sortDirectionNames, d, "")
 }
 
 type ActiveSort struct {
@@ -1,8 +1,8 @@
 package models
 
 import (
-	"fmt"
 	"path/filepath"
+	"strconv"
 	"time"
 )
 
@@ -11,6 +11,7 @@ type RepoSummary struct {
 	VCSType       VCSType
 	Branch        string
 	Upstream      string
+	HeadSHA       string
 	Ahead         int
 	Behind        int
 	Staged        int
@@ -29,6 +30,18 @@ func (r RepoSummary) Name() string {
 	return filepath.Base(r.Path)
 }
 
+// WithPRInfo returns a copy of the summary with its PR replaced.
+func (r RepoSummary) WithPRInfo(pr *PRInfo) RepoSummary {
+	r.PRInfo = pr
+	return r
+}
+
+// WithWorkflowInfo returns a copy of the summary with its workflow status replaced.
+func (r RepoSummary) WithWorkflowInfo(workflow *WorkflowSummary) RepoSummary {
+	r.WorkflowInfo = workflow
+	return r
+}
+
 func (r RepoSummary) UncommittedCount() int {
 	return r.Staged + r.Unstaged + r.Untracked + r.Conflicted
 }
@@ -54,39 +67,35 @@ func (r RepoSummary) Status() RepoStatus {
 }
 
 func (r RepoSummary) StatusSummary() string {
-	parts := []string{}
-
-	if r.Staged > 0 {
-		parts = append(parts, fmt.Sprintf("+%d", r.Staged))
-	}
-	if r.Unstaged > 0 {
-		parts = append(parts, fmt.Sprintf("~%d", r.Unstaged))
-	}
-	if r.Untracked > 0 {
-		parts = append(parts, fmt.Sprintf("?%d", r.Untracked))
-	}
-	if r.Conflicted > 0 {
-		parts = append(parts, fmt.Sprintf("!%d", r.Conflicted))
-	}
-	if r.Ahead > 0 {
-		parts = append(parts, fmt.Sprintf("↑%d", r.Ahead))
-	}
-	if r.Behind > 0 {
-		parts = append(parts, fmt.Sprintf("↓%d", r.Behind))
+	// Most repos are clean, so that case returns before building anything.
+	if r.Staged == 0 && r.Unstaged == 0 && r.Untracked == 0 && r.Conflicted == 0 && r.Ahead == 0 && r.Behind == 0 {
+		return "✓"
 	}
 
-	if len(parts) == 0 {
+	buf := make([]byte, 0, 32)
+	buf = appendCount(buf, "+", r.Staged)
+	buf = appendCount(buf, "~", r.Unstaged)
+	buf = appendCount(buf, "?", r.Untracked)
+	buf = appendCount(buf, "!", r.Conflicted)
+	buf = appendCount(buf, "↑", r.Ahead)
+	buf = appendCount(buf, "↓", r.Behind)
+	if len(buf) == 0 {
 		return "✓"
 	}
+	return string(buf)
+}
 
-	result := ""
-	for i, p := range parts {
-		if i > 0 {
-			result += " "
-		}
-		result += p
+// appendCount appends prefix and n, space-separated from any earlier part,
+// when n is non-zero.
+func appendCount(buf []byte, prefix string, n int) []byte {
+	if n <= 0 {
+		return buf
+	}
+	if len(buf) > 0 {
+		buf = append(buf, ' ')
 	}
-	return result
+	buf = append(buf, prefix...)
+	return strconv.AppendInt(buf, int64(n), 10)
 }
 
 func (r RepoSummary) RelativeModified() string {
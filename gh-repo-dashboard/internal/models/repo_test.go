@@ -154,6 +154,11 @@ func TestRepoSummaryStatusSummary(t *testing.T) {
 			summary:  RepoSummary{Staged: 1, Unstaged: 2, Ahead: 3},
 			expected: "+1 ~2 ↑3",
 		},
+		{
+			name:     "every count",
+			summary:  RepoSummary{Staged: 1, Unstaged: 2, Untracked: 3, Conflicted: 4, Ahead: 5, Behind: 6},
+			expected: "+1 ~2 ?3 !4 ↑5 ↓6",
+		},
 	}
 
 	for _, tt := range tests {
@@ -176,3 +181,20 @@ func TestRepoSummaryRelativeModified(t *testing.T) {
 		t.Error("expected non-empty relative time")
 	}
 }
+
+func TestRepoSummaryWithPRInfo(t *testing.T) {
+	original := RepoSummary{Path: "/repo", Branch: "main", Ahead: 2}
+	pr := &PRInfo{Number: 7}
+
+	updated := original.WithPRInfo(pr)
+
+	if updated.PRInfo != pr {
+		t.Error("expected PR to be set on the copy")
+	}
+	if updated.Branch != "main" || updated.Ahead != 2 {
+		t.Error("expected other fields to be preserved")
+	}
+	if original.PRInfo != nil {
+		t.Error("expected original summary to be unchanged")
+	}
+}
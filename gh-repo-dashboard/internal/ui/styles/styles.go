@@ -144,6 +144,68 @@ var (
 
 	TabSeparatorStyle = lipgloss.NewStyle().
 				Foreground(Surface1)
+
+	EmptyStateStyle = lipgloss.NewStyle().
+			Border(lipgloss.RoundedBorder()).
+			BorderForeground(Surface1).
+			Padding(2, 4).
+			Foreground(Subtext0)
+
+	CompactEmptyStateStyle = EmptyStateStyle.
+				Padding(1, 2)
+
+	SectionStyle = lipgloss.NewStyle().
+			Foreground(Blue).
+			Bold(true).
+			PaddingLeft(1)
+
+	SpacedSectionStyle = SectionStyle.
+				PaddingTop(1)
+
+	InfoStyle = lipgloss.NewStyle().
+			Foreground(Text).
+			PaddingLeft(2)
+
+	InfoWarningStyle = lipgloss.NewStyle().
+				Foreground(Peach).
+				PaddingLeft(2)
+
+	DetailLabelStyle = lipgloss.NewStyle().
+				Foreground(Subtext0).
+				Width(18)
+
+	PRLabelStyle = DetailLabelStyle.
+			Width(16)
+
+	ActionStyle = lipgloss.NewStyle().
+			Foreground(Blue).
+			PaddingLeft(2)
+
+	IndentStyle = lipgloss.NewStyle().
+			PaddingLeft(2)
+
+	LoadingStyle = lipgloss.NewStyle().
+			Foreground(Blue).
+			Padding(2)
+
+	LoadingHintStyle = lipgloss.NewStyle().
+				Foreground(Subtext0).
+				Italic(true)
+
+	CheckStyle = lipgloss.NewStyle().
+			Foreground(Green)
+
+	InvertedCheckStyle = lipgloss.NewStyle().
+				Foreground(Peach)
+
+	ShortKeyStyle = lipgloss.NewStyle().
+			Foreground(Mauve).
+			Bold(true)
+
+	StatusMessageStyle = lipgloss.NewStyle().
+				Foreground(Green).
+				Background(Surface0).
+				Padding(0, 1)
 )
 
 func Badge(text string, style lipgloss.Style) string {
@@ -2,29 +2,78 @@ package vcs
 
 import (
 	"os"
+	"os/exec"
 	"path/filepath"
+	"sync"
 
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
 )
 
+// vcsTypes remembers each repo's detected type. Batch tasks, loaders and gh
+// calls all ask again for the same repos, and a repo's type only changes when
+// it is converted, which a refresh picks up via InvalidateVCSCache.
+var vcsTypes sync.Map
+
 func DetectVCSType(repoPath string) models.VCSType {
+	if vcsType, ok := vcsTypes.Load(repoPath); ok {
+		return vcsType.(models.VCSType)
+	}
+	vcsType := models.VCSTypeGit
 	if _, err := os.Stat(filepath.Join(repoPath, ".jj")); err == nil {
-		return models.VCSTypeJJ
+		vcsType = models.VCSTypeJJ
+	}
+	vcsTypes.Store(repoPath, vcsType)
+	return vcsType
+}
+
+// InvalidateVCSCache forgets every detected repo type and GitHub environment.
+func InvalidateVCSCache() {
+	for _, m := range []*sync.Map{&vcsTypes, &gitHubEnvs} {
+		m.Range(func(key, _ any) bool {
+			m.Delete(key)
+			return true
+		})
 	}
-	return models.VCSTypeGit
 }
 
 func GetOperations(repoPath string) Operations {
-	vcsType := DetectVCSType(repoPath)
+	return OperationsFor(DetectVCSType(repoPath))
+}
+
+// The operations hold no state, so one of each is shared by every repo.
+var (
+	gitOps Operations = NewGitOperations()
+	jjOps  Operations = NewJJOperations()
+)
+
+// OperationsFor returns the operations for an already known VCS type,
+// skipping detection.
+func OperationsFor(vcsType models.VCSType) Operations {
 	switch vcsType {
 	case models.VCSTypeJJ:
-		return NewJJOperations()
+		return jjOps
 	default:
-		return NewGitOperations()
+		return gitOps
 	}
 }
 
+// gitHubEnvs remembers GetGitHubEnv per repo; like vcsTypes it is cleared by
+// InvalidateVCSCache.
+var gitHubEnvs sync.Map
+
+// GetGitHubEnv returns the extra environment gh and git need to find a jj
+// repo's git store, or nil when none is needed. The slice is shared between
+// callers and must not be modified.
 func GetGitHubEnv(repoPath string) []string {
+	if env, ok := gitHubEnvs.Load(repoPath); ok {
+		return env.([]string)
+	}
+	env := gitHubEnv(repoPath)
+	gitHubEnvs.Store(repoPath, env)
+	return env
+}
+
+func gitHubEnv(repoPath string) []string {
 	vcsType := DetectVCSType(repoPath)
 	if vcsType == models.VCSTypeJJ {
 		colocatedGit := filepath.Join(repoPath, ".git")
@@ -37,16 +86,34 @@ func GetGitHubEnv(repoPath string) []string {
 	return nil
 }
 
+// IsRepo reports whether path holds a .git or .jj entry. Lstat accepts a
+// .git file (worktrees, submodules) as well as a directory without following
+// links.
 func IsRepo(path string) bool {
-	gitDir := filepath.Join(path, ".git")
-	if _, err := os.Stat(gitDir); err == nil {
+	if _, err := os.Lstat(filepath.Join(path, ".git")); err == nil {
 		return true
 	}
 
-	jjDir := filepath.Join(path, ".jj")
-	if _, err := os.Stat(jjDir); err == nil {
+	if _, err := os.Lstat(filepath.Join(path, ".jj")); err == nil {
 		return true
 	}
 
 	return false
 }
+
+var binaryPaths sync.Map
+
+// Binary returns the absolute path of the named executable, searching PATH
+// once per name. When the lookup fails the bare name is returned so that
+// running it reports the usual not-found error.
+func Binary(name string) string {
+	if path, ok := binaryPaths.Load(name); ok {
+		return path.(string)
+	}
+	path, err := exec.LookPath(name)
+	if err != nil {
+		return name
+	}
+	binaryPaths.Store(name, path)
+	return path
+}
@@ -56,6 +56,28 @@ func TestDetectVCSType(t *testing.T) {
 	}
 }
 
+func TestDetectVCSTypeCachedUntilInvalidated(t *testing.T) {
+	dir := t.TempDir()
+	if err := os.Mkdir(filepath.Join(dir, ".git"), 0755); err != nil {
+		t.Fatal(err)
+	}
+	if got := DetectVCSType(dir); got != models.VCSTypeGit {
+		t.Fatalf("expected git, got %v", got)
+	}
+
+	if err := os.Mkdir(filepath.Join(dir, ".jj"), 0755); err != nil {
+		t.Fatal(err)
+	}
+	if got := DetectVCSType(dir); got != models.VCSTypeGit {
+		t.Errorf("expected cached git before invalidation, got %v", got)
+	}
+
+	InvalidateVCSCache()
+	if got := DetectVCSType(dir); got != models.VCSTypeJJ {
+		t.Errorf("expected jj after invalidation, got %v", got)
+	}
+}
+
 func TestGetOperations(t *testing.T) {
 	tests := []struct {
 		name        string
@@ -105,6 +127,13 @@ func TestIsRepo(t *testing.T) {
 			setup:    func(dir string) error { return os.Mkdir(filepath.Join(dir, ".jj"), 0755) },
 			expected: true,
 		},
+		{
+			name: "git worktree file",
+			setup: func(dir string) error {
+				return os.WriteFile(filepath.Join(dir, ".git"), []byte("gitdir: /elsewhere\n"), 0644)
+			},
+			expected: true,
+		},
 		{
 			name:     "not a repo",
 			setup:    func(dir string) error { return nil },
@@ -183,3 +212,41 @@ func TestGetGitHubEnv(t *testing.T) {
 		})
 	}
 }
+
+func TestGetGitHubEnvCachedUntilInvalidated(t *testing.T) {
+	dir := t.TempDir()
+	if err := os.MkdirAll(filepath.Join(dir, ".jj", "repo", "store", "git"), 0755); err != nil {
+		t.Fatal(err)
+	}
+	if env := GetGitHubEnv(dir); len(env) != 1 {
+		t.Fatalf("expected GIT_DIR env, got %v", env)
+	}
+
+	// Colocating adds .git, which makes the env unnecessary.
+	if err := os.Mkdir(filepath.Join(dir, ".git"), 0755); err != nil {
+		t.Fatal(err)
+	}
+	if env := GetGitHubEnv(dir); len(env) != 1 {
+		t.Errorf("expected cached GIT_DIR env before invalidation, got %v", env)
+	}
+
+	InvalidateVCSCache()
+	if env := GetGitHubEnv(dir); len(env) != 0 {
+		t.Errorf("expected no env after invalidation, got %v", env)
+	}
+}
+
+func TestBinary(t *testing.T) {
+	path := Binary("sh")
+	if !filepath.IsAbs(path) {
+		t.Skipf("sh not found on PATH: %q", path)
+	}
+	if again := Binary("sh"); again != path {
+		t.Errorf("expected cached %q, got %q", path, again)
+	}
+
+	missing := "definitely-not-a-real-binary"
+	if got := Binary(missing); got != missing {
+		t.Errorf("expected bare name for missing binary, got %q", got)
+	}
+}
@@ -1,14 +1,14 @@
 package vcs
 
 import (
-	"bufio"
+	"bytes"
 	"context"
 	"fmt"
 	"os/exec"
 	"path/filepath"
-	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
@@ -25,16 +25,32 @@ func (g *GitOperations) VCSType() models.VCSType {
 }
 
 func (g *GitOperations) runGit(ctx context.Context, repoPath string, args ...string) (string, error) {
-	cmd := exec.CommandContext(ctx, "git", args...)
+	out, err := g.outputGit(ctx, repoPath, args...)
+	if err != nil {
+		return "", err
+	}
+	return strings.TrimSpace(string(out)), nil
+}
+
+// outputGit returns the raw stdout of a git command, for callers that parse
+// bytes directly rather than converting the whole output to a string.
+func (g *GitOperations) outputGit(ctx context.Context, repoPath string, args ...string) ([]byte, error) {
+	release, err := acquireProcess(ctx)
+	if err != nil {
+		return nil, err
+	}
+	defer release()
+
+	cmd := exec.CommandContext(ctx, Binary("git"), args...)
 	cmd.Dir = repoPath
 	out, err := cmd.Output()
 	if err != nil {
 		if exitErr, ok := err.(*exec.ExitError); ok {
-			return "", fmt.Errorf("git %s: %s", strings.Join(args, " "), string(exitErr.Stderr))
+			return nil, fmt.Errorf("git %s: %s", strings.Join(args, " "), string(exitErr.Stderr))
 		}
-		return "", err
+		return nil, err
 	}
-	return strings.TrimSpace(string(out)), nil
+	return out, nil
 }
 
 func (g *GitOperations) GetRepoSummary(ctx context.Context, repoPath string) (models.RepoSummary, error) {
@@ -43,51 +59,67 @@ func (g *GitOperations) GetRepoSummary(ctx context.Context, repoPath string) (mo
 		VCSType: models.VCSTypeGit,
 	}
 
-	branch, err := g.GetCurrentBranch(ctx, repoPath)
-	if err != nil {
-		return summary, err
-	}
-	summary.Branch = branch
+	// One porcelain v2 status call carries the branch, upstream, ahead/behind
+	// and file counts; stash and last-commit lookups run alongside it.
+	var wg sync.WaitGroup
+	wg.Add(2)
 
-	upstream, _ := g.GetUpstream(ctx, repoPath, branch)
-	summary.Upstream = upstream
-
-	if upstream != "" {
-		ahead, behind, _ := g.GetAheadBehind(ctx, repoPath, branch, upstream)
-		summary.Ahead = ahead
-		summary.Behind = behind
-	}
+	go func() {
+		defer wg.Done()
+		summary.StashCount, _ = g.getStashCount(ctx, repoPath)
+	}()
 
-	staged, unstaged, untracked, conflicted := g.getStatusCounts(ctx, repoPath)
-	summary.Staged = staged
-	summary.Unstaged = unstaged
-	summary.Untracked = untracked
-	summary.Conflicted = conflicted
+	go func() {
+		defer wg.Done()
+		lastMod, _ := g.GetLastModified(ctx, repoPath)
+		if lastMod > 0 {
+			summary.LastModified = time.Unix(lastMod, 0)
+		}
+	}()
 
-	stashCount, _ := g.getStashCount(ctx, repoPath)
-	summary.StashCount = stashCount
+	out, err := g.outputGit(ctx, repoPath, "status", "--porcelain=v2", "--branch", "-z")
+	wg.Wait()
+	if err != nil {
+		return summary, err
+	}
 
-	lastMod, _ := g.GetLastModified(ctx, repoPath)
-	if lastMod > 0 {
-		summary.LastModified = time.Unix(lastMod, 0)
+	status := parseStatusV2(out)
+	summary.Branch = status.branchLabel()
+	summary.Upstream = status.upstream
+	if status.oid != "(initial)" {
+		summary.HeadSHA = status.oid
 	}
+	summary.Ahead, summary.Behind = status.ahead, status.behind
+	summary.Staged, summary.Unstaged = status.staged, status.unstaged
+	summary.Untracked, summary.Conflicted = status.untracked, status.conflicted
 
 	return summary, nil
 }
 
 func (g *GitOperations) GetCurrentBranch(ctx context.Context, repoPath string) (string, error) {
-	out, err := g.runGit(ctx, repoPath, "rev-parse", "--abbrev-ref", "HEAD")
+	if branch, err := readCurrentBranch(repoPath); err == nil {
+		return branch, nil
+	}
+
+	// One rev-parse prints the commit and then the symbolic name, which is
+	// plain "HEAD" when detached.
+	out, err := g.runGit(ctx, repoPath, "rev-parse", "HEAD", "--symbolic-full-name", "HEAD")
 	if err != nil {
 		return "", err
 	}
-	if out == "HEAD" {
-		hash, err := g.runGit(ctx, repoPath, "rev-parse", "--short", "HEAD")
-		if err != nil {
-			return "HEAD", nil
-		}
-		return fmt.Sprintf("(%s)", hash), nil
+	hash, ref, _ := strings.Cut(out, "\n")
+	if branch, ok := strings.CutPrefix(ref, "refs/heads/"); ok {
+		return branch, nil
 	}
-	return out, nil
+	return detachedLabel(hash), nil
+}
+
+// detachedLabel is how a detached HEAD is shown in place of a branch name.
+func detachedLabel(hash string) string {
+	if len(hash) < 7 {
+		return "HEAD"
+	}
+	return "(" + hash[:7] + ")"
 }
 
 func (g *GitOperations) GetUpstream(ctx context.Context, repoPath string, branch string) (string, error) {
@@ -115,34 +147,101 @@ func (g *GitOperations) GetAheadBehind(ctx context.Context, repoPath string, bra
 }
 
 func (g *GitOperations) getStatusCounts(ctx context.Context, repoPath string) (staged, unstaged, untracked, conflicted int) {
-	out, err := g.runGit(ctx, repoPath, "status", "--porcelain", "-z")
+	out, err := g.outputGit(ctx, repoPath, "status", "--porcelain=v2", "-z")
 	if err != nil {
 		return
 	}
 
-	entries := strings.Split(out, "\x00")
-	for _, entry := range entries {
-		if len(entry) < 2 {
+	status := parseStatusV2(out)
+	return status.staged, status.unstaged, status.untracked, status.conflicted
+}
+
+// statusV2 holds the fields parsed from `git status --porcelain=v2 --branch -z`.
+type statusV2 struct {
+	oid        string
+	head       string
+	upstream   string
+	ahead      int
+	behind     int
+	staged     int
+	unstaged   int
+	untracked  int
+	conflicted int
+}
+
+func (s statusV2) detached() bool {
+	return s.head == "(detached)"
+}
+
+// branchLabel matches GetCurrentBranch: the branch name, or the short commit
+// hash in parentheses when HEAD is detached.
+func (s statusV2) branchLabel() string {
+	if s.detached() {
+		return detachedLabel(s.oid)
+	}
+	return s.head
+}
+
+// parseStatusV2 walks the NUL-separated records in place; only the branch
+// header values are copied out as strings.
+func parseStatusV2(out []byte) statusV2 {
+	var s statusV2
+
+	for len(out) > 0 {
+		var record []byte
+		record, out, _ = bytes.Cut(out, []byte{0})
+		if len(record) < 2 {
 			continue
 		}
-		x := entry[0]
-		y := entry[1]
-
-		switch {
-		case x == 'U' || y == 'U' || (x == 'D' && y == 'D') || (x == 'A' && y == 'A'):
-			conflicted++
-		case x == '?':
-			untracked++
-		default:
-			if x != ' ' && x != '?' {
-				staged++
+
+		switch record[0] {
+		case '#':
+			key, value, _ := bytes.Cut(record[2:], []byte{' '})
+			switch string(key) {
+			case "branch.oid":
+				s.oid = string(value)
+			case "branch.head":
+				s.head = string(value)
+			case "branch.upstream":
+				s.upstream = string(value)
+			case "branch.ab":
+				a, b, _ := bytes.Cut(value, []byte{' '})
+				s.ahead = parseCount(bytes.TrimPrefix(a, []byte{'+'}))
+				s.behind = parseCount(bytes.TrimPrefix(b, []byte{'-'}))
+			}
+		case '1', '2':
+			if len(record) < 4 {
+				continue
+			}
+			if record[2] != '.' {
+				s.staged++
 			}
-			if y != ' ' && y != '?' {
-				unstaged++
+			if record[3] != '.' {
+				s.unstaged++
 			}
+			if record[0] == '2' {
+				// Renames and copies are followed by their original path.
+				_, out, _ = bytes.Cut(out, []byte{0})
+			}
+		case 'u':
+			s.conflicted++
+		case '?':
+			s.untracked++
 		}
 	}
-	return
+
+	return s
+}
+
+func parseCount(digits []byte) int {
+	n := 0
+	for _, c := range digits {
+		if c < '0' || c > '9' {
+			return 0
+		}
+		n = n*10 + int(c-'0')
+	}
+	return n
 }
 
 func (g *GitOperations) GetStagedCount(ctx context.Context, repoPath string) (int, error) {
@@ -166,6 +265,10 @@ func (g *GitOperations) GetConflictedCount(ctx context.Context, repoPath string)
 }
 
 func (g *GitOperations) getStashCount(ctx context.Context, repoPath string) (int, error) {
+	if count, err := readStashCount(repoPath); err == nil {
+		return count, nil
+	}
+
 	out, err := g.runGit(ctx, repoPath, "stash", "list")
 	if err != nil {
 		return 0, err
@@ -183,82 +286,110 @@ func (g *GitOperations) GetBranchList(ctx context.Context, repoPath string) ([]m
 		return nil, err
 	}
 
-	var branches []models.BranchInfo
-	scanner := bufio.NewScanner(strings.NewReader(out))
-	trackRe := regexp.MustCompile(`\[ahead (\d+)(?:, behind (\d+))?\]|\[behind (\d+)\]`)
+	return parseBranchList(out), nil
+}
 
-	for scanner.Scan() {
-		line := scanner.Text()
-		parts := strings.Split(line, "\t")
-		if len(parts) < 5 {
-			continue
-		}
+func parseBranchList(out string) []models.BranchInfo {
+	if out == "" {
+		return nil
+	}
 
-		var ahead, behind int
-		if matches := trackRe.FindStringSubmatch(parts[2]); matches != nil {
-			if matches[1] != "" {
-				ahead, _ = strconv.Atoi(matches[1])
-			}
-			if matches[2] != "" {
-				behind, _ = strconv.Atoi(matches[2])
-			}
-			if matches[3] != "" {
-				behind, _ = strconv.Atoi(matches[3])
+	branches := make([]models.BranchInfo, 0, strings.Count(out, "\n")+1)
+	for len(out) > 0 {
+		var line string
+		line, out, _ = strings.Cut(out, "\n")
+
+		var fields [5]string
+		var ok bool
+		for i := range fields[:4] {
+			if fields[i], line, ok = strings.Cut(line, "\t"); !ok {
+				break
 			}
 		}
+		if !ok {
+			continue
+		}
+		fields[4] = line
 
-		ts, _ := strconv.ParseInt(parts[3], 10, 64)
+		ahead, behind := parseTrack(fields[2])
+		ts, _ := strconv.ParseInt(fields[3], 10, 64)
 
 		branches = append(branches, models.BranchInfo{
-			Name:       parts[0],
-			Upstream:   parts[1],
+			Name:       fields[0],
+			Upstream:   fields[1],
 			Ahead:      ahead,
 			Behind:     behind,
 			LastCommit: time.Unix(ts, 0),
-			IsCurrent:  parts[4] == "*",
+			IsCurrent:  fields[4] == "*",
 		})
 	}
 
-	return branches, nil
+	return branches
+}
+
+// parseTrack reads %(upstream:track) output such as "[ahead 1, behind 2]",
+// "[behind 3]" or "[gone]".
+func parseTrack(track string) (ahead, behind int) {
+	track = strings.TrimSuffix(strings.TrimPrefix(track, "["), "]")
+	for track != "" {
+		var field string
+		field, track, _ = strings.Cut(track, ", ")
+		name, count, _ := strings.Cut(field, " ")
+		switch name {
+		case "ahead":
+			ahead, _ = strconv.Atoi(count)
+		case "behind":
+			behind, _ = strconv.Atoi(count)
+		}
+	}
+	return ahead, behind
 }
 
 func (g *GitOperations) GetStashList(ctx context.Context, repoPath string) ([]models.StashDetail, error) {
-	format := "%(reflog:short)\t%(reflog:subject)\t%(committerdate:unix)"
-	out, err := g.runGit(ctx, repoPath, "stash", "list", "--format="+format)
+	// One process reports every stash. The for-each-ref style %(...)
+	// placeholders are not expanded by `git log` formats, so use %gd/%gs.
+	out, err := g.runGit(ctx, repoPath, "stash", "list", "-z", "--format=%gd%x09%gs%x09%ct")
 	if err != nil {
 		return nil, err
 	}
 
+	return parseStashList(out), nil
+}
+
+// parseStashList reads NUL-separated "stash@{N}\tsubject\tunix-time" records.
+func parseStashList(out string) []models.StashDetail {
 	if out == "" {
-		return nil, nil
+		return nil
 	}
 
-	var stashes []models.StashDetail
-	scanner := bufio.NewScanner(strings.NewReader(out))
-	stashRe := regexp.MustCompile(`stash@\{(\d+)\}`)
+	stashes := make([]models.StashDetail, 0, strings.Count(out, "\x00")+1)
 
-	for scanner.Scan() {
-		line := scanner.Text()
-		parts := strings.Split(line, "\t")
-		if len(parts) < 3 {
+	for len(out) > 0 {
+		var record string
+		record, out, _ = strings.Cut(out, "\x00")
+
+		selector, rest, ok := strings.Cut(record, "\t")
+		if !ok {
 			continue
 		}
-
-		var index int
-		if matches := stashRe.FindStringSubmatch(parts[0]); matches != nil {
-			index, _ = strconv.Atoi(matches[1])
+		// Cut the timestamp from the end so tabs in the subject survive.
+		message, timestamp := rest, ""
+		if i := strings.LastIndexByte(rest, '\t'); i >= 0 {
+			message, timestamp = rest[:i], rest[i+1:]
 		}
 
-		ts, _ := strconv.ParseInt(parts[2], 10, 64)
+		number := strings.TrimSuffix(strings.TrimPrefix(selector, "stash@{"), "}")
+		index, _ := strconv.Atoi(number)
+		ts, _ := strconv.ParseInt(timestamp, 10, 64)
 
 		stashes = append(stashes, models.StashDetail{
 			Index:   index,
-			Message: parts[1],
+			Message: message,
 			Date:    time.Unix(ts, 0),
 		})
 	}
 
-	return stashes, nil
+	return stashes
 }
 
 func (g *GitOperations) GetWorktreeList(ctx context.Context, repoPath string) ([]models.WorktreeInfo, error) {
@@ -267,63 +398,91 @@ func (g *GitOperations) GetWorktreeList(ctx context.Context, repoPath string) ([
 		return nil, err
 	}
 
+	return parseWorktrees(out), nil
+}
+
+// parseWorktrees reads `git worktree list --porcelain` output, where each
+// worktree is a block of "key value" lines starting with its path.
+func parseWorktrees(out string) []models.WorktreeInfo {
 	var worktrees []models.WorktreeInfo
-	var current models.WorktreeInfo
-
-	scanner := bufio.NewScanner(strings.NewReader(out))
-	for scanner.Scan() {
-		line := scanner.Text()
-		switch {
-		case strings.HasPrefix(line, "worktree "):
-			if current.Path != "" {
-				worktrees = append(worktrees, current)
-			}
-			current = models.WorktreeInfo{Path: strings.TrimPrefix(line, "worktree ")}
-		case strings.HasPrefix(line, "branch "):
-			ref := strings.TrimPrefix(line, "branch ")
-			current.Branch = strings.TrimPrefix(ref, "refs/heads/")
-		case line == "bare":
+	var head string
+
+	for len(out) > 0 {
+		var line string
+		line, out, _ = strings.Cut(out, "\n")
+		key, value, _ := strings.Cut(line, " ")
+
+		if key == "worktree" {
+			worktrees = append(worktrees, models.WorktreeInfo{Path: value})
+			head = ""
+			continue
+		}
+		if len(worktrees) == 0 {
+			continue
+		}
+
+		current := &worktrees[len(worktrees)-1]
+		switch key {
+		case "HEAD":
+			head = value
+		case "branch":
+			current.Branch = strings.TrimPrefix(value, "refs/heads/")
+		case "detached":
+			// Label detached worktrees the way the repo summary does.
+			current.Branch = detachedLabel(head)
+		case "bare":
 			current.IsBare = true
-		case line == "locked":
+		case "locked":
 			current.IsLocked = true
 		}
 	}
 
-	if current.Path != "" {
-		worktrees = append(worktrees, current)
-	}
-
-	return worktrees, nil
+	return worktrees
 }
 
 func (g *GitOperations) GetCommitLog(ctx context.Context, repoPath string, count int) ([]models.CommitInfo, error) {
-	format := "%H\t%h\t%s\t%an\t%ct"
-	out, err := g.runGit(ctx, repoPath, "log", fmt.Sprintf("-n%d", count), "--format="+format)
+	// Fields are split by the ASCII unit separator and commits by NUL, so
+	// subjects and author names cannot be mistaken for delimiters.
+	format := "%H%x1f%h%x1f%s%x1f%an%x1f%ct"
+	out, err := g.runGit(ctx, repoPath, "log", "-z", fmt.Sprintf("-n%d", count), "--format="+format)
 	if err != nil {
 		return nil, err
 	}
 
-	var commits []models.CommitInfo
-	scanner := bufio.NewScanner(strings.NewReader(out))
+	return parseCommitLog(out), nil
+}
+
+func parseCommitLog(out string) []models.CommitInfo {
+	if out == "" {
+		return nil
+	}
+
+	commits := make([]models.CommitInfo, 0, strings.Count(out, "\x00")+1)
 
-	for scanner.Scan() {
-		parts := strings.Split(scanner.Text(), "\t")
-		if len(parts) < 5 {
+	for len(out) > 0 {
+		var record string
+		record, out, _ = strings.Cut(out, "\x00")
+
+		var fields [5]string
+		for i := range fields {
+			fields[i], record, _ = strings.Cut(record, "\x1f")
+		}
+		if fields[4] == "" {
 			continue
 		}
 
-		ts, _ := strconv.ParseInt(parts[4], 10, 64)
+		ts, _ := strconv.ParseInt(fields[4], 10, 64)
 
 		commits = append(commits, models.CommitInfo{
-			Hash:      parts[0],
-			ShortHash: parts[1],
-			Subject:   parts[2],
-			Author:    parts[3],
+			Hash:      fields[0],
+			ShortHash: fields[1],
+			Subject:   fields[2],
+			Author:    fields[3],
 			Date:      time.Unix(ts, 0),
 		})
 	}
 
-	return commits, nil
+	return commits
 }
 
 func (g *GitOperations) GetLastModified(ctx context.Context, repoPath string) (int64, error) {
@@ -359,39 +518,100 @@ func (g *GitOperations) PruneRemote(ctx context.Context, repoPath string) (bool,
 }
 
 func (g *GitOperations) CleanupMergedBranches(ctx context.Context, repoPath string) (bool, string, error) {
-	mainBranch := "main"
-	if _, err := g.runGit(ctx, repoPath, "rev-parse", "--verify", "main"); err != nil {
-		if _, err := g.runGit(ctx, repoPath, "rev-parse", "--verify", "master"); err == nil {
-			mainBranch = "master"
-		} else {
-			return false, "Could not find main or master branch", nil
-		}
+	// One for-each-ref answers both "is there a main?" and "is there a
+	// master?" instead of two rev-parse probes.
+	heads, err := g.runGit(ctx, repoPath, "for-each-ref", "--format=%(refname:lstrip=2)", "refs/heads/main", "refs/heads/master")
+	if err != nil {
+		return false, err.Error(), nil
+	}
+	mainBranch, ok := pickMainBranch(heads)
+	if !ok {
+		return false, "Could not find main or master branch", nil
 	}
 
-	out, err := g.runGit(ctx, repoPath, "branch", "--merged", mainBranch)
+	// for-each-ref prints bare branch names, with none of the "* " and "+ "
+	// markers `git branch --merged` adds, so each line is used as is.
+	// lstrip=2 rather than short keeps names whole even when a tag shares
+	// them.
+	out, err := g.runGit(ctx, repoPath, "for-each-ref", "--merged="+mainBranch, "--format=%(refname:lstrip=2)", "refs/heads/")
 	if err != nil {
 		return false, err.Error(), nil
 	}
+	merged := mergedBranches(out, mainBranch)
+
+	deleted := g.deleteBranches(ctx, repoPath, merged)
+	if len(deleted) == 0 {
+		return true, "No merged branches to delete", nil
+	}
+	return true, fmt.Sprintf("Deleted %d branches: %s", len(deleted), strings.Join(deleted, ", ")), nil
+}
+
+// deleteBranches removes branches with a single `git branch -d` and returns
+// the ones that are gone. git deletes what it can and fails for the rest
+// (for example a branch checked out in another worktree), so on failure the
+// remaining heads are listed to see which deletions went through.
+func (g *GitOperations) deleteBranches(ctx context.Context, repoPath string, branches []string) []string {
+	if len(branches) == 0 {
+		return nil
+	}
+	args := append([]string{"branch", "-d"}, branches...)
+	if _, err := g.runGit(ctx, repoPath, args...); err == nil {
+		return branches
+	}
 
-	var deleted []string
-	scanner := bufio.NewScanner(strings.NewReader(out))
-	for scanner.Scan() {
-		branch := strings.TrimSpace(scanner.Text())
-		branch = strings.TrimPrefix(branch, "* ")
+	remaining, err := g.runGit(ctx, repoPath, "for-each-ref", "--format=%(refname:lstrip=2)", "refs/heads/")
+	if err != nil {
+		return nil
+	}
+	return missingBranches(branches, remaining)
+}
 
-		if branch == mainBranch || branch == "master" || branch == "main" || branch == "" {
+// mergedBranches returns the branches listed by for-each-ref, skipping the
+// main branch and the other default branch name.
+func mergedBranches(out string, mainBranch string) []string {
+	var merged []string
+	for _, branch := range strings.Split(out, "\n") {
+		if branch == "" || branch == mainBranch || branch == "main" || branch == "master" {
 			continue
 		}
+		merged = append(merged, branch)
+	}
+	return merged
+}
 
-		if _, err := g.runGit(ctx, repoPath, "branch", "-d", branch); err == nil {
-			deleted = append(deleted, branch)
+// pickMainBranch prefers main over master among the heads listed by
+// for-each-ref.
+func pickMainBranch(heads string) (string, bool) {
+	hasMaster := false
+	for _, head := range strings.Split(heads, "\n") {
+		switch strings.TrimSpace(head) {
+		case "main":
+			return "main", true
+		case "master":
+			hasMaster = true
 		}
 	}
+	if hasMaster {
+		return "master", true
+	}
+	return "", false
+}
 
-	if len(deleted) == 0 {
-		return true, "No merged branches to delete", nil
+// missingBranches returns the branches, in order, that are absent from the
+// newline-separated list of heads.
+func missingBranches(branches []string, heads string) []string {
+	present := make(map[string]bool)
+	for _, head := range strings.Split(heads, "\n") {
+		present[strings.TrimSpace(head)] = true
 	}
-	return true, fmt.Sprintf("Deleted %d branches: %s", len(deleted), strings.Join(deleted, ", ")), nil
+
+	var missing []string
+	for _, branch := range branches {
+		if !present[branch] {
+			missing = append(missing, branch)
+		}
+	}
+	return missing
 }
 
 func ExtractRepoPath(remoteURL string) string {
@@ -1,11 +1,11 @@
 package vcs
 
 import (
-	"bufio"
-	"regexp"
 	"strconv"
 	"strings"
 	"testing"
+
+	"github.com/kyleking/gh-repo-dashboard/internal/models"
 )
 
 func TestExtractRepoPath(t *testing.T) {
@@ -242,7 +242,7 @@ func TestParseBranchTrackingInfo(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			ahead, behind := parseBranchTracking(tt.input)
+			ahead, behind := parseTrack(tt.input)
 			if ahead != tt.ahead {
 				t.Errorf("ahead: expected %d, got %d", tt.ahead, ahead)
 			}
@@ -253,34 +253,11 @@ func TestParseBranchTrackingInfo(t *testing.T) {
 	}
 }
 
-func parseBranchTracking(s string) (ahead, behind int) {
-	if s == "" || s == "[gone]" {
-		return 0, 0
-	}
-
-	trackRe := regexp.MustCompile(`\[ahead (\d+)(?:, behind (\d+))?\]|\[behind (\d+)\]`)
-	matches := trackRe.FindStringSubmatch(s)
-	if matches == nil {
-		return 0, 0
-	}
-
-	if matches[1] != "" {
-		ahead, _ = strconv.Atoi(matches[1])
-	}
-	if matches[2] != "" {
-		behind, _ = strconv.Atoi(matches[2])
-	}
-	if matches[3] != "" {
-		behind, _ = strconv.Atoi(matches[3])
-	}
-	return
-}
-
 func TestParseWorktreePorcelain(t *testing.T) {
 	tests := []struct {
 		name     string
 		input    string
-		expected []worktreeResult
+		expected []models.WorktreeInfo
 	}{
 		{
 			name:     "empty output",
@@ -292,7 +269,7 @@ func TestParseWorktreePorcelain(t *testing.T) {
 			input: `worktree /path/to/repo
 branch refs/heads/main
 `,
-			expected: []worktreeResult{
+			expected: []models.WorktreeInfo{
 				{Path: "/path/to/repo", Branch: "main"},
 			},
 		},
@@ -301,7 +278,7 @@ branch refs/heads/main
 			input: `worktree /path/to/repo.git
 bare
 `,
-			expected: []worktreeResult{
+			expected: []models.WorktreeInfo{
 				{Path: "/path/to/repo.git", IsBare: true},
 			},
 		},
@@ -311,10 +288,21 @@ bare
 branch refs/heads/feature
 locked
 `,
-			expected: []worktreeResult{
+			expected: []models.WorktreeInfo{
 				{Path: "/path/to/repo", Branch: "feature", IsLocked: true},
 			},
 		},
+		{
+			name: "detached worktree locked with reason",
+			input: `worktree /path/to/repo
+HEAD 1234567890abcdef
+detached
+locked on removable drive
+`,
+			expected: []models.WorktreeInfo{
+				{Path: "/path/to/repo", Branch: "(1234567)", IsLocked: true},
+			},
+		},
 		{
 			name: "multiple worktrees",
 			input: `worktree /main
@@ -323,7 +311,7 @@ branch refs/heads/main
 worktree /feature
 branch refs/heads/feature
 `,
-			expected: []worktreeResult{
+			expected: []models.WorktreeInfo{
 				{Path: "/main", Branch: "main"},
 				{Path: "/feature", Branch: "feature"},
 			},
@@ -332,7 +320,7 @@ branch refs/heads/feature
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result := parseWorktreePorcelain(tt.input)
+			result := parseWorktrees(tt.input)
 			if len(result) != len(tt.expected) {
 				t.Errorf("expected %d worktrees, got %d", len(tt.expected), len(result))
 				return
@@ -346,47 +334,6 @@ branch refs/heads/feature
 	}
 }
 
-type worktreeResult struct {
-	Path     string
-	Branch   string
-	IsBare   bool
-	IsLocked bool
-}
-
-func parseWorktreePorcelain(out string) []worktreeResult {
-	if out == "" {
-		return nil
-	}
-
-	var worktrees []worktreeResult
-	var current worktreeResult
-
-	scanner := bufio.NewScanner(strings.NewReader(out))
-	for scanner.Scan() {
-		line := scanner.Text()
-		switch {
-		case strings.HasPrefix(line, "worktree "):
-			if current.Path != "" {
-				worktrees = append(worktrees, current)
-			}
-			current = worktreeResult{Path: strings.TrimPrefix(line, "worktree ")}
-		case strings.HasPrefix(line, "branch "):
-			ref := strings.TrimPrefix(line, "branch ")
-			current.Branch = strings.TrimPrefix(ref, "refs/heads/")
-		case line == "bare":
-			current.IsBare = true
-		case line == "locked":
-			current.IsLocked = true
-		}
-	}
-
-	if current.Path != "" {
-		worktrees = append(worktrees, current)
-	}
-
-	return worktrees
-}
-
 func TestParseStashList(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -482,3 +429,128 @@ func parseRevListOutput(out string) (ahead, behind int) {
 	behind, _ = strconv.Atoi(parts[1])
 	return
 }
+
+func TestParseStatusV2(t *testing.T) {
+	out := strings.Join([]string{
+		"# branch.oid 1234567890abcdef",
+		"# branch.head main",
+		"# branch.upstream origin/main",
+		"# branch.ab +2 -3",
+		"1 M. N... 100644 100644 100644 abc abc staged.go",
+		"1 .M N... 100644 100644 100644 abc abc unstaged.go",
+		"1 MM N... 100644 100644 100644 abc abc both.go",
+		"2 R. N... 100644 100644 100644 abc abc R100 new.go",
+		"old.go",
+		"u UU N... 100644 100644 100644 100644 abc abc abc conflict.go",
+		"? untracked.go",
+		"",
+	}, "\x00")
+
+	got := parseStatusV2([]byte(out))
+	want := statusV2{
+		oid:        "1234567890abcdef",
+		head:       "main",
+		upstream:   "origin/main",
+		ahead:      2,
+		behind:     3,
+		staged:     3,
+		unstaged:   2,
+		untracked:  1,
+		conflicted: 1,
+	}
+	if got != want {
+		t.Errorf("parseStatusV2() = %+v, want %+v", got, want)
+	}
+	if got.branchLabel() != "main" {
+		t.Errorf("branchLabel() = %q, want main", got.branchLabel())
+	}
+
+	detached := parseStatusV2([]byte("# branch.oid 1234567890abcdef\x00# branch.head (detached)\x00"))
+	if !detached.detached() || got.detached() {
+		t.Error("expected only the second status to be detached")
+	}
+	if detached.branchLabel() != "(1234567)" {
+		t.Errorf("detached branchLabel() = %q, want (1234567)", detached.branchLabel())
+	}
+}
+
+func TestParseStashListRecords(t *testing.T) {
+	out := "stash@{0}\tWIP on main: abc fix\t1700000000\x00stash@{1}\tOn feature: tabs\tkept\t1690000000\x00"
+
+	stashes := parseStashList(out)
+	if len(stashes) != 2 {
+		t.Fatalf("expected 2 stashes, got %d", len(stashes))
+	}
+	if stashes[1].Index != 1 || stashes[1].Message != "On feature: tabs\tkept" || stashes[1].Date.Unix() != 1690000000 {
+		t.Errorf("unexpected second stash %+v", stashes[1])
+	}
+	if parseStashList("") != nil {
+		t.Error("expected no stashes for empty output")
+	}
+}
+
+func TestParseCommitLog(t *testing.T) {
+	out := "aaa111\x1faaa\x1fFix | pipes\tand tabs\x1fAda\x1f1700000000\x00bbb222\x1fbbb\x1fInitial\x1fBob\x1f1690000000"
+
+	commits := parseCommitLog(out)
+	if len(commits) != 2 {
+		t.Fatalf("expected 2 commits, got %d", len(commits))
+	}
+	if commits[0].Subject != "Fix | pipes\tand tabs" || commits[0].Author != "Ada" || commits[0].Date.Unix() != 1700000000 {
+		t.Errorf("unexpected first commit %+v", commits[0])
+	}
+	if commits[1].Hash != "bbb222" || commits[1].ShortHash != "bbb" {
+		t.Errorf("unexpected second commit %+v", commits[1])
+	}
+}
+
+func TestParseBranchList(t *testing.T) {
+	out := "main\torigin/main\t[ahead 1, behind 2]\t1700000000\t*\nfeature\t\t\t1690000000\t\nbroken line"
+
+	branches := parseBranchList(out)
+	if len(branches) != 2 {
+		t.Fatalf("expected 2 branches, got %d", len(branches))
+	}
+	if b := branches[0]; b.Name != "main" || b.Upstream != "origin/main" || b.Ahead != 1 || b.Behind != 2 || !b.IsCurrent {
+		t.Errorf("unexpected current branch %+v", b)
+	}
+	if b := branches[1]; b.Name != "feature" || b.Upstream != "" || b.IsCurrent || b.LastCommit.Unix() != 1690000000 {
+		t.Errorf("unexpected feature branch %+v", b)
+	}
+}
+
+func TestPickMainBranch(t *testing.T) {
+	tests := []struct {
+		heads    string
+		expected string
+		ok       bool
+	}{
+		{heads: "main\nmaster", expected: "main", ok: true},
+		{heads: "master", expected: "master", ok: true},
+		{heads: "", expected: "", ok: false},
+	}
+
+	for _, tt := range tests {
+		got, ok := pickMainBranch(tt.heads)
+		if got != tt.expected || ok != tt.ok {
+			t.Errorf("pickMainBranch(%q) = %q, %v; expected %q, %v", tt.heads, got, ok, tt.expected, tt.ok)
+		}
+	}
+}
+
+func TestMissingBranches(t *testing.T) {
+	deleted := missingBranches([]string{"feature", "in-worktree", "fix"}, "main\nin-worktree")
+	if strings.Join(deleted, ",") != "feature,fix" {
+		t.Errorf("expected feature and fix deleted, got %v", deleted)
+	}
+}
+
+func TestMergedBranches(t *testing.T) {
+	merged := mergedBranches("feature\nmain\nfix/typo\nmaster", "main")
+	if strings.Join(merged, ",") != "feature,fix/typo" {
+		t.Errorf("expected feature and fix/typo, got %v", merged)
+	}
+	if mergedBranches("", "main") != nil {
+		t.Error("expected no branches for empty output")
+	}
+}
@@ -0,0 +1,92 @@
+package vcs
+
+import (
+	"bytes"
+	"errors"
+	"io/fs"
+	"os"
+	"path/filepath"
+	"strings"
+)
+
+// A few read-only facts are plain files under .git, so reading them directly
+// saves forking git. Anything unexpected returns an error and callers fall
+// back to running git.
+
+// gitDirs returns the repo's own git directory, which holds HEAD, and the
+// common directory shared by all of its worktrees, which holds refs and logs.
+func gitDirs(repoPath string) (gitDir, commonDir string, err error) {
+	dotGit := filepath.Join(repoPath, ".git")
+	info, err := os.Stat(dotGit)
+	if err != nil {
+		return "", "", err
+	}
+	if info.IsDir() {
+		return dotGit, dotGit, nil
+	}
+
+	// Worktrees and submodules have a .git file pointing at the real
+	// directory, which may in turn name a shared common directory.
+	data, err := os.ReadFile(dotGit)
+	if err != nil {
+		return "", "", err
+	}
+	target, ok := strings.CutPrefix(strings.TrimSpace(string(data)), "gitdir: ")
+	if !ok {
+		return "", "", errors.New("unrecognised .git file")
+	}
+	if !filepath.IsAbs(target) {
+		target = filepath.Join(repoPath, target)
+	}
+
+	commonDir = target
+	if data, err := os.ReadFile(filepath.Join(target, "commondir")); err == nil {
+		commonDir = strings.TrimSpace(string(data))
+		if !filepath.IsAbs(commonDir) {
+			commonDir = filepath.Join(target, commonDir)
+		}
+	}
+	return target, commonDir, nil
+}
+
+// readCurrentBranch reads HEAD the way GetCurrentBranch reports it: the branch
+// name, or a short hash in parentheses when detached.
+func readCurrentBranch(repoPath string) (string, error) {
+	gitDir, _, err := gitDirs(repoPath)
+	if err != nil {
+		return "", err
+	}
+	data, err := os.ReadFile(filepath.Join(gitDir, "HEAD"))
+	if err != nil {
+		return "", err
+	}
+
+	head := strings.TrimSpace(string(data))
+	if ref, ok := strings.CutPrefix(head, "ref: "); ok {
+		if branch, ok := strings.CutPrefix(ref, "refs/heads/"); ok {
+			return branch, nil
+		}
+		return "", errors.New("HEAD points outside refs/heads")
+	}
+	if len(head) < 7 {
+		return "", errors.New("unrecognised HEAD")
+	}
+	return detachedLabel(head), nil
+}
+
+// readStashCount counts entries in the stash reflog, which is exactly what
+// `git stash list` prints.
+func readStashCount(repoPath string) (int, error) {
+	_, commonDir, err := gitDirs(repoPath)
+	if err != nil {
+		return 0, err
+	}
+	data, err := os.ReadFile(filepath.Join(commonDir, "logs", "refs", "stash"))
+	if errors.Is(err, fs.ErrNotExist) {
+		return 0, nil
+	}
+	if err != nil {
+		return 0, err
+	}
+	return bytes.Count(data, []byte{'\n'}), nil
+}
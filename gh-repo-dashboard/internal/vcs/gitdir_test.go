@@ -0,0 +1,71 @@
+package vcs
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+func writeFile(t *testing.T, path string, content string) {
+	t.Helper()
+	if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+		t.Fatal(err)
+	}
+}
+
+func TestReadCurrentBranch(t *testing.T) {
+	tests := []struct {
+		name     string
+		head     string
+		expected string
+		wantErr  bool
+	}{
+		{"branch", "ref: refs/heads/feature/x\n", "feature/x", false},
+		{"detached", "1234567890abcdef1234567890abcdef12345678\n", "(1234567)", false},
+		{"unexpected ref", "ref: refs/remotes/origin/main\n", "", true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			repo := t.TempDir()
+			writeFile(t, filepath.Join(repo, ".git", "HEAD"), tt.head)
+
+			branch, err := readCurrentBranch(repo)
+			if (err != nil) != tt.wantErr {
+				t.Fatalf("unexpected error %v", err)
+			}
+			if branch != tt.expected {
+				t.Errorf("expected %q, got %q", tt.expected, branch)
+			}
+		})
+	}
+}
+
+func TestReadStashCountFromWorktree(t *testing.T) {
+	main := t.TempDir()
+	writeFile(t, filepath.Join(main, ".git", "HEAD"), "ref: refs/heads/main\n")
+	writeFile(t, filepath.Join(main, ".git", "logs", "refs", "stash"), "a b c\nd e f\n")
+
+	// A linked worktree has its own HEAD but shares refs and logs.
+	wtGitDir := filepath.Join(main, ".git", "worktrees", "wt")
+	writeFile(t, filepath.Join(wtGitDir, "HEAD"), "ref: refs/heads/topic\n")
+	writeFile(t, filepath.Join(wtGitDir, "commondir"), "../..\n")
+	worktree := t.TempDir()
+	writeFile(t, filepath.Join(worktree, ".git"), "gitdir: "+wtGitDir+"\n")
+
+	if count, err := readStashCount(worktree); err != nil || count != 2 {
+		t.Errorf("expected 2 stashes, got %d (%v)", count, err)
+	}
+	if branch, err := readCurrentBranch(worktree); err != nil || branch != "topic" {
+		t.Errorf("expected worktree branch topic, got %q (%v)", branch, err)
+	}
+
+	empty := t.TempDir()
+	writeFile(t, filepath.Join(empty, ".git", "HEAD"), "ref: refs/heads/main\n")
+	if count, err := readStashCount(empty); err != nil || count != 0 {
+		t.Errorf("expected no stashes, got %d (%v)", count, err)
+	}
+}
@@ -13,6 +13,8 @@ import (
 	"github.com/kyleking/gh-repo-dashboard/internal/models"
 )
 
+var workspaceRe = regexp.MustCompile(`^(\S+)@(\S+):\s+(\S+)`)
+
 type JJOperations struct{}
 
 func NewJJOperations() *JJOperations {
@@ -24,8 +26,14 @@ func (j *JJOperations) VCSType() models.VCSType {
 }
 
 func (j *JJOperations) runJJ(ctx context.Context, repoPath string, args ...string) (string, error) {
+	release, err := acquireProcess(ctx)
+	if err != nil {
+		return "", err
+	}
+	defer release()
+
 	fullArgs := append([]string{"-R", repoPath}, args...)
-	cmd := exec.CommandContext(ctx, "jj", fullArgs...)
+	cmd := exec.CommandContext(ctx, Binary("jj"), fullArgs...)
 	out, err := cmd.Output()
 	if err != nil {
 		if exitErr, ok := err.(*exec.ExitError); ok {
@@ -170,12 +178,20 @@ func (j *JJOperations) GetConflictedCount(ctx context.Context, repoPath string)
 }
 
 func (j *JJOperations) GetBranchList(ctx context.Context, repoPath string) ([]models.BranchInfo, error) {
+	// jj has no current-bookmark marker in `bookmark list`, so look it up
+	// alongside the listing instead of after it.
+	current := make(chan string, 1)
+	go func() {
+		bookmark, _ := j.GetCurrentBranch(ctx, repoPath)
+		current <- bookmark
+	}()
+
 	out, err := j.runJJ(ctx, repoPath, "bookmark", "list")
 	if err != nil {
 		return nil, err
 	}
 
-	currentBookmark, _ := j.GetCurrentBranch(ctx, repoPath)
+	currentBookmark := <-current
 
 	var branches []models.BranchInfo
 	for _, line := range strings.Split(out, "\n") {
@@ -221,8 +237,6 @@ func (j *JJOperations) GetWorktreeList(ctx context.Context, repoPath string) ([]
 		return nil, err
 	}
 
-	workspaceRe := regexp.MustCompile(`^(\S+)@(\S+):\s+(\S+)`)
-
 	var worktrees []models.WorktreeInfo
 	scanner := bufio.NewScanner(strings.NewReader(out))
 	for scanner.Scan() {
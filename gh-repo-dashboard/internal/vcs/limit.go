@@ -0,0 +1,28 @@
+package vcs
+
+import (
+	"context"
+	"runtime"
+)
+
+// DefaultMaxProcesses bounds concurrent git and jj subprocesses across every
+// caller, so fanning out over many repos cannot fork without limit.
+var DefaultMaxProcesses = 2 * runtime.NumCPU()
+
+var processSlots = make(chan struct{}, DefaultMaxProcesses)
+
+// SetMaxProcesses replaces the subprocess limit. It must be called before any
+// VCS operation runs.
+func SetMaxProcesses(n int) {
+	processSlots = make(chan struct{}, max(n, 1))
+}
+
+func acquireProcess(ctx context.Context) (release func(), err error) {
+	slots := processSlots
+	select {
+	case slots <- struct{}{}:
+		return func() { <-slots }, nil
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+}
@@ -0,0 +1,29 @@
+package vcs
+
+import (
+	"context"
+	"testing"
+)
+
+func TestAcquireProcessRespectsLimit(t *testing.T) {
+	defer SetMaxProcesses(DefaultMaxProcesses)
+	SetMaxProcesses(1)
+
+	release, err := acquireProcess(context.Background())
+	if err != nil {
+		t.Fatalf("first acquire failed: %v", err)
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	if _, err := acquireProcess(ctx); err == nil {
+		t.Error("expected acquire to wait for a free slot and give up on cancellation")
+	}
+
+	release()
+	release, err = acquireProcess(context.Background())
+	if err != nil {
+		t.Fatalf("acquire after release failed: %v", err)
+	}
+	release()
+}
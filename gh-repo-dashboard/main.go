@@ -8,6 +8,8 @@ import (
 
 	tea "github.com/charmbracelet/bubbletea"
 	"github.com/kyleking/gh-repo-dashboard/internal/app"
+	"github.com/kyleking/gh-repo-dashboard/internal/cache"
+	"github.com/kyleking/gh-repo-dashboard/internal/vcs"
 )
 
 func findGitRoot(startPath string) (string, bool) {
@@ -34,8 +36,13 @@ func findGitRoot(startPath string) (string, bool) {
 
 func main() {
 	depth := flag.Int("depth", 1, "Maximum directory depth to scan")
+	jobs := flag.Int("jobs", app.DefaultSummaryConcurrency, "Maximum repositories to load concurrently")
+	ghJobs := flag.Int("gh-jobs", app.DefaultPRConcurrency, "Maximum concurrent GitHub requests")
+	procs := flag.Int("procs", vcs.DefaultMaxProcesses, "Maximum concurrent git/jj subprocesses")
 	flag.Parse()
 
+	vcs.SetMaxProcesses(*procs)
+
 	scanPaths := flag.Args()
 	if len(scanPaths) == 0 {
 		cwd, err := os.Getwd()
@@ -61,11 +68,22 @@ func main() {
 		absPathList = append(absPathList, absPath)
 	}
 
-	model := app.New(absPathList, *depth)
+	cacheDir, cacheErr := cache.DefaultDir()
+	if cacheErr == nil {
+		_ = cache.LoadFromDir(cacheDir)
+	}
+
+	model := app.New(absPathList, *depth).WithConcurrency(*jobs, *ghJobs)
 	p := tea.NewProgram(model, tea.WithAltScreen())
 
 	if _, err := p.Run(); err != nil {
 		fmt.Fprintf(os.Stderr, "Error running program: %v\n", err)
 		os.Exit(1)
 	}
+
+	if cacheErr == nil {
+		if err := cache.SaveToDir(cacheDir); err != nil {
+			fmt.Fprintf(os.Stderr, "Warning: could not save cache: %v\n", err)
+		}
+	}
 }